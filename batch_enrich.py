@@ -0,0 +1,71 @@
+"""
+Imbogatirea in lot a orarelor, fara interfata grafica.
+
+    python batch_enrich.py orare/ --output rezultate/
+    python batch_enrich.py "orare/**/*.csv" --format json --workers 8 --cities orase.json
+
+--cities: fisier JSON {nume fisier (cu sau fara extensie): localitate}; fisierele
+nementionate folosesc --city (implicit location_name din resources/settings.json).
+"""
+import argparse
+import json
+import os
+import sys
+
+from core.batch_enrichment import OUTPUT_FORMATS, find_schedule_files, load_settings, run_batch
+
+
+def city_chooser(default_city: str, cities_path: str = None):
+    cities = {}
+    if cities_path:
+        with open(cities_path, "r", encoding="utf-8") as f:
+            cities = json.load(f)
+
+    def city_for(file_path: str) -> str:
+        name = os.path.basename(file_path)
+        return cities.get(name) or cities.get(os.path.splitext(name)[0]) or default_city
+
+    return city_for
+
+
+def print_result(result):
+    if result["status"] == "success":
+        line = f"OK    {result['file']} -> {result['output']} ({result['entries']} intrari, {result['city']})"
+    else:
+        line = f"EROARE {result['file']}: {result['message']}"
+    if result["errors"]:
+        line += f" [{len(result['errors'])} randuri invalide]"
+    print(line, flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python batch_enrich.py",
+                                     description="Imbogateste mai multe orare cu prognoza meteo")
+    parser.add_argument("inputs", nargs="+", help="directoare, tipare glob sau fisiere .json / .csv")
+    parser.add_argument("--output", "-o", default="rezultate", help="directorul rezultatelor")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="formatul rezultatelor")
+    parser.add_argument("--workers", type=int, help="numarul de procese (implicit numarul de nuclee)")
+    parser.add_argument("--city", help="localitatea implicita (implicit cea din setari)")
+    parser.add_argument("--cities", help="fisier JSON {fisier: localitate}")
+    parser.add_argument("--settings", default="resources/settings.json", help="fisierul de setari")
+    args = parser.parse_args(argv)
+
+    files = find_schedule_files(args.inputs)
+    if not files:
+        print("Niciun fisier .json / .csv gasit")
+        return 1
+
+    settings = load_settings(args.settings)
+    city_for = city_chooser(args.city or settings.get("location_name", "Bucuresti"), args.cities)
+    summary = run_batch(files, args.output, args.format, city_for, settings, args.workers, print_result)
+
+    print()
+    print(f"{summary['succeeded']}/{summary['files']} fisiere, {summary['entries']} intrari, "
+          f"{summary['cities']} localitati, {summary['workers']} procese")
+    print(f"Prognoze: {summary['fetch_seconds']:.2f} s, imbogatire: {summary['enrich_seconds']:.2f} s "
+          f"({summary['files_per_second']:.1f} fisiere/s), total: {summary['total_seconds']:.2f} s")
+    return 0 if summary["succeeded"] == summary["files"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
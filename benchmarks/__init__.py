@@ -0,0 +1,7 @@
+"""
+Benchmark-uri pentru prelucrarile din core (prognoza, orar, imbinare, statistici).
+
+    python -m benchmarks run [--quick] [--filter merge] [--save benchmarks/baselines/local.json]
+    python -m benchmarks run --compare benchmarks/baselines/local.json [--threshold 0.15]
+    python -m benchmarks compare vechi.json nou.json [--threshold 0.15]
+"""
@@ -0,0 +1,101 @@
+import argparse
+import json
+import sys
+
+from benchmarks.cases import all_cases, memory_cases
+from benchmarks.harness import (compare_results, environment, load_results, measure, measure_memory,
+                                print_comparison, print_results, save_results)
+from benchmarks.startup import measure_startup, print_startup
+
+
+def run(args) -> int:
+    cases = [case for case in all_cases(quick=args.quick) if not args.filter or args.filter in case.name]
+    if not cases:
+        print(f"Niciun caz nu contine '{args.filter}'")
+        return 1
+
+    results = {}
+    for i, case in enumerate(cases, start=1):
+        print(f"[{i}/{len(cases)}] {case.name}", end="", flush=True)
+        results[case.name] = measure(case.setup(), repeat=args.repeat)
+        print(f"  {results[case.name]['min_ms']:.3f} ms")
+
+    print()
+    print_results(results)
+
+    if args.save:
+        save_results(results, args.save, {"quick": args.quick, "filter": args.filter, "repeat": args.repeat})
+        print(f"\nRezultate salvate in {args.save}")
+
+    if args.compare:
+        rows = compare_results(load_results(args.compare), results, args.threshold)
+        print()
+        print_comparison(rows, args.threshold)
+        return 1 if any(row["regression"] for row in rows) else 0
+
+    return 0
+
+
+def memory(args) -> int:
+    """Octetii pe intrare ocupati de rezultat (si varful in timpul constructiei)"""
+    cases = memory_cases(args.entries)
+    width = max(len(case.name) for case in cases)
+    for case in cases:
+        result = measure_memory(case.setup())
+        print(f"{case.name:<{width}}  {result['bytes'] / args.entries:8.1f} B/intrare"
+              f"  (varf {result['peak_bytes'] / args.entries:.1f} B/intrare)")
+    return 0
+
+
+def startup(args) -> int:
+    """Pornirea la rece: timpul pana la primul cadru si importurile fiecarui modul"""
+    result = measure_startup(args.runs)
+    print_startup(result, args.top)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(dict(result, environment=environment()), f, ensure_ascii=False, indent=2)
+        print(f"\nRezultate salvate in {args.save}")
+    return 0
+
+
+def compare(args) -> int:
+    rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+    print_comparison(rows, args.threshold)
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark-uri WeatherScheduler")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="ruleaza benchmark-urile")
+    run_parser.add_argument("--quick", action="store_true", help="pana la 10k intrari in loc de 100k")
+    run_parser.add_argument("--filter", help="doar cazurile care contin acest text")
+    run_parser.add_argument("--repeat", type=int, default=5, help="numarul de masuratori pe caz")
+    run_parser.add_argument("--save", help="salveaza rezultatele (JSON) ca baseline")
+    run_parser.add_argument("--compare", help="compara cu un baseline salvat")
+    run_parser.add_argument("--threshold", type=float, default=0.15, help="prag de regresie (0.15 = 15%%)")
+    run_parser.set_defaults(handler=run)
+
+    memory_parser = commands.add_parser("memory", help="memoria ocupata de orar si de intrarile imbinate")
+    memory_parser.add_argument("--entries", type=int, default=10_000, help="numarul de intrari din orar")
+    memory_parser.set_defaults(handler=memory)
+
+    startup_parser = commands.add_parser("startup", help="timpul de pornire si importurile fiecarui modul")
+    startup_parser.add_argument("--runs", type=int, default=3, help="numarul de porniri masurate")
+    startup_parser.add_argument("--top", type=int, default=15, help="cate module sunt afisate")
+    startup_parser.add_argument("--save", help="salveaza rezultatul (JSON)")
+    startup_parser.set_defaults(handler=startup)
+
+    compare_parser = commands.add_parser("compare", help="compara doua fisiere de rezultate")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
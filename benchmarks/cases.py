@@ -0,0 +1,232 @@
+"""
+Cazurile de benchmark si dimensiunile parcurse.
+
+Fiecare caz are un nume de forma "functie[param=valoare,...]" si o functie `setup`
+care pregateste datele (nemasurat) si intoarce apelul masurat.
+"""
+import csv
+import os
+import tempfile
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple
+
+import numpy as np
+
+from PyQt6.QtCore import QCoreApplication
+
+from benchmarks import generators
+from core.data_processor import DataProcessor
+from core.enrichment_cache import EnrichmentCache
+from core.schedule_manager import ScheduleManager
+from core.transport import ReplayTransport
+from core.weather_service import WeatherService
+
+ENTRY_COUNTS = (10, 100, 1_000, 10_000, 100_000)
+QUICK_ENTRY_COUNTS = (10, 100, 1_000, 10_000)
+HORIZON_HOURS = (24, 96, 384)
+RESOLUTIONS = (60, 15)
+
+DEFAULT_HOURS = 168
+DEFAULT_ENTRIES = 1_000
+
+
+_app = None
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], object]]
+
+
+@lru_cache(maxsize=None)
+def _service() -> WeatherService:
+    """Serviciul folosit doar pentru prelucrari; transportul de redare nu acceseaza reteaua"""
+    global _app
+    if QCoreApplication.instance() is None:
+        _app = QCoreApplication([])
+    return WeatherService(transport=ReplayTransport(tempfile.gettempdir()))
+
+
+@lru_cache(maxsize=None)
+def _entries(count: int) -> List[Dict]:
+    return generators.schedule_entries(count)
+
+
+@lru_cache(maxsize=None)
+def _raw_forecast(hours: int, step: int) -> Dict:
+    return generators.open_meteo_response(hours, step)
+
+
+@lru_cache(maxsize=None)
+def _forecast(hours: int, step: int) -> Dict:
+    return _service().process_weather_data(_raw_forecast(hours, step))
+
+
+@lru_cache(maxsize=None)
+def _merged(count: int, hours: int, step: int) -> List[Dict]:
+    return DataProcessor().merge_schedule_with_weather(_entries(count), _forecast(hours, step))
+
+
+@lru_cache(maxsize=None)
+def _schedule_file(count: int, extension: str) -> str:
+    file_path = os.path.join(tempfile.gettempdir(), f"weatherscheduler_bench_{count}.{extension}")
+    if extension == "json":
+        generators.write_schedule_json(_entries(count), file_path)
+    else:
+        generators.write_schedule_csv(_entries(count), file_path)
+    return file_path
+
+
+def _name(function: str, **params) -> str:
+    return f"{function}[{','.join(f'{key}={value}' for key, value in params.items())}]"
+
+
+def _process_weather_data(hours, step):
+    def setup():
+        service, raw = _service(), _raw_forecast(hours, step)
+        return lambda: service.process_weather_data(raw)
+    return Case(_name("process_weather_data", hours=hours, step=step), setup)
+
+
+def _merge(count, hours, step):
+    def setup():
+        processor, entries, forecast = DataProcessor(), _entries(count), _forecast(hours, step)
+        return lambda: processor.merge_schedule_with_weather(entries, forecast)
+    return Case(_name("merge_schedule_with_weather", entries=count, hours=hours, step=step), setup)
+
+
+def _enrich(count, forecast_changes):
+    """
+    EnrichmentCache.enrich pe un orar deja imbinat: fara modificari (doar verificarea cheii)
+    sau alternand intre doua prognoze care difera printr-o singura ora (actualizare partiala)
+    """
+    def setup():
+        cache, entries, forecast = EnrichmentCache(DataProcessor()), _entries(count), _forecast(DEFAULT_HOURS, 60)
+        changed = dict(forecast, hourly=forecast["hourly"][:])
+        changed["hourly"].temperature = forecast["hourly"].temperature + np.where(
+            np.arange(len(forecast["hourly"])) == 32, 1.0, 0.0).astype(np.float32)
+        forecasts = [forecast, changed] if forecast_changes else [forecast]
+        cache.enrich(entries, forecast)
+
+        def run():
+            forecasts.append(forecasts.pop(0))
+            return cache.enrich(entries, forecasts[0])
+        return run
+    kind = "forecast_changed" if forecast_changes else "unchanged"
+    return Case(_name("EnrichmentCache.enrich", entries=count, kind=kind), setup)
+
+
+def _rain_risk(count, hours, step):
+    def setup():
+        service, entries = _service(), _entries(count)
+        forecast = _forecast(hours, step)
+
+        def run():
+            service.cached_weather = forecast
+            return service.check_rain_risk_for_tomorrow(entries)
+        return run
+    return Case(_name("check_rain_risk_for_tomorrow", entries=count, hours=hours, step=step), setup)
+
+
+def _statistics(count):
+    def setup():
+        processor, merged = DataProcessor(), _merged(count, DEFAULT_HOURS, 60)
+        return lambda: processor.calculate_statistics(merged)
+    return Case(_name("calculate_statistics", entries=count), setup)
+
+
+def _format_table(count):
+    def setup():
+        processor = DataProcessor()
+        weather = [entry["weather"] for entry in _merged(count, DEFAULT_HOURS, 60) if entry.get("weather")]
+        return lambda: [processor.format_weather_for_table(w) for w in weather]
+    return Case(_name("format_weather_for_table", entries=count), setup)
+
+
+def _load(count, extension):
+    def setup():
+        manager, file_path = ScheduleManager(), _schedule_file(count, extension)
+        load = manager.load_from_json if extension == "json" else manager.load_from_csv
+        return lambda: load(file_path)
+    return Case(_name(f"load_from_{extension}", entries=count), setup)
+
+
+def _validate(count):
+    def setup():
+        manager, entries = ScheduleManager(), _entries(count)
+        return lambda: [manager._validate_entry(entry) for entry in entries]
+    return Case(_name("_validate_entry", entries=count), setup)
+
+
+def _overlapping(count):
+    def setup():
+        manager = ScheduleManager()
+        manager.schedule = [manager._validate_entry(entry) for entry in _entries(count)]
+        manager.get_entries_at("Luni", "09:00")  # augmentarea zilei se construieste la prima interogare
+        return lambda: manager.get_entries_overlapping("Luni", "09:00", "11:00")
+    return Case(_name("get_entries_overlapping", entries=count), setup)
+
+
+def _dict_schedule(file_path: str) -> List[Dict]:
+    """Orarul ca dictionare, cum il construia incarcarea inainte de ScheduleEntry"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return [{"day": row["day"].strip(), "time": row["time"].strip(),
+                 "subject": row["subject"].strip(), "location": row["location"].strip()}
+                for row in csv.DictReader(f)]
+
+
+def memory_cases(count: int) -> List[Case]:
+    """
+    Memoria ocupata de orar si de intrarile imbinate: formatul dictionar de dinainte
+    (un dict cu siruri proprii pe rand, copiat la imbinare) fata de ScheduleEntry / EnrichedEntry
+    """
+    def schedule(compact):
+        def setup():
+            file_path = _schedule_file(count, "csv")
+            if compact:
+                return lambda: ScheduleManager().load_from_csv(file_path)["schedule"]
+            return lambda: _dict_schedule(file_path)
+        return Case(_name("schedule", format="ScheduleEntry" if compact else "dict", entries=count), setup)
+
+    def enriched(compact):
+        def setup():
+            processor, forecast = DataProcessor(), _forecast(DEFAULT_HOURS, 60)
+            manager = ScheduleManager()
+            manager.load_from_csv(_schedule_file(count, "csv"))
+            entries = manager.schedule if compact else [entry.to_dict() for entry in manager.schedule]
+            merge = processor.merge_schedule_with_weather
+            if compact:
+                return lambda: merge(entries, forecast)
+            return lambda: [dict(entry) for entry in merge(entries, forecast)]
+        return Case(_name("merge_schedule_with_weather", format="EnrichedEntry" if compact else "dict",
+                          entries=count), setup)
+
+    return [schedule(False), schedule(True), enriched(False), enriched(True)]
+
+
+def all_cases(quick: bool = False) -> List[Case]:
+    """
+    Toate cazurile: cele dependente de orar parcurg 10 - 100k intrari (cu prognoza
+    de 7 zile, orara), cele dependente de prognoza parcurg 24 h - 16 zile la rezolutie
+    orara si de 15 minute (cu 1000 de intrari). `quick` se opreste la 10k intrari.
+    """
+    counts = QUICK_ENTRY_COUNTS if quick else ENTRY_COUNTS
+    forecasts = [(hours, step) for step in RESOLUTIONS for hours in HORIZON_HOURS]
+
+    cases = [_process_weather_data(hours, step) for hours, step in forecasts]
+    cases += [_merge(count, DEFAULT_HOURS, 60) for count in counts]
+    cases += [_merge(DEFAULT_ENTRIES, hours, step) for hours, step in forecasts]
+    cases += [_enrich(count, changes) for changes in (False, True) for count in counts]
+    cases += [_rain_risk(count, DEFAULT_HOURS, 60) for count in counts]
+    cases += [_rain_risk(DEFAULT_ENTRIES, hours, step) for hours, step in forecasts]
+    cases += [_statistics(count) for count in counts]
+    cases += [_format_table(count) for count in counts]
+    cases += [_load(count, "json") for count in counts]
+    cases += [_load(count, "csv") for count in counts]
+    cases += [_validate(count) for count in counts]
+    cases += [_overlapping(count) for count in counts]
+
+    unique = {}
+    for case in cases:
+        unique.setdefault(case.name, case)
+    return list(unique.values())
@@ -0,0 +1,93 @@
+"""Generatoare de date sintetice (orare si raspunsuri Open-Meteo) pentru benchmark-uri"""
+import csv
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+DAYS = ["Luni", "Marți", "Miercuri", "Joi", "Vineri", "Sâmbătă", "Duminică"]
+
+SUBJECTS = [
+    "Programare orientata pe obiecte",
+    "Baze de date",
+    "Algoritmi si structuri de date",
+    "Retele de calculatoare",
+    "Sisteme de operare",
+    "Proiectarea cu microprocesoare",
+    "Analiza matematica",
+    "Educatie fizica"
+]
+
+
+def schedule_entries(count: int, seed: int = 0) -> List[Dict]:
+    """`count` intrari de orar valide, cu zile, ore si sali aleatoare (deterministe)"""
+    rng = random.Random(seed)
+    entries = []
+    for _ in range(count):
+        start = rng.randint(7 * 2, 19 * 2) * 30
+        end = start + rng.choice((60, 90, 120, 180))
+        entries.append({
+            "day": rng.choice(DAYS),
+            "time": f"{start // 60:02d}:{start % 60:02d}-{min(end, 1439) // 60:02d}:{min(end, 1439) % 60:02d}",
+            "subject": rng.choice(SUBJECTS),
+            "location": f"C{rng.randint(1, 6)}{rng.randint(0, 1)}{rng.randint(1, 9)}"
+        })
+    return entries
+
+
+def write_schedule_json(entries: List[Dict], file_path: str):
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump({"schedule": entries}, f, ensure_ascii=False)
+
+
+def write_schedule_csv(entries: List[Dict], file_path: str):
+    with open(file_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["day", "time", "subject", "location"])
+        writer.writeheader()
+        writer.writerows(entries)
+
+
+def open_meteo_response(hours: int, step_minutes: int = 60, start: Optional[datetime] = None,
+                        seed: int = 0) -> Dict:
+    """
+    Un raspuns /v1/forecast sintetic care acopera `hours` ore, cu un punct la fiecare
+    `step_minutes` minute (60 = orar, 15 = rezolutia minutely_15), incepand de azi la 00:00.
+    """
+    if start is None:
+        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    rng = np.random.default_rng(seed)
+    count = hours * 60 // step_minutes
+    offsets = np.arange(count) * step_minutes / 60.0
+
+    temperature = np.round(12 + 8 * np.sin(2 * np.pi * (offsets - 9) / 24) + rng.normal(0, 1.5, count), 1)
+    probability = rng.integers(0, 101, count)
+    precipitation = np.where(probability > 60, np.round(rng.random(count) * 3, 1), 0.0)
+    weather_code = np.where(probability > 80, 63, np.where(probability > 60, 61, rng.choice([0, 1, 2, 3], count)))
+    wind_speed = np.round(rng.gamma(3.0, 4.0, count), 1)
+
+    times = [(start + timedelta(minutes=i * step_minutes)).strftime("%Y-%m-%dT%H:%M") for i in range(count)]
+    days = max(1, hours // 24)
+
+    return {
+        "latitude": 44.4268,
+        "longitude": 26.1025,
+        "utc_offset_seconds": 10800,
+        "hourly": {
+            "time": times,
+            "temperature_2m": temperature.tolist(),
+            "precipitation_probability": probability.tolist(),
+            "precipitation": precipitation.tolist(),
+            "weathercode": weather_code.tolist(),
+            "windspeed_10m": wind_speed.tolist()
+        },
+        "daily": {
+            "time": [(start + timedelta(days=d)).strftime("%Y-%m-%d") for d in range(days)],
+            "weathercode": rng.choice([0, 2, 61, 63], days).tolist(),
+            "temperature_2m_max": np.round(rng.normal(20, 3, days), 1).tolist(),
+            "temperature_2m_min": np.round(rng.normal(8, 3, days), 1).tolist(),
+            "precipitation_sum": np.round(rng.random(days) * 5, 1).tolist()
+        }
+    }
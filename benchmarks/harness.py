@@ -0,0 +1,132 @@
+"""Masurarea, salvarea si compararea rezultatelor benchmark-urilor"""
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+TARGET_SECONDS = 0.05
+SLOW_CALL_SECONDS = 1.0
+
+
+def measure(fn: Callable[[], object], repeat: int = 5) -> Dict:
+    """
+    Timpul unui apel (ms), ca la timeit: numarul de apeluri pe masuratoare creste
+    pana cand o masuratoare dureaza cel putin TARGET_SECONDS; se raporteaza minimul
+    si mediana celor `repeat` masuratori. Apelurile foarte lente se repeta de 3 ori.
+    """
+    started = time.perf_counter()
+    fn()
+    first = time.perf_counter() - started
+
+    loops = 1
+    if first < TARGET_SECONDS:
+        loops = max(1, int(TARGET_SECONDS / max(first, 1e-7)))
+    if first > SLOW_CALL_SECONDS:
+        repeat = min(repeat, 3)
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - started) / loops * 1000)
+
+    return {
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "loops": loops,
+        "repeat": repeat
+    }
+
+
+def measure_memory(build: Callable[[], object]) -> Dict:
+    """
+    Memoria (octeti, tracemalloc) alocata de `build` si inca ocupata de rezultatul lui,
+    plus varful atins in timpul constructiei
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"bytes": current, "peak_bytes": peak}
+
+
+def environment() -> Dict:
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.node()
+    }
+
+
+def save_results(results: Dict[str, Dict], file_path: str, options: Optional[Dict] = None):
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "options": options or {}, "results": results},
+                  f, ensure_ascii=False, indent=2)
+
+
+def load_results(file_path: str) -> Dict[str, Dict]:
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare_results(baseline: Dict[str, Dict], current: Dict[str, Dict], threshold: float = 0.15) -> List[Dict]:
+    """
+    Compara timpii minimi ai cazurilor comune.
+    Un caz este regresie daca este mai lent decat baseline-ul cu mai mult de `threshold` (0.15 = 15%).
+    """
+    rows = []
+    for name in (name for name in current if name in baseline):
+        before, after = baseline[name]["min_ms"], current[name]["min_ms"]
+        ratio = after / before if before > 0 else float("inf")
+        rows.append({
+            "name": name,
+            "baseline_ms": before,
+            "current_ms": after,
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+            "improvement": ratio < 1 - threshold
+        })
+    return rows
+
+
+def print_results(results: Dict[str, Dict]):
+    width = max((len(name) for name in results), default=10)
+    for name, result in results.items():
+        print(f"{name:<{width}}  {format_ms(result['min_ms']):>12}  (mediana {format_ms(result['median_ms'])})")
+
+
+def print_comparison(rows: List[Dict], threshold: float):
+    width = max((len(row["name"]) for row in rows), default=10)
+    for row in rows:
+        status = "REGRESIE" if row["regression"] else ("mai rapid" if row["improvement"] else "")
+        print(f"{row['name']:<{width}}  {format_ms(row['baseline_ms']):>12} -> {format_ms(row['current_ms']):>12}"
+              f"  x{row['ratio']:.2f}  {status}")
+
+    regressions = sum(row["regression"] for row in rows)
+    print(f"\n{len(rows)} cazuri comparate, {regressions} regresii (prag {threshold:.0%})")
+
+
+def format_ms(value: float) -> str:
+    if value < 1:
+        return f"{value * 1000:.1f} us"
+    if value < 1000:
+        return f"{value:.2f} ms"
+    return f"{value / 1000:.2f} s"
@@ -0,0 +1,109 @@
+"""
+Pornirea la rece a aplicatiei, masurata intr-un proces Python nou (cu -X importtime):
+- importul ferestrei principale
+- primul cadru desenat (primul eveniment Paint al ferestrei)
+- serviciile pornite (MainWindow.start_services terminat: setari, cache meteo, tray)
+- timpul de import al fiecarui modul, din raportul -X importtime
+
+Fara display, Qt este pornit cu platforma "offscreen".
+"""
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ruleaza in procesul masurat; timpii sunt in ms de la inceputul scriptului
+_SCRIPT = """
+import time
+started = time.perf_counter()
+import json, sys
+from PyQt6.QtCore import QEvent, QObject, QTimer
+from PyQt6.QtWidgets import QApplication
+
+marks = {}
+def mark(name):
+    marks.setdefault(name, (time.perf_counter() - started) * 1000)
+
+app = QApplication(sys.argv)
+mark("qapplication_ms")
+from ui.main_window import MainWindow
+mark("import_ms")
+window = MainWindow()
+mark("construct_ms")
+
+class FirstFrame(QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint and watched.isWidgetType() and watched.window() is window:
+            mark("first_frame_ms")
+        return False
+
+first_frame = FirstFrame()
+app.installEventFilter(first_frame)
+
+def start_services():
+    MainWindow.start_services(window)
+    mark("services_ms")
+    QTimer.singleShot(0, app.quit)
+
+window.start_services = start_services
+window.show()
+QTimer.singleShot(10000, app.quit)
+app.exec()
+print("STARTUP " + json.dumps(marks))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Liniile "import time: propriu | cumulat | modul" (microsecunde) -> ms, cu adancimea importului"""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        modules.append({
+            "module": name.strip(),
+            "self_ms": int(own) / 1000,
+            "cumulative_ms": int(cumulative) / 1000,
+            "depth": depth
+        })
+    return modules
+
+
+def measure_startup(runs: int = 3) -> Dict:
+    """
+    Cea mai rapida din `runs` porniri (dupa timpul pana la primul cadru), plus importurile
+    ei. Prima rulare incalzeste cache-ul sistemului de fisiere si nu este numarata.
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    best = None
+    for run in range(runs + 1):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", _SCRIPT], cwd=ROOT, env=env,
+                                   capture_output=True, text=True, timeout=60)
+        marker = next((line for line in completed.stdout.splitlines() if line.startswith("STARTUP ")), None)
+        if marker is None:
+            raise RuntimeError(f"Pornirea a esuat:\n{completed.stderr[-2000:]}")
+        if run == 0:
+            continue
+        marks = json.loads(marker[len("STARTUP "):])
+        if best is None or marks.get("first_frame_ms", float("inf")) < best["marks"].get("first_frame_ms", float("inf")):
+            best = {"marks": marks, "imports": parse_importtime(completed.stderr)}
+    return best
+
+
+def print_startup(result: Dict, top: int = 15):
+    labels = [("qapplication_ms", "QApplication"), ("import_ms", "import ui.main_window"),
+              ("construct_ms", "MainWindow()"), ("first_frame_ms", "primul cadru"),
+              ("services_ms", "servicii pornite")]
+    for key, label in labels:
+        value = result["marks"].get(key)
+        print(f"{label:<24}{'-' if value is None else f'{value:9.1f} ms'}")
+
+    imports = [module for module in result["imports"] if module["depth"] == 0]
+    print(f"\nImporturi de prim nivel (cumulat), primele {top} din {len(imports)}:")
+    for module in sorted(imports, key=lambda module: module["cumulative_ms"], reverse=True)[:top]:
+        print(f"  {module['module']:<40}{module['cumulative_ms']:9.1f} ms")
@@ -0,0 +1,217 @@
+"""
+Imbogatirea in lot a mai multor orare, fara interfata grafica:
+- prognoza fiecarei localitati distincte este descarcata o singura data
+  (WeatherService.fetch_many, intr-un QCoreApplication, fara widget-uri)
+- fisierele sunt imbinate cu prognoza in paralel, intr-un pool de procese, cu acelasi
+  ScheduleManager / DataProcessor ca aplicatia
+- rezultatele sunt scrise ca CSV (coloanele exportului din aplicatie) sau JSON
+
+Procesele din pool importa doar partea fara Qt a pachetului core: WeatherService este
+importat numai in procesul principal, in fetch_forecasts().
+"""
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.data_processor import DataProcessor
+from core.enriched_export import write_csv, write_json
+from core.schedule_manager import ScheduleManager
+
+SETTINGS_PATH = "resources/settings.json"
+SCHEDULE_EXTENSIONS = (".json", ".csv")
+OUTPUT_FORMATS = ("csv", "json")
+FETCH_TIMEOUT = 120
+
+# starea fiecarui proces din pool (setata o singura data, de _init_worker)
+_worker: Dict = {}
+
+
+def load_settings(path: str = SETTINGS_PATH) -> Dict:
+    """Setarile aplicatiei (unitati, locatie, orizont); {} daca fisierul lipseste"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def find_schedule_files(patterns: Sequence[str]) -> List[str]:
+    """Fisierele .json / .csv din directoarele, tiparele glob sau caile date (fara duplicate)"""
+    found = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths = sorted(os.path.join(pattern, name) for name in os.listdir(pattern))
+        else:
+            paths = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        found.extend(path for path in paths
+                     if os.path.isfile(path) and path.lower().endswith(SCHEDULE_EXTENSIONS))
+    return list(dict.fromkeys(os.path.normpath(path) for path in found))
+
+
+def output_paths(files: Sequence[str], output_dir: str, output_format: str) -> List[str]:
+    """<director>/<nume>_imbogatit.<format>; numele repetate primesc un sufix numeric"""
+    used = set()
+    paths = []
+    for file_path in files:
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        name, suffix = f"{stem}_imbogatit", 1
+        while name in used:
+            suffix += 1
+            name = f"{stem}_imbogatit_{suffix}"
+        used.add(name)
+        paths.append(os.path.join(output_dir, f"{name}.{output_format}"))
+    return paths
+
+
+def fetch_forecasts(cities: Sequence[str], settings: Dict) -> Tuple[Dict[str, Dict], Dict[str, str]]:
+    """
+    Prognoza (in unitatile din setari) pentru fiecare localitate distincta, cu o singura
+    trecere prin WeatherService.fetch_many: cache-ul de pe disc, apoi cereri grupate.
+    Intoarce ({localitate: prognoza}, {localitate: eroare}).
+    """
+    from PyQt6.QtCore import QCoreApplication, QTimer
+
+    from core.weather_service import WeatherService
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    service = WeatherService()
+    service.set_temperature_unit(settings.get("temperature_unit", "celsius"))
+    service.set_wind_unit(settings.get("wind_unit", "km/h"))
+    service.set_cache_duration(settings.get("cache_duration_minutes", 30))
+    service.load_weather_from_file(forecast_days(settings))
+
+    forecasts: Dict[str, Dict] = {}
+    messages: List[str] = []
+
+    def on_ready(results: Dict):
+        forecasts.update(results)
+        app.quit()
+
+    def on_timeout():
+        messages.append(f"Prognozele nu au sosit in {FETCH_TIMEOUT} s")
+        app.quit()
+
+    service.batch_weather_ready.connect(on_ready)
+    service.weather_error.connect(messages.append)
+    # fetch_many poate termina sincron (totul din cache), deci porneste dupa bucla de evenimente
+    QTimer.singleShot(0, lambda: service.fetch_many(list(cities), forecast_days(settings)))
+    QTimer.singleShot(FETCH_TIMEOUT * 1000, on_timeout)
+    app.exec()
+
+    service.shutdown()
+    service.geocoding_cache.save()
+
+    error = "\n".join(messages) or "Prognoza indisponibila"
+    return forecasts, {city: error for city in cities if city not in forecasts}
+
+
+def forecast_days(settings: Dict) -> int:
+    return max(1, min(int(settings.get("forecast_days", 7)), 16))
+
+
+def _init_worker(forecasts: Dict[str, Dict], settings: Dict):
+    """Initializarea unui proces din pool: prognozele si DataProcessor-ul configurat ca in aplicatie"""
+    processor = DataProcessor()
+    processor.set_temperature_unit(settings.get("temperature_unit", "celsius"))
+    processor.set_wind_unit(settings.get("wind_unit", "km/h"))
+    processor.set_occurrence_options(settings.get("expand_occurrences", False), settings.get("semester_start"))
+    _worker["forecasts"] = forecasts
+    _worker["processor"] = processor
+
+
+def enrich_file(file_path: str, city: str, output_path: str, output_format: str) -> Dict:
+    """Incarca, imbina si scrie un orar; intoarce un rezumat (si erorile de validare)"""
+    started = time.perf_counter()
+    result = {"file": file_path, "city": city, "output": None, "status": "error",
+              "entries": 0, "errors": [], "message": ""}
+
+    forecast = _worker["forecasts"].get(city)
+    if forecast is None:
+        result["message"] = f"Nu exista prognoza pentru {city}"
+        return result
+
+    manager = ScheduleManager()
+    loader = manager.load_from_csv if file_path.lower().endswith(".csv") else manager.load_from_json
+    loaded = loader(file_path)
+    result["errors"] = loaded.get("errors", [])
+    if loaded["status"] != "success":
+        result["message"] = loaded["message"]
+        return result
+
+    entries = _worker["processor"].merge_schedule_with_weather(manager.schedule, forecast)
+    try:
+        if output_format == "csv":
+            write_csv(output_path, entries)
+        else:
+            write_json(output_path, entries, {"source": file_path, "city": city})
+    except OSError as e:
+        result["message"] = f"Nu s-a putut scrie {output_path}: {e}"
+        return result
+
+    result.update(status="success", output=output_path, entries=len(entries),
+                  seconds=time.perf_counter() - started)
+    return result
+
+
+def run_batch(files: Sequence[str], output_dir: str, output_format: str = "csv",
+              city_for: Optional[Callable[[str], str]] = None, settings: Optional[Dict] = None,
+              workers: Optional[int] = None, on_result: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Imbogateste toate fisierele. `city_for(fisier)` alege localitatea fiecarui fisier
+    (implicit location_name din setari); `on_result(rezumat)` este apelat pe masura ce
+    fisierele se termina. Intoarce rezumatele si timpii (fetch, imbogatire, total).
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Format necunoscut: {output_format}")
+    settings = load_settings() if settings is None else settings
+    default_city = settings.get("location_name", "Bucuresti")
+    cities = [city_for(path) if city_for else default_city for path in files]
+    os.makedirs(output_dir, exist_ok=True)
+
+    started = time.perf_counter()
+    forecasts, fetch_errors = fetch_forecasts(list(dict.fromkeys(cities)), settings) if files else ({}, {})
+    fetched = time.perf_counter()
+
+    tasks = list(zip(files, cities, output_paths(files, output_dir, output_format)))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks) or 1))
+    results = []
+
+    def collect(result: Dict):
+        if result["status"] != "success" and result["city"] in fetch_errors:
+            result["message"] = fetch_errors[result["city"]]
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    if workers == 1:
+        _init_worker(forecasts, settings)
+        for task in tasks:
+            collect(enrich_file(*task, output_format))
+    else:
+        # "spawn": procesele noi nu mostenesc firele Qt ale procesului principal
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                                 initializer=_init_worker, initargs=(forecasts, settings)) as pool:
+            futures = [pool.submit(enrich_file, *task, output_format) for task in tasks]
+            for future in as_completed(futures):
+                collect(future.result())
+
+    finished = time.perf_counter()
+    enrich_seconds = finished - fetched
+    order = {path: i for i, path in enumerate(files)}
+    results.sort(key=lambda result: order[result["file"]])
+    return {
+        "results": results,
+        "files": len(files),
+        "succeeded": sum(result["status"] == "success" for result in results),
+        "entries": sum(result["entries"] for result in results),
+        "cities": len(forecasts) + len(fetch_errors),
+        "workers": workers,
+        "fetch_seconds": fetched - started,
+        "enrich_seconds": enrich_seconds,
+        "total_seconds": finished - started,
+        "files_per_second": len(files) / enrich_seconds if enrich_seconds > 0 else 0.0
+    }
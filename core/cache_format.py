@@ -0,0 +1,186 @@
+"""
+Formatul binar al cache-ului de prognoze (resources/weather_cache.bin).
+
+    antet (32 octeti, little-endian):
+        magic "WSFC" | versiune u16 | flags u16 | lungime index u32 |
+        lungime date u64 | crc32 u32 | rezervat (8 octeti)
+    index: JSON UTF-8 (cheie, timestamp, daily, location, coloane), aliniat la 8 octeti
+    date: coloanele fiecarei prognoze, una dupa alta, aliniate la 8 octeti
+
+Coloanele se citesc direct cu np.frombuffer (din bytes sau dintr-un mmap),
+fara a construi dictionare pe ore.
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.units import TEMPERATURE_UNITS
+from core.weather_frame import WeatherFrame, as_frame
+
+MAGIC = b"WSFC"
+FORMAT_VERSION = 1
+FLAG_CHECKSUM = 0x1
+
+HEADER = struct.Struct("<4sHHIQI8x")
+
+COLUMN_DTYPES = {
+    "time": "<i8",
+    "temperature": "<f4",
+    "precipitation_probability": "<f4",
+    "precipitation": "<f4",
+    "weather_code": "u1",
+    "wind_speed": "<f4"
+}
+
+CacheEntry = Tuple[str, float, Dict]
+
+
+class CacheFormatError(ValueError):
+    """Fisierul nu este un cache binar valid"""
+
+
+def _padding(length: int) -> int:
+    return -length % 8
+
+
+def write_cache_file(file_path: str, entries: List[CacheEntry], checksum: bool = True):
+    """Scrie intrarile (cheie, timestamp, date) in format binar (scriere atomica)"""
+    index = []
+    blobs = []
+    offset = 0
+
+    for key, timestamp, data in entries:
+        frame = as_frame(data["hourly"])
+        columns = {}
+        for name, dtype in COLUMN_DTYPES.items():
+            blob = np.ascontiguousarray(getattr(frame, name), dtype=dtype).tobytes()
+            columns[name] = offset
+            blobs.append(blob)
+            blobs.append(b"\0" * _padding(len(blob)))
+            offset += len(blob) + _padding(len(blob))
+
+        index.append({
+            "key": key,
+            "timestamp": timestamp,
+            "rows": len(frame),
+            "columns": columns,
+            "daily": data.get("daily", []),
+            "location": data.get("location", {})
+        })
+
+    index_bytes = json.dumps({"entries": index}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    index_bytes += b" " * _padding(len(index_bytes))
+    data_bytes = b"".join(blobs)
+
+    flags = FLAG_CHECKSUM if checksum else 0
+    crc = zlib.crc32(data_bytes, zlib.crc32(index_bytes)) if checksum else 0
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(index_bytes), len(data_bytes), crc)
+
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(index_bytes)
+        f.write(data_bytes)
+    os.replace(tmp_path, file_path)
+
+
+def read_cache_file(file_path: str, use_mmap: bool = False, verify: bool = True) -> List[CacheEntry]:
+    """
+    Citeste intrarile dintr-un cache binar.
+    Cu use_mmap=True coloanele raman mapate din fisier (nu se copiaza in memorie);
+    implicit fisierul este citit o singura data, pentru a nu-l tine blocat (Windows).
+    """
+    with open(file_path, "rb") as f:
+        if use_mmap:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = f.read()
+
+    if len(buffer) < HEADER.size:
+        raise CacheFormatError("Fisier cache prea scurt")
+
+    magic, version, flags, index_length, data_length, crc = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise CacheFormatError("Fisierul nu este un cache WeatherScheduler")
+    if version != FORMAT_VERSION:
+        raise CacheFormatError(f"Versiune necunoscuta a cache-ului: {version}")
+
+    index_start = HEADER.size
+    data_start = index_start + index_length
+    if len(buffer) < data_start + data_length:
+        raise CacheFormatError("Fisier cache trunchiat")
+
+    view = memoryview(buffer)
+    if verify and flags & FLAG_CHECKSUM:
+        if zlib.crc32(view[index_start:data_start + data_length]) != crc:
+            raise CacheFormatError("Suma de control a cache-ului nu corespunde")
+
+    index = json.loads(bytes(view[index_start:data_start]).decode("utf-8"))
+
+    entries = []
+    for item in index.get("entries", []):
+        rows = item["rows"]
+        columns = [
+            np.frombuffer(buffer, dtype=dtype, count=rows, offset=data_start + item["columns"][name])
+            for name, dtype in COLUMN_DTYPES.items()
+        ]
+        entries.append((item["key"], item["timestamp"], {
+            "hourly": WeatherFrame(*columns),
+            "daily": item.get("daily", []),
+            "location": item.get("location", {})
+        }))
+
+    return entries
+
+
+def read_json_cache_file(file_path: str, temperature_unit: Optional[str] = None) -> Optional[List[CacheEntry]]:
+    """
+    Citeste vechiul cache JSON, pentru migrare:
+    - versiunea 2: mai multe intrari, fiecare cu cheia ei (care contine unitatea temperaturii)
+    - formatul initial: o singura prognoza, fara cheie (cheia intoarsa este None), in
+      unitatea `temperature_unit` (cea din setarile de atunci)
+
+    Prognozele erau salvate in unitatea de afisare a temperaturii (vantul mereu in km/h);
+    fiecare este marcata cu "units" pentru conversia la unitatile canonice
+    (units.to_canonical). Intrarile a caror unitate nu se cunoaste sunt ignorate.
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+
+    if payload.get("version") == 2:
+        items = payload.get("entries", [])
+    elif "timestamp" in payload and "data" in payload:
+        items = [{"key": None, "timestamp": payload["timestamp"], "data": payload["data"]}]
+    else:
+        return None
+
+    entries = []
+    for item in items:
+        try:
+            key = item["key"]
+            unit = key.split("|")[1] if key is not None else temperature_unit
+            if unit not in TEMPERATURE_UNITS:
+                continue
+            data = item["data"]
+            data["units"] = {"temperature": unit, "wind_speed": "km/h"}
+            data["hourly"] = WeatherFrame.from_records(data.get("hourly", []))
+            timestamp = item["timestamp"]
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp).timestamp()
+            entries.append((key, float(timestamp), data))
+        except (KeyError, IndexError, AttributeError, TypeError, ValueError):
+            continue
+
+    return entries
@@ -1,7 +1,16 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional
 import json
 
+import numpy as np
+
+from core.interval_aggregates import IntervalAggregates
+from core.occurrences import expand_schedule
+from core.schedule_entry import EnrichedEntry
+from core.schedule_statistics import calculate_statistics
+from core.units import WIND_UNITS
+from core.weather_frame import as_frame, datetime_to_epoch
+
 class DataProcessor:
     def __init__(self):
         self.day_map = {
@@ -9,6 +18,9 @@ class DataProcessor:
             "Sâmbătă": 5, "Duminică": 6
         }
         self.temp_unit_symbol = "°C" 
+        self.wind_unit_symbol = "km/h"
+        self.expand_occurrences = False
+        self.semester_start = None
 
     def set_temperature_unit(self, unit: str):
         """Setează simbolul unității de temperatură pentru formatarea în tabel."""
@@ -17,83 +29,166 @@ class DataProcessor:
         else:
             self.temp_unit_symbol = "°C"
 
-    def merge_schedule_with_weather(self, schedule_entries: List[Dict], weather_data: Dict) -> List[Dict]:
+    def set_wind_unit(self, unit: str):
+        """Setează unitatea vitezei vântului pentru formatarea în tabel."""
+        self.wind_unit_symbol = unit if unit in WIND_UNITS else "km/h"
+
+    def set_occurrence_options(self, expand: bool, semester_start: Optional[str] = None):
+        """
+        expand=True: câte un rând pentru fiecare apariție din orizontul prognozei;
+        semester_start (dată ISO): referința pentru săptămânile pare/impare (altfel săptămâna ISO).
+        """
+        self.expand_occurrences = bool(expand)
+        try:
+            self.semester_start = date.fromisoformat(semester_start) if semester_start else None
+        except ValueError:
+            self.semester_start = None
+
+    def merge_schedule_with_weather(self, schedule_entries: List[Dict], weather_data: Dict,
+                                    interpolate: bool = False, expand: Optional[bool] = None) -> List[Dict]:
+        """
+        Atașează fiecărei intrări din orar prognoza pentru următoarea apariție permisă a intervalului
+        (ținând cont de săptămânile pare/impare și de datele exceptate). Cu expand=True
+        (implicit self.expand_occurrences) rezultă câte o intrare pentru fiecare apariție
+        din orizontul prognozei. Implicit se alege ora cea mai apropiată (la egalitate, cea anterioară); cu
+        interpolate=True valorile numerice sunt interpolate liniar între orele vecine.
+        Căutarea se face o singură dată, vectorizat, pe axa de timp a prognozei.
+
+        "interval_weather" conține agregatele pe tot intervalul (ex. 08:00-12:00):
+        probabilitatea maximă de ploaie, suma precipitațiilor, temperatura minimă/maximă,
+        codul cel mai sever și vântul maxim.
+        """
         if not weather_data or "hourly" not in weather_data:
             return schedule_entries
 
+        hourly_data = as_frame(weather_data["hourly"])
+        if expand is None:
+            expand = self.expand_occurrences
+        enriched_entries, rows, starts, ends = self.schedule_occurrences(
+            schedule_entries, self.reference_datetime(hourly_data),
+            self.forecast_horizon(hourly_data) if expand else None)
+        self.attach_weather(enriched_entries, rows, starts, ends, hourly_data, interpolate)
+        return enriched_entries
+
+    def reference_datetime(self, hourly_data) -> datetime:
+        """Momentul față de care se caută următoarea apariție: prima oră a prognozei"""
+        if len(hourly_data):
+            return datetime.fromisoformat(hourly_data[0]["datetime"]).astimezone()
+        return datetime.now()
+
+    def forecast_horizon(self, hourly_data) -> int:
+        """Sfârșitul orizontului prognozei (secunde): după ultima oră disponibilă"""
+        if not len(hourly_data):
+            return 0
+        if len(hourly_data) > 1:
+            return int(hourly_data.time[-1] + (hourly_data.time[-1] - hourly_data.time[-2]))
+        return int(hourly_data.time[-1]) + 3600
+
+    def schedule_occurrences(self, schedule_entries: List[Dict], current_datetime: datetime,
+                             horizon_end: Optional[int] = None) -> tuple:
+        """
+        Intrările îmbinate (EnrichedEntry, cu referință la intrarea din orar) cu data apariției
+        ("weather" încă None), împreună cu rândurile
+        care au o apariție și intervalele lor [start, end) în secunde.
+        Fără `horizon_end`: câte un rând pentru fiecare intrare (următoarea apariție);
+        cu `horizon_end`: câte un rând pentru fiecare apariție care începe înainte de el.
+        Intrările fără nicio apariție (zi invalidă, nimic în orizont) rămân într-un singur
+        rând, fără dată și fără vreme.
+        """
         enriched_entries = []
-        hourly_data = weather_data["hourly"]
+        rows = []
+        starts = []
+        ends = []
+
+        def first_occurrence(day_name, time_range):
+            return self._target_for(day_name, time_range, current_datetime)
+
+        for index, occurrence in expand_schedule(schedule_entries, first_occurrence, horizon_end,
+                                                 self.semester_start):
+            if occurrence is None:
+                enriched_entries.append(EnrichedEntry(schedule_entries[index]))
+                continue
+            date_iso, target_ts, target_end = occurrence
+            rows.append(len(enriched_entries))
+            starts.append(target_ts)
+            ends.append(target_end)
+            enriched_entries.append(EnrichedEntry(schedule_entries[index], date_iso))
+
+        return enriched_entries, rows, np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64)
+
+    def attach_weather(self, enriched_entries: List[Dict], rows: List[int], starts: np.ndarray,
+                       ends: np.ndarray, hourly_data, interpolate: bool = False):
+        """
+        Completează "weather" și "interval_weather" pentru rândurile date (pe loc),
+        cu o singură căutare vectorizată; rândurile fără oră apropiată primesc None.
+        """
+        for row in rows:
+            enriched_entries[row]["weather"] = None
+            enriched_entries[row]["interval_weather"] = None
+
+        if not rows or not len(hourly_data):
+            return
+
+        indices = hourly_data.nearest_indices(starts, max_distance=24 * 3600)
+        source = hourly_data.interpolate_at(starts) if interpolate else hourly_data
+        intervals = IntervalAggregates.for_frame(hourly_data).records(starts, ends)
+
+        for position, (row, index) in enumerate(zip(rows, indices.tolist())):
+            if index >= 0:
+                enriched = enriched_entries[row]
+                enriched["weather"] = source[position if interpolate else index]
+                enriched["interval_weather"] = intervals[position]
+
+    def _target_for(self, day_name: str, time_range: str, current_datetime: datetime) -> Optional[tuple]:
+        """
+        (data ISO, începutul, sfârșitul) în secunde pentru următoarea apariție a intervalului,
+        sau None. Un sfârșit lipsă sau invalid înseamnă o oră după început.
+        """
+        try:
+            target_day_of_week = self.day_map[day_name]
+        except KeyError:
+            return None
+
+        days_to_add = (target_day_of_week - current_datetime.weekday() + 7) % 7
+        if days_to_add == 0 and time_range.split('-')[0] < current_datetime.strftime("%H:%M"):
+            days_to_add = 7
+
+        target_date = (current_datetime + timedelta(days=days_to_add)).date()
         
-        if hourly_data:
-            current_datetime_str = hourly_data[0].get("datetime")
-            try:
-                current_datetime = datetime.fromisoformat(current_datetime_str).astimezone()
-            except ValueError:
-                current_datetime = datetime.now()
-        else:
-            current_datetime = datetime.now()
-
-        for entry in schedule_entries:
-            enriched = entry.copy()
-            day_name = entry.get("day")
-            time_range = entry.get("time")
-
-            if day_name and time_range:
-                try:
-                    target_day_of_week = self.day_map[day_name]
-                except KeyError:
-                    enriched["weather"] = None
-                    enriched_entries.append(enriched)
-                    continue
-
-                days_to_add = (target_day_of_week - current_datetime.weekday() + 7) % 7
-                if days_to_add == 0 and time_range.split('-')[0] < current_datetime.strftime("%H:%M"):
-                    days_to_add = 7
-
-                target_date = (current_datetime + timedelta(days=days_to_add)).date()
-                
-                try:
-                    start_time_str = time_range.split('-')[0].strip()
-                    target_datetime = datetime.strptime(f"{target_date} {start_time_str}", "%Y-%m-%d %H:%M").replace(tzinfo=current_datetime.tzinfo)
-                except ValueError:
-                    enriched["weather"] = None
-                    enriched_entries.append(enriched)
-                    continue
-
-                closest_forecast = None
-                min_diff = timedelta(hours=24)
-                
-                for hourly in hourly_data:
-                    try:
-                        hourly_dt = datetime.fromisoformat(hourly["datetime"]).astimezone()
-                    except ValueError:
-                        continue
-                    diff = abs(target_datetime - hourly_dt)
-                    if diff < min_diff:
-                        min_diff = diff
-                        closest_forecast = hourly
-                    if hourly_dt > target_datetime and diff > min_diff:
-                        break
-
-                enriched["date"] = target_date.isoformat()
-                enriched["weather"] = closest_forecast
-            else:
-                enriched["weather"] = None
-
-            enriched_entries.append(enriched)
-        return enriched_entries
+        try:
+            start_time_str = time_range.split('-')[0].strip()
+            target_datetime = datetime.strptime(f"{target_date} {start_time_str}", "%Y-%m-%d %H:%M")
+        except ValueError:
+            return None
+
+        start_ts = datetime_to_epoch(target_datetime)
+        try:
+            end_time = datetime.strptime(time_range.split('-')[1].strip(), "%H:%M").time()
+            end_ts = datetime_to_epoch(datetime.combine(target_date, end_time))
+            if end_ts <= start_ts:
+                end_ts += 24 * 3600
+        except (IndexError, ValueError):
+            end_ts = start_ts + 3600
+
+        return target_date.isoformat(), start_ts, end_ts
 
-    def format_weather_for_table(self, weather_data: Dict) -> Dict:
-        """Formatează datele folosind simbolul unității setat."""
+    def format_weather_for_table(self, weather_data: Dict, interval: Optional[Dict] = None) -> Dict:
+        """
+        Formatează datele folosind simbolul unității setat.
+        Cu `interval` (agregatele intervalului) se afișează maximele pe tot intervalul.
+        """
         temp = weather_data.get("temperature")
         precip_prob = weather_data.get("precipitation_probability")
         conditions = weather_data.get("weather_description")
         wind_speed = weather_data.get("wind_speed")
+
+        if interval:
+            return self._format_interval(interval, temp, wind_speed)
         
         temperature = f"{temp:.1f}{self.temp_unit_symbol}" if temp is not None else "-"
         precipitation = f"{precip_prob:.0f}%" if precip_prob is not None else "-"
         conditions_text = conditions if conditions else "-"
-        wind = f"{wind_speed:.1f} km/h" if wind_speed is not None else "-"
+        wind = f"{wind_speed:.1f} {self.wind_unit_symbol}" if wind_speed is not None else "-"
         
         return {
             "temperature": temperature,
@@ -102,33 +197,39 @@ class DataProcessor:
             "wind": wind
         }
 
-    def calculate_statistics(self, enriched_entries: List[Dict]) -> Dict:
-        temperatures = []
-        for entry in enriched_entries:
-            weather = entry.get("weather")
-            if weather:
-                temp = weather.get("temperature")
-                if temp is not None: temperatures.append(temp)
-        
-        if not temperatures:
-            return {
-                "avg_temperature": None, 
-                "min_temperature": None,
-                "max_temperature": None,
-                "rainy_periods": 0, 
-                "total_precipitation": 0.0,
-                "unit": self.temp_unit_symbol 
-            }
-        
+    def _format_interval(self, interval: Dict, temp: Optional[float], wind_speed: Optional[float]) -> Dict:
+        temp_min = interval.get("temperature_min")
+        temp_max = interval.get("temperature_max")
+        if temp_min is None or temp_max is None:
+            temperature = f"{temp:.1f}{self.temp_unit_symbol}" if temp is not None else "-"
+        elif round(temp_min, 1) == round(temp_max, 1):
+            temperature = f"{temp_max:.1f}{self.temp_unit_symbol}"
+        else:
+            temperature = f"{temp_min:.1f}–{temp_max:.1f}{self.temp_unit_symbol}"
+
+        precipitation = f"{interval['precipitation_probability_max']:.0f}%"
+        if interval.get("precipitation_sum", 0) > 0:
+            precipitation += f" ({interval['precipitation_sum']:.1f} mm)"
+
+        wind_max = interval.get("wind_speed_max")
+        if wind_max is None:
+            wind_max = wind_speed
+        wind = f"{wind_max:.1f} {self.wind_unit_symbol}" if wind_max is not None else "-"
+
         return {
-            "avg_temperature": sum(temperatures) / len(temperatures),
-            "min_temperature": min(temperatures),
-            "max_temperature": max(temperatures),
-            "rainy_periods": len([e for e in enriched_entries if e.get('weather') and e['weather'].get('precipitation_probability', 0) > 30]),
-            "total_precipitation": sum([e.get('weather', {}).get('precipitation', 0) for e in enriched_entries if e.get('weather')]),
-            "unit": self.temp_unit_symbol
+            "temperature": temperature,
+            "conditions": interval.get("weather_description") or "-",
+            "precipitation": precipitation,
+            "wind": wind
         }
 
+    def calculate_statistics(self, enriched_entries: List[Dict]) -> Dict:
+        """
+        Statisticile globale plus defalcările pe zi, materie și sală
+        ("by_day", "by_subject", "by_location"), calculate vectorizat.
+        """
+        return calculate_statistics(enriched_entries, self.temp_unit_symbol)
+
     def detect_rain_conditions(self, weather_data: Dict) -> tuple:
         prob = weather_data.get("precipitation_probability", 0)
         amt = weather_data.get("precipitation", 0.0)
@@ -0,0 +1,56 @@
+"""
+Scrierea intrarilor imbinate cu prognoza (CSV / JSON), fara dependente Qt:
+folosita de exportul CSV din aplicatie (ExportManager) si de imbogatirea in lot.
+"""
+import csv
+import json
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Optional
+
+CSV_HEADER = ["Zi", "Data", "Interval", "Activitate", "Temperatura", "Condiții", "Ploaie",
+              "Ploaie max. interval", "Precipitații interval (mm)",
+              "Temp. min. interval", "Temp. max. interval", "Vânt max. interval"]
+
+
+def csv_row(entry: Mapping) -> List:
+    """Randul CSV al unei intrari imbinate (coloanele CSV_HEADER)"""
+    w = entry.get("weather") or {}
+    interval = entry.get("interval_weather") or {}
+    return [
+        entry.get("day", "-"),
+        entry.get("date", "-"),
+        entry.get("time", "-"),
+        entry.get("subject", "-"),
+        w.get("temperature", "-"),
+        interval.get("weather_description", w.get("weather_description", "-")),
+        f"{w.get('precipitation_probability', 0)}%",
+        f"{interval['precipitation_probability_max']}%" if interval else "-",
+        interval.get("precipitation_sum", "-"),
+        interval.get("temperature_min", "-"),
+        interval.get("temperature_max", "-"),
+        interval.get("wind_speed_max", "-")
+    ]
+
+
+def write_csv(file_path: str, entries: Iterable[Mapping]):
+    with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(csv_row(entry) for entry in entries)
+
+
+def write_json(file_path: str, entries: Iterable[Mapping], metadata: Optional[Dict] = None):
+    """{**metadata, "schedule": [...]}; intrarile (si inregistrarile orare din ele) devin dictionare"""
+    document = dict(metadata or {})
+    document["schedule"] = list(entries)
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2, default=_plain)
+
+
+def _plain(value):
+    if isinstance(value, Mapping):
+        return dict(value)
+    if hasattr(value, "item"):
+        # scalari numpy
+        return value.item()
+    raise TypeError(f"Valoare care nu poate fi scrisa in JSON: {type(value).__name__}")
@@ -0,0 +1,174 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.interval_aggregates import IntervalAggregates
+from core.weather_frame import WeatherFrame, as_frame
+
+
+class EnrichmentCache:
+    """
+    Memoizeaza imbinarea orarului cu prognoza (DataProcessor.merge_schedule_with_weather).
+
+    Cheia este formata din (amprenta orarului, amprenta prognozei, unitati si optiunile aparitiilor):
+    - daca nimic nu s-a schimbat se intorc aceleasi intrari, fara niciun rand modificat
+    - daca s-a schimbat doar prognoza, aparitiile (data, interval) se refolosesc si se
+      recalculeaza doar campurile meteo; sunt raportate ca modificate doar randurile
+      pentru care ora cea mai apropiata sau agregatele intervalului s-au schimbat
+    - altfel (orar nou, alta zi de referinta sau alt orizont, alte optiuni) totul se recalculeaza
+
+    `version` creste la fiecare modificare a intrarilor; statisticile sunt memorate per versiune.
+    """
+
+    def __init__(self, data_processor):
+        self.data_processor = data_processor
+
+        self.schedule_key = None
+        self.reference = None
+        self.base_entries: List[Dict] = []
+        self.rows: List[int] = []
+        self.starts = np.empty(0, dtype=np.int64)
+        self.ends = np.empty(0, dtype=np.int64)
+
+        self.forecast_key = None
+        self.options = None
+        self.signature: Optional[np.ndarray] = None
+        self.entries: List[Dict] = []
+        self.version = 0
+        self._statistics: Optional[Tuple[int, Dict]] = None
+
+        self.hits = 0
+        self.partial_updates = 0
+        self.full_updates = 0
+
+    def clear(self):
+        """Uita toate rezultatele memorate"""
+        self.schedule_key = None
+        self.forecast_key = None
+        self.signature = None
+        self.entries = []
+        self.version += 1
+
+    def enrich(self, schedule_entries: List[Dict], weather_data: Dict,
+               interpolate: bool = False) -> Tuple[List[Dict], Optional[List[int]]]:
+        """
+        Intrarile imbinate si randurile modificate fata de apelul anterior:
+        o lista (posibil goala) de indecsi, sau None cand s-au schimbat toate randurile.
+        Intrarile nemodificate sunt aceleasi obiecte ca la apelul anterior.
+        """
+        if not weather_data or "hourly" not in weather_data:
+            self.clear()
+            return schedule_entries, None
+
+        frame = as_frame(weather_data["hourly"])
+        processor = self.data_processor
+
+        schedule_key = schedule_fingerprint(schedule_entries)
+        forecast_key = (frame.fingerprint(), interpolate)
+        options = (processor.temp_unit_symbol, processor.wind_unit_symbol,
+                   processor.expand_occurrences, processor.semester_start)
+
+        if (schedule_key, forecast_key, options) == (self.schedule_key, self.forecast_key, self.options):
+            self.hits += 1
+            return self.entries, []
+
+        # aparitiile depind si de ziua de referinta, de orizont (cand sunt extinse) si de semestru
+        horizon_end = processor.forecast_horizon(frame) if processor.expand_occurrences else None
+        reference = (processor.reference_datetime(frame), horizon_end, processor.semester_start)
+        schedule_changed = schedule_key != self.schedule_key or reference != self.reference
+        if schedule_changed:
+            self.base_entries, self.rows, self.starts, self.ends = processor.schedule_occurrences(
+                schedule_entries, reference[0], horizon_end)
+            self.schedule_key = schedule_key
+            self.reference = reference
+
+        signature = self._signature(frame, interpolate)
+
+        if schedule_changed or options != self.options or self.signature is None:
+            entries = [entry.copy() for entry in self.base_entries]
+            processor.attach_weather(entries, self.rows, self.starts, self.ends, frame, interpolate)
+            dirty = None
+            self.full_updates += 1
+        else:
+            changed = _changed_rows(self.signature, signature)
+            entries = list(self.entries)
+            rows = [self.rows[position] for position in changed.tolist()]
+            for row in rows:
+                entries[row] = entries[row].copy()
+            processor.attach_weather(entries, rows, self.starts[changed], self.ends[changed], frame, interpolate)
+            dirty = rows
+            self.partial_updates += 1
+
+        self.forecast_key = forecast_key
+        self.options = options
+        self.signature = signature
+        self.entries = entries
+        self.version += 1
+        return entries, dirty
+
+    def statistics(self) -> Dict:
+        """Statisticile intrarilor curente, calculate o singura data pentru fiecare versiune"""
+        if self._statistics is None or self._statistics[0] != self.version:
+            self._statistics = (self.version, self.data_processor.calculate_statistics(self.entries))
+        return self._statistics[1]
+
+    def _signature(self, frame: WeatherFrame, interpolate: bool) -> np.ndarray:
+        """
+        Valorile din care se construiesc campurile meteo ale fiecarui rand gasit, cate o linie
+        pe rand: ora cea mai apropiata (sau valorile interpolate) si agregatele intervalului
+        """
+        starts = self.starts
+        if not len(starts) or not len(frame):
+            return np.full((len(starts), 1), -1.0)
+
+        indices = frame.nearest_indices(starts, max_distance=24 * 3600)
+        found = indices >= 0
+        if interpolate:
+            source, positions = frame.interpolate_at(starts), np.arange(len(starts))
+        else:
+            source, positions = frame, np.where(found, indices, 0)
+
+        aggregates = IntervalAggregates.for_frame(frame).aggregate(starts, self.ends)
+        peak_time = frame.time[np.maximum(aggregates["precipitation_peak"], 0)]
+
+        columns = [
+            found,
+            source.time[positions],
+            source.temperature[positions],
+            source.precipitation_probability[positions],
+            source.precipitation[positions],
+            source.weather_code[positions],
+            source.wind_speed[positions],
+            aggregates["samples"],
+            aggregates["precipitation_probability_max"],
+            peak_time,
+            aggregates["precipitation_sum"],
+            aggregates["temperature_min"],
+            aggregates["temperature_max"],
+            aggregates["weather_code"],
+            aggregates["wind_speed_max"]
+        ]
+        signature = np.column_stack([np.asarray(column, dtype=np.float64) for column in columns])
+        signature[~found] = -1.0
+        return signature
+
+
+def schedule_fingerprint(schedule_entries: List[Dict]) -> int:
+    """Amprenta continutului orarului (ordinea intrarilor conteaza)"""
+    try:
+        # ScheduleEntry este imutabila si are hash propriu
+        return hash(tuple(schedule_entries))
+    except TypeError:
+        pass
+    try:
+        return hash(tuple(tuple(entry.items()) for entry in schedule_entries))
+    except TypeError:
+        return hash(tuple(repr(sorted(entry.items(), key=str)) for entry in schedule_entries))
+
+
+def _changed_rows(before: np.ndarray, after: np.ndarray) -> np.ndarray:
+    """Pozitiile liniilor care difera (NaN este egal cu NaN)"""
+    if before.shape != after.shape:
+        return np.arange(len(after))
+    same = (before == after) | (np.isnan(before) & np.isnan(after))
+    return np.flatnonzero(~same.all(axis=1))
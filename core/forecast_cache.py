@@ -0,0 +1,198 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.cache_format import CacheFormatError, read_cache_file, read_json_cache_file, write_cache_file
+from core.units import CANONICAL_TEMPERATURE_UNIT, to_canonical
+from core.weather_frame import as_frame
+
+DAILY_ENTRY_BYTES = 200
+
+
+class ForecastCache:
+    """
+    Cache persistent pentru prognoze, cu mai multe intrari:
+    - cheia este formata din (lat, lon, unitate, zile, variabile)
+    - fiecare intrare expira dupa `ttl` secunde
+    - la depasirea numarului maxim de intrari / octeti se elimina intrarea
+      folosita cel mai demult (LRU)
+    """
+
+    def __init__(self, file_path: str = "resources/weather_cache.bin",
+                 ttl: float = 1800, max_entries: int = 32, max_bytes: int = 8 * 1024 * 1024,
+                 legacy_file_path: Optional[str] = "resources/weather_cache.json",
+                 legacy_settings_path: Optional[str] = "resources/settings.json"):
+        self.file_path = file_path
+        self.legacy_file_path = legacy_file_path
+        # setarile care dau unitatea temperaturii pentru vechiul cache JSON fara cheie
+        self.legacy_settings_path = legacy_settings_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.entries: "OrderedDict[str, Tuple[float, Dict, int]]" = OrderedDict()
+        self.total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._save_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(latitude: float, longitude: float, unit: str, forecast_days: int, variables: str) -> str:
+        """Construieste cheia unei intrari; coordonatele sunt rotunjite la ~10 m"""
+        return f"{float(latitude):.4f},{float(longitude):.4f}|{unit}|{int(forecast_days)}|{variables}"
+
+    @staticmethod
+    def with_unit(key: str, unit: str) -> str:
+        """Aceeasi cheie, pentru alta unitate"""
+        parts = key.split("|")
+        parts[1] = unit
+        return "|".join(parts)
+
+    def set_ttl(self, seconds: float):
+        """Seteaza durata de viata a intrarilor (secunde)"""
+        self.ttl = max(0, seconds)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Intoarce datele pentru cheie daca exista si nu au expirat"""
+        entry = self.entries.get(key)
+        if entry is None or self.age(key) >= self.ttl:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def peek(self, key: str) -> Optional[Dict]:
+        """Datele pentru cheie, chiar daca au expirat (fara a modifica contoarele sau ordinea LRU)"""
+        entry = self.entries.get(key)
+        return entry[1] if entry else None
+
+    def age(self, key: str) -> Optional[float]:
+        """Varsta intrarii in secunde, sau None daca nu exista"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return time.time() - entry[0]
+
+    def timestamp(self, key: str) -> Optional[float]:
+        """Momentul (epoch) la care a fost salvata intrarea"""
+        entry = self.entries.get(key)
+        return entry[0] if entry else None
+
+    def put(self, key: str, data: Dict, timestamp: Optional[float] = None):
+        """Adauga sau inlocuieste o intrare si aplica limitele LRU"""
+        self.remove(key)
+
+        size = self._estimate_size(data)
+        self.entries[key] = (timestamp if timestamp is not None else time.time(), data, size)
+        self.total_bytes += size
+        self._evict()
+
+    def remove(self, key: str):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> Dict:
+        """Contoarele cache-ului, pentru afisare/diagnostic"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def _evict(self):
+        while self.entries and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, (_, _, size) = self.entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    @staticmethod
+    def _estimate_size(data: Dict) -> int:
+        hourly = data.get("hourly")
+        size = as_frame(hourly).nbytes if hourly is not None else 0
+        return size + DAILY_ENTRY_BYTES * len(data.get("daily", []))
+
+    def snapshot(self) -> List[Tuple[str, float, Dict]]:
+        """Copie a intrarilor (cheie, timestamp, date), sigura de salvat din alt fir"""
+        return [(key, timestamp, data) for key, (timestamp, data, _) in self.entries.items()]
+
+    def save(self, snapshot: Optional[List[Tuple[str, float, Dict]]] = None) -> bool:
+        """
+        Salveaza intrarile pe disc, in formatul binar.
+        Din alt fir decat cel principal se transmite un `snapshot()` luat in firul principal.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        try:
+            with self._save_lock:
+                write_cache_file(self.file_path, snapshot)
+            return True
+        except OSError as e:
+            print(f"Nu s-a putut salva cache-ul meteo: {e}")
+            return False
+
+    def load(self, legacy_key: Optional[Callable[[Dict], str]] = None) -> int:
+        """
+        Incarca intrarile de pe disc si intoarce numarul lor.
+        Daca fisierul binar lipseste sau este corupt, se migreaza vechiul cache JSON,
+        convertit la unitatile canonice (°C, km/h); `legacy_key(data)` construieste cheia
+        pentru prognozele salvate fara cheie.
+        """
+        try:
+            entries = read_cache_file(self.file_path)
+        except (OSError, CacheFormatError, ValueError, KeyError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"Cache-ul meteo nu a putut fi citit: {e}")
+            entries = None
+            if self.legacy_file_path:
+                entries = read_json_cache_file(self.legacy_file_path, self._legacy_temperature_unit())
+            if entries:
+                print(f"Migrez cache-ul meteo din {self.legacy_file_path}")
+
+        if not entries:
+            return 0
+
+        self.clear()
+        for key, timestamp, data in entries:
+            if "units" in data:
+                # vechiul cache JSON, salvat in unitatile de afisare
+                data = to_canonical(data)
+                if key is not None:
+                    key = self.with_unit(key, CANONICAL_TEMPERATURE_UNIT)
+            if key is None:
+                if legacy_key is None:
+                    continue
+                key = legacy_key(data)
+            self.put(key, data, timestamp=timestamp)
+
+        if not os.path.exists(self.file_path):
+            self.save()
+
+        return len(self.entries)
+
+    def _legacy_temperature_unit(self) -> Optional[str]:
+        """Unitatea temperaturii din setari (None daca nu se poate afla: intrarea fara cheie este ignorata)"""
+        if not self.legacy_settings_path:
+            return None
+        try:
+            with open(self.legacy_settings_path, "r", encoding="utf-8") as f:
+                unit = json.load(f).get("temperature_unit")
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return None
+        return unit.lower() if isinstance(unit, str) else None
@@ -0,0 +1,78 @@
+import json
+import os
+import time
+import unicodedata
+from typing import Dict, Optional
+
+
+def normalize_city_name(name: str) -> str:
+    """
+    Cheia normalizata pentru un oras: fara diacritice, litere mici, spatii unice.
+    Astfel "București", "Bucureşti" si " bucuresti " ajung la aceeasi intrare.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+class GeocodingCache:
+    """
+    Cache persistent oras -> (latitudine, longitudine, fus orar).
+    Intrarile expira dupa `ttl` secunde (implicit 30 de zile).
+    """
+
+    def __init__(self, file_path: str = "resources/geocoding_cache.json", ttl: float = 30 * 24 * 3600):
+        self.file_path = file_path
+        self.ttl = ttl
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def get(self, city_name: str) -> Optional[Dict]:
+        """Intoarce {"latitude", "longitude", "timezone", ...} sau None"""
+        entry = self.entries.get(normalize_city_name(city_name))
+        if entry is None or time.time() - entry.get("timestamp", 0) >= self.ttl:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def put(self, city_name: str, latitude: float, longitude: float, timezone: Optional[str] = None,
+            resolved_name: Optional[str] = None):
+        """Adauga rezultatul unei cereri de geocoding si salveaza cache-ul"""
+        self.entries[normalize_city_name(city_name)] = {
+            "name": resolved_name or city_name,
+            "latitude": latitude,
+            "longitude": longitude,
+            "timezone": timezone,
+            "timestamp": time.time()
+        }
+        self.save()
+
+    def load(self):
+        """Incarca intrarile de pe disc, eliminand pe cele expirate"""
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+
+        now = time.time()
+        self.entries = {
+            key: entry for key, entry in entries.items()
+            if isinstance(entry, dict) and now - entry.get("timestamp", 0) < self.ttl
+        }
+
+    def save(self) -> bool:
+        """Salveaza cache-ul pe disc (scriere atomica)"""
+        tmp_path = f"{self.file_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.file_path)
+            return True
+        except OSError as e:
+            print(f"Nu s-a putut salva cache-ul de geocoding: {e}")
+            return False
@@ -0,0 +1,170 @@
+"""
+Agregate meteo pe intervale de timp (ex. 08:00-12:00), calculate in O(1) per interval:
+sume prefix pentru precipitatii si tabele rare (sparse table) pentru minime/maxime.
+"""
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.weather_frame import WeatherFrame, describe_weather_code, epoch_to_iso
+
+_cache: "weakref.WeakKeyDictionary[WeatherFrame, IntervalAggregates]" = weakref.WeakKeyDictionary()
+
+
+class SparseTable:
+    """
+    Indexul minimului / maximului pe [lo, hi) in O(1), dupa o constructie O(n log n).
+    La egalitate se intoarce indexul cel mai mic.
+    """
+
+    def __init__(self, values: np.ndarray, largest: bool = True):
+        self.values = values
+        self.largest = largest
+        self.levels = [np.arange(len(values))]
+
+        width = 1
+        while 2 * width <= len(values):
+            previous = self.levels[-1]
+            self.levels.append(self._pick(previous[:-width], previous[width:]))
+            width *= 2
+
+    def _pick(self, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        if self.largest:
+            return np.where(self.values[second] > self.values[first], second, first)
+        return np.where(self.values[second] < self.values[first], second, first)
+
+    def query(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """Indecsii extremelor pentru intervalele [lo, hi); toate intervalele trebuie sa fie nevide"""
+        result = np.empty(len(lo), dtype=np.intp)
+        level = np.floor(np.log2(hi - lo)).astype(np.intp)
+        for k in np.unique(level):
+            rows = level == k
+            table = self.levels[k]
+            result[rows] = self._pick(table[lo[rows]], table[hi[rows] - (1 << int(k))])
+        return result
+
+
+class IntervalAggregates:
+    """
+    Agregatele unui WeatherFrame pe intervale oarecare: probabilitatea maxima de
+    precipitatii, suma precipitatiilor, temperatura minima/maxima, codul meteo cel
+    mai sever si vantul maxim.
+
+    O inregistrare de la momentul t acopera [t, t + pas), deci un interval include si
+    inregistrarea care acopera inceputul lui (ex. 08:30-10:00 foloseste orele 08 si 09).
+    """
+
+    def __init__(self, frame: WeatherFrame):
+        self.frame = frame
+        self.step = int(np.median(np.diff(frame.time))) if len(frame) > 1 else 3600
+
+        self.precipitation_prefix = np.concatenate(([0.0], np.cumsum(frame.precipitation, dtype=np.float64)))
+        self.probability_max = SparseTable(frame.precipitation_probability, largest=True)
+        self.temperature_min = SparseTable(np.where(np.isnan(frame.temperature), np.inf, frame.temperature),
+                                           largest=False)
+        self.temperature_max = SparseTable(np.where(np.isnan(frame.temperature), -np.inf, frame.temperature),
+                                           largest=True)
+        self.code_max = SparseTable(frame.weather_code, largest=True)
+        self.wind_max = SparseTable(frame.wind_speed, largest=True)
+
+    @classmethod
+    def for_frame(cls, frame: WeatherFrame) -> "IntervalAggregates":
+        """Agregatele frame-ului, construite o singura data pentru fiecare frame"""
+        aggregates = _cache.get(frame)
+        if aggregates is None:
+            aggregates = _cache[frame] = cls(frame)
+        return aggregates
+
+    def ranges(self, starts, ends) -> Tuple[np.ndarray, np.ndarray]:
+        """Pozitiile [lo, hi) ale inregistrarilor care acopera fiecare interval [start, end)"""
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        time = self.frame.time
+
+        if not len(time):
+            empty = np.zeros(len(starts), dtype=np.intp)
+            return empty, empty
+
+        lo = np.maximum(np.searchsorted(time, starts, side="right") - 1, 0)
+        lo = np.where(time[lo] + self.step <= starts, lo + 1, lo)
+        hi = np.maximum(np.searchsorted(time, ends, side="left"), lo)
+        return lo, hi
+
+    def aggregate(self, starts, ends) -> Dict[str, np.ndarray]:
+        """
+        Agregatele vectorizate pentru intervalele [start, end) (secunde, ora locala).
+        Valorile sunt valabile doar unde "samples" > 0.
+        """
+        lo, hi = self.ranges(starts, ends)
+        frame = self.frame
+        samples = hi - lo
+        valid = samples > 0
+        lo_valid, hi_valid = lo[valid], hi[valid]
+
+        def extreme(table: SparseTable, column: np.ndarray, fill) -> np.ndarray:
+            values = np.full(len(lo), fill, dtype=column.dtype)
+            if len(lo_valid):
+                values[valid] = column[table.query(lo_valid, hi_valid)]
+            return values
+
+        peak = np.full(len(lo), -1, dtype=np.intp)
+        probability = np.zeros(len(lo), dtype=frame.precipitation_probability.dtype)
+        if len(lo_valid):
+            peak[valid] = self.probability_max.query(lo_valid, hi_valid)
+            probability[valid] = frame.precipitation_probability[peak[valid]]
+
+        return {
+            "samples": samples,
+            "precipitation_probability_max": probability,
+            "precipitation_peak": peak,
+            "precipitation_sum": self.precipitation_prefix[hi] - self.precipitation_prefix[lo],
+            "temperature_min": extreme(self.temperature_min, frame.temperature, np.nan),
+            "temperature_max": extreme(self.temperature_max, frame.temperature, np.nan),
+            "weather_code": extreme(self.code_max, frame.weather_code, 0),
+            "wind_speed_max": extreme(self.wind_max, frame.wind_speed, np.nan)
+        }
+
+    def records(self, starts, ends, values: Optional[Dict[str, np.ndarray]] = None) -> List[Optional[Dict]]:
+        """
+        Agregatele ca dictionare (None pentru intervalele fara date).
+        `values` poate fi rezultatul unui apel aggregate() deja facut pentru aceleasi intervale.
+        Intervalele identice (ex. aceeasi ora in mai multe intrari) impart acelasi dictionar,
+        care nu trebuie modificat.
+        """
+        if values is None:
+            values = self.aggregate(starts, ends)
+        columns = {key: column.tolist() for key, column in values.items()}
+        frame_time = self.frame.time
+
+        records = []
+        shared = {}
+        for i, (start, end) in enumerate(zip(np.asarray(starts).tolist(), np.asarray(ends).tolist())):
+            if columns["samples"][i] <= 0:
+                records.append(None)
+                continue
+            record = shared.get((start, end))
+            if record is not None:
+                records.append(record)
+                continue
+
+            code = int(columns["weather_code"][i])
+            records.append({
+                "start": epoch_to_iso(start),
+                "end": epoch_to_iso(end),
+                "samples": columns["samples"][i],
+                "precipitation_probability_max": int(round(columns["precipitation_probability_max"][i])),
+                "precipitation_peak": epoch_to_iso(frame_time[columns["precipitation_peak"][i]]),
+                "precipitation_sum": round(columns["precipitation_sum"][i], 2),
+                "temperature_min": _optional(columns["temperature_min"][i]),
+                "temperature_max": _optional(columns["temperature_max"][i]),
+                "weather_code": code,
+                "weather_description": describe_weather_code(code),
+                "wind_speed_max": _optional(columns["wind_speed_max"][i])
+            })
+            shared[(start, end)] = records[-1]
+        return records
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if value != value else round(value, 2)
@@ -0,0 +1,156 @@
+"""
+Aparitiile datate ale intrarilor saptamanale din orar: toate aparitiile dintr-un orizont
+(ex. cele 16 zile ale prognozei) sau doar urmatoarea, cu reguli de saptamana para/impara
+si date exceptate (vacante, zile libere).
+
+Campuri optionale ale unei intrari:
+- "weeks": "impar" / "par" (sau "odd" / "even"); lipsa sau "toate" = in fiecare saptamana
+- "except": lista de date (ISO "2026-11-30" sau "30.11.2026"), sau un text cu datele
+  separate prin virgula / punct si virgula
+"""
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+WEEK = 7 * 24 * 3600
+MAX_WEEKS_AHEAD = 53
+
+WEEK_RULES = {
+    "": None, "toate": None, "all": None,
+    "impar": 1, "impare": 1, "odd": 1,
+    "par": 0, "pare": 0, "even": 0
+}
+WEEK_RULE_NAMES = {1: "impar", 0: "par"}
+
+# (data ISO, inceput, sfarsit) - secunde, ora locala
+Occurrence = Tuple[str, int, int]
+
+
+def parse_week_rule(value) -> Optional[int]:
+    """Paritatea saptamanilor in care are loc intrarea (1 = impare, 0 = pare), None = toate"""
+    if value is None:
+        return None
+    key = str(value).strip().lower()
+    if key not in WEEK_RULES:
+        raise ValueError(f"Regula de saptamani necunoscuta: {value}. Foloseste 'par' sau 'impar'")
+    return WEEK_RULES[key]
+
+
+def parse_exception_dates(value) -> FrozenSet[str]:
+    """Datele exceptate, ca multime de date ISO"""
+    if not value:
+        return frozenset()
+    if isinstance(value, str):
+        value = value.replace(";", ",").split(",")
+
+    dates = set()
+    for item in value:
+        item = str(item).strip()
+        if not item:
+            continue
+        try:
+            dates.add(date.fromisoformat(item).isoformat())
+        except ValueError:
+            try:
+                dates.add(datetime.strptime(item, "%d.%m.%Y").date().isoformat())
+            except ValueError:
+                raise ValueError(f"Data exceptata invalida: {item}. Foloseste AAAA-LL-ZZ sau ZZ.LL.AAAA")
+    return frozenset(dates)
+
+
+def week_number(day: date, semester_start: Optional[date] = None) -> int:
+    """
+    Numarul saptamanii: de la inceputul semestrului (saptamana 1 = saptamana care contine
+    `semester_start`), sau saptamana ISO cand inceputul semestrului nu este setat
+    """
+    if semester_start is None:
+        return day.isocalendar()[1]
+    first_monday = semester_start - timedelta(days=semester_start.weekday())
+    return (day - first_monday).days // 7 + 1
+
+
+class EntryRules:
+    """Regulile unei intrari (paritate, exceptii), citite o singura data"""
+
+    __slots__ = ("parity", "exceptions")
+
+    def __init__(self, entry: Dict):
+        try:
+            self.parity = parse_week_rule(entry.get("weeks"))
+        except ValueError:
+            self.parity = None
+        try:
+            self.exceptions = parse_exception_dates(entry.get("except"))
+        except ValueError:
+            self.exceptions = frozenset()
+
+    @property
+    def always(self) -> bool:
+        return self.parity is None and not self.exceptions
+
+    def allows(self, day: date, semester_start: Optional[date] = None) -> bool:
+        if self.parity is not None and week_number(day, semester_start) % 2 != self.parity:
+            return False
+        return day.isoformat() not in self.exceptions
+
+
+def weekly_occurrences(first: Occurrence, rules: EntryRules, horizon_end: Optional[int] = None,
+                       semester_start: Optional[date] = None) -> Iterator[Occurrence]:
+    """
+    Aparitiile permise de reguli, din saptamana in saptamana, incepand cu `first`.
+    Fara `horizon_end` generatorul se opreste dupa MAX_WEEKS_AHEAD saptamani.
+    """
+    date_iso, start, end = first
+    day = date.fromisoformat(date_iso)
+    always = rules.always
+    limit = horizon_end if horizon_end is not None else start + MAX_WEEKS_AHEAD * WEEK
+
+    while start < limit:
+        if always or rules.allows(day, semester_start):
+            yield day.isoformat(), start, end
+        day += timedelta(days=7)
+        start += WEEK
+        end += WEEK
+
+
+def expand_schedule(entries: Iterable[Dict], first_occurrence: Callable[[str, str], Optional[Occurrence]],
+                    horizon_end: Optional[int] = None,
+                    semester_start: Optional[date] = None) -> Iterator[Tuple[int, Optional[Occurrence]]]:
+    """
+    Genereaza (indexul intrarii, aparitie) pentru intrarile din orar:
+    - cu `horizon_end`: fiecare aparitie cu inceputul inainte de orizont
+    - fara: doar urmatoarea aparitie permisa a fiecarei intrari
+    In ambele moduri, o intrare fara nicio aparitie (zi sau interval invalid, nicio
+    aparitie permisa in orizont) este generata o data, cu None, ca sa nu dispara din tabel.
+
+    `first_occurrence(zi, interval)` da prima aparitie a intervalului; este apelata o
+    singura data pentru fiecare pereche (zi, interval).
+    """
+    firsts = {}
+    for index, entry in enumerate(entries):
+        day_name, time_range = entry.get("day"), entry.get("time")
+        first = None
+        if day_name and time_range:
+            key = (day_name, time_range)
+            if key not in firsts:
+                firsts[key] = first_occurrence(day_name, time_range)
+            first = firsts[key]
+
+        if first is None:
+            yield index, None
+            continue
+
+        rules = EntryRules(entry) if ("weeks" in entry or "except" in entry) else _ALWAYS
+        occurrences = weekly_occurrences(first, rules, horizon_end, semester_start)
+        if horizon_end is None:
+            yield index, next(occurrences, None)
+            continue
+
+        found = False
+        for occurrence in occurrences:
+            found = True
+            yield index, occurrence
+        if not found:
+            yield index, None
+
+
+_ALWAYS = EntryRules({})
@@ -0,0 +1,115 @@
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Stage = Tuple[str, Callable[[Any], Any]]
+
+
+class _JobSignals(QObject):
+    """Semnalele unui job; obiectul traieste in firul principal, deci sloturile ruleaza acolo"""
+    finished = pyqtSignal(object, dict)
+    failed = pyqtSignal(str)
+
+
+class ProcessingJob(QRunnable):
+    """
+    Ruleaza o succesiune de etape (ex. parse -> process -> persist) pe un fir din pool.
+    Rezultatul fiecarei etape este intrarea urmatoarei; intre etape se verifica anularea.
+    """
+
+    def __init__(self, stages: List[Stage], payload: Any, group: Optional[str] = None):
+        super().__init__()
+        self.stages = stages
+        self.payload = payload
+        self.group = group
+        self.cancelled = False
+        self.signals = _JobSignals()
+        self.submitted_at = time.perf_counter()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def run(self):
+        # referinta locala: semnalele traiesc cel putin cat ruleaza jobul
+        signals = self.signals
+        started = time.perf_counter()
+        timings = {"queue_ms": (started - self.submitted_at) * 1000}
+        value = self.payload
+
+        try:
+            for name, stage in self.stages:
+                if self.cancelled:
+                    break
+                stage_start = time.perf_counter()
+                value = stage(value)
+                timings[f"{name}_ms"] = (time.perf_counter() - stage_start) * 1000
+        except Exception as e:
+            _emit(signals, "failed", str(e))
+            return
+
+        timings["total_ms"] = (time.perf_counter() - started) * 1000
+        _emit(signals, "finished", value, timings)
+
+
+def _emit(signals: _JobSignals, name: str, *args):
+    """
+    Emite un semnal al jobului. Daca aplicatia (sau serviciul care a pornit jobul) a fost
+    distrusa intre timp, obiectul Qt nu mai exista si rezultatul nu mai are destinatar.
+    """
+    try:
+        getattr(signals, name).emit(*args)
+    except RuntimeError:
+        pass
+
+
+class ProcessingPipeline(QObject):
+    """
+    Pool de fire pentru prelucrarea datelor in afara firului GUI.
+    Callback-urile on_done(rezultat, timpi) / on_error(mesaj) sunt apelate in firul principal.
+    """
+
+    def __init__(self, max_threads: int = 2, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self.jobs: List[ProcessingJob] = []
+
+    def submit(self, stages: List[Stage], payload: Any,
+               on_done: Callable[[Any, Dict], None],
+               on_error: Optional[Callable[[str], None]] = None,
+               group: Optional[str] = None) -> ProcessingJob:
+        job = ProcessingJob(stages, payload, group)
+        job.setAutoDelete(False)
+
+        def finished(value, timings):
+            self._forget(job)
+            if not job.cancelled:
+                on_done(value, timings)
+
+        def failed(message):
+            self._forget(job)
+            if on_error is not None and not job.cancelled:
+                on_error(message)
+
+        job.signals.finished.connect(finished)
+        job.signals.failed.connect(failed)
+        self.jobs.append(job)
+        self.pool.start(job)
+        return job
+
+    def cancel_group(self, group: str):
+        """Anuleaza joburile din grup; rezultatele lor nu mai sunt livrate"""
+        for job in self.jobs:
+            if job.group == group:
+                job.cancel()
+
+    def cancel_all(self):
+        for job in self.jobs:
+            job.cancel()
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        return self.pool.waitForDone(msecs)
+
+    def _forget(self, job: ProcessingJob):
+        if job in self.jobs:
+            self.jobs.remove(job)
@@ -0,0 +1,93 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.transport import QtTransport, Transport, TransportRequest
+
+ReplyCallback = Callable[[Optional[bytes], Optional[str]], None]
+
+
+class _InFlightRequest:
+    __slots__ = ("handle", "callbacks")
+
+    def __init__(self):
+        self.handle: Optional[TransportRequest] = None
+        # (grup, callback): cererea este refolosita si de alte grupuri
+        self.callbacks: List[Tuple[Optional[str], ReplyCallback]] = []
+
+    def has_group(self, group: Optional[str]) -> bool:
+        return any(g == group for g, _ in self.callbacks)
+
+
+class RequestRegistry:
+    """
+    Evidenta cererilor HTTP in curs, peste un Transport (implicit QtTransport):
+    - fiecare cerere isi are propriul callback(data, error), apelat la final
+    - o cerere identica (acelasi URL) aflata deja in curs este refolosita
+    - cererile dintr-un grup pot fi anulate cand sunt inlocuite (ex. schimbarea locatiei);
+      anularea scoate doar callback-urile grupului, iar cererea HTTP este oprita abia
+      cand nu mai asteapta nimeni raspunsul
+    """
+
+    def __init__(self, transport: Optional[Transport] = None):
+        self.transport = transport or QtTransport()
+        self.in_flight: Dict[str, _InFlightRequest] = {}
+
+        self.sent = 0
+        self.coalesced = 0
+        self.aborted = 0
+
+    def get(self, url_string: str, callback: ReplyCallback, group: Optional[str] = None,
+            supersede: bool = False):
+        """
+        Trimite (sau refoloseste) o cerere GET.
+        Cu supersede=True, celelalte cereri din acelasi grup sunt anulate.
+        """
+        if supersede and group is not None:
+            self.abort_group(group, keep=url_string)
+
+        pending = self.in_flight.get(url_string)
+        if pending is not None:
+            pending.callbacks.append((group, callback))
+            self.coalesced += 1
+            return
+
+        pending = _InFlightRequest()
+        pending.callbacks.append((group, callback))
+        self.in_flight[url_string] = pending
+        self.sent += 1
+        pending.handle = self.transport.get(
+            url_string, lambda data, error: self._on_finished(url_string, pending, data, error)
+        )
+
+    def abort_group(self, group: str, keep: Optional[str] = None):
+        """
+        Anuleaza cererile din grup: callback-urile grupului nu mai sunt apelate, iar
+        cererile care nu mai au alte callback-uri sunt oprite
+        """
+        for url_string in [u for u, p in self.in_flight.items() if p.has_group(group) and u != keep]:
+            pending = self.in_flight[url_string]
+            pending.callbacks = [(g, callback) for g, callback in pending.callbacks if g != group]
+            if not pending.callbacks:
+                self._abort(url_string)
+
+    def abort_all(self):
+        for url_string in list(self.in_flight):
+            self._abort(url_string)
+
+    def is_pending(self, url_string: str, group: Optional[str] = None) -> bool:
+        """Cererea este in curs (cu `group`: si asteptata de acel grup)"""
+        pending = self.in_flight.get(url_string)
+        return pending is not None and (group is None or pending.has_group(group))
+
+    def _abort(self, url_string: str):
+        pending = self.in_flight.pop(url_string)
+        self.aborted += 1
+        pending.handle.abort()
+
+    def _on_finished(self, url_string: str, pending: _InFlightRequest,
+                     data: Optional[bytes], error: Optional[str]):
+        if self.in_flight.get(url_string) is not pending:
+            return
+
+        del self.in_flight[url_string]
+        for _, callback in pending.callbacks:
+            callback(data, error)
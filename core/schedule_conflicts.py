@@ -0,0 +1,191 @@
+"""
+Detectarea conflictelor din orar printr-o singura parcurgere (sweep line) a fiecarei zile,
+pe intrarile deja sortate dupa inceput de ScheduleIndex:
+- "person": doua intrari ale aceleiasi persoane / grupe care se suprapun
+- "location": aceeasi sala ocupata de doua intrari in acelasi timp
+- "transfer": intrari consecutive ale aceleiasi persoane, in cladiri diferite, cu o pauza
+  prea scurta intre ele
+
+Intrarile pot avea campul optional "group" (grupa sau persoana careia ii apartine intrarea);
+fara el tot orarul este al unei singure persoane. Intrarile din saptamani de paritati
+diferite (para / impara) nu intra niciodata in conflict.
+
+Numaratoarea conflictelor este exacta in O(n log n) (contoare pe paritate pentru intrarile
+active); doar primele MAX_REPORTED perechi sunt pastrate cu detalii.
+"""
+import re
+from heapq import heappop, heappush
+from typing import Dict, List, Optional
+
+from core.occurrences import WEEK_RULES
+from core.schedule_index import entry_minutes
+
+TRANSFER_MINUTES = 10
+MAX_REPORTED = 1000
+CONFLICT_TYPES = ("person", "location", "transfer")
+
+# cladirea este prefixul salii (C309 -> C, AN012 -> AN); fara cifre, numele intreg
+_BUILDING = re.compile(r"\s*([^\d\s]+)\s*\d")
+
+
+def building_of(location: str) -> str:
+    match = _BUILDING.match(location)
+    return match.group(1).upper() if match else location.strip().casefold()
+
+
+def _parity(entry: Dict) -> Optional[int]:
+    return WEEK_RULES.get(entry.get("weeks") or "")
+
+
+def _compatible(first: Optional[int], second: Optional[int]) -> bool:
+    return first is None or second is None or first == second
+
+
+def _clock(minutes: int) -> str:
+    minutes %= 24 * 60
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+class _Active:
+    """Intrarile active (inca neterminate) ale unei chei: heap dupa sfarsit + contoare pe paritate"""
+
+    __slots__ = ("heap", "counts")
+
+    def __init__(self):
+        self.heap = []
+        # [toate saptamanile, saptamani pare, saptamani impare]
+        self.counts = [0, 0, 0]
+
+    def expire(self, start: int):
+        heap = self.heap
+        while heap and heap[0][0] <= start:
+            parity = heappop(heap)[3]
+            self.counts[0 if parity is None else parity + 1] -= 1
+
+    def overlapping(self, parity: Optional[int]) -> int:
+        """Cate intrari active pot avea loc in aceeasi saptamana cu o intrare de paritatea data"""
+        if parity is None:
+            return sum(self.counts)
+        return self.counts[0] + self.counts[parity + 1]
+
+    def push(self, end: int, order: int, entry: Dict, parity: Optional[int]):
+        heappush(self.heap, (end, order, entry, parity))
+        self.counts[0 if parity is None else parity + 1] += 1
+
+
+class ConflictReport:
+    """Rezultatul detectarii: numaratori pe tip, zi, persoana si sala, plus primele conflicte"""
+
+    def __init__(self, max_reported: int = MAX_REPORTED):
+        self.max_reported = max_reported
+        self.counts = {kind: 0 for kind in CONFLICT_TYPES}
+        self.by_day: Dict[str, int] = {}
+        self.by_person: Dict[str, int] = {}
+        self.by_location: Dict[str, int] = {}
+        self.conflicts: List[Dict] = []
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > len(self.conflicts)
+
+    @property
+    def full(self) -> bool:
+        return len(self.conflicts) >= self.max_reported
+
+    def count(self, kind: str, day: str, key: str, amount: int = 1):
+        self.counts[kind] += amount
+        self.by_day[day] = self.by_day.get(day, 0) + amount
+        target = self.by_location if kind == "location" else self.by_person
+        target[key] = target.get(key, 0) + amount
+
+    def add(self, kind: str, day: str, key: str, first: Dict, second: Dict, start: int, end: int):
+        if not self.full:
+            self.conflicts.append({
+                "type": kind,
+                "day": day,
+                "key": key,
+                "start": _clock(start),
+                "end": _clock(end),
+                "entries": (first, second)
+            })
+
+    def to_dict(self) -> Dict:
+        return {
+            "total": self.total,
+            "counts": dict(self.counts),
+            "by_day": dict(self.by_day),
+            "by_person": dict(self.by_person),
+            "by_location": dict(self.by_location),
+            "conflicts": list(self.conflicts),
+            "truncated": self.truncated
+        }
+
+
+def describe_conflict(conflict: Dict) -> str:
+    """Textul unui conflict, pentru interfata si rapoarte"""
+    first, second = conflict["entries"]
+    window = conflict["start"] if conflict["start"] == conflict["end"] else f"{conflict['start']}-{conflict['end']}"
+    when = f"{conflict['day']} {window}"
+    if conflict["type"] == "location":
+        return f"{when}: sala {conflict['key']} este ocupata de {first['subject']} si {second['subject']}"
+    if conflict["type"] == "transfer":
+        pause = entry_minutes(second)[0] - entry_minutes(first)[1]
+        return (f"{when}: {first['subject']} ({first['location']}) -> {second['subject']} "
+                f"({second['location']}), cladire diferita cu {pause} min pauza")
+    owner = f" ({conflict['key']})" if conflict["key"] else ""
+    return f"{when}: {first['subject']} se suprapune cu {second['subject']}{owner}"
+
+
+def find_conflicts(index, transfer_minutes: int = TRANSFER_MINUTES,
+                   max_reported: int = MAX_REPORTED) -> ConflictReport:
+    """Conflictele tuturor zilelor dintr-un ScheduleIndex (listele zilelor sunt deja sortate)"""
+    report = ConflictReport(max_reported)
+    for day in index.days.values():
+        if day.items:
+            _sweep_day(day.items, transfer_minutes, report)
+    return report
+
+
+def _sweep_day(items, transfer_minutes: int, report: ConflictReport):
+    day_name = items[0][2]["day"]
+    active: Dict[tuple, _Active] = {}
+    # ultima intrare (cu sfarsitul cel mai tarziu) a fiecarei persoane
+    latest: Dict[str, tuple] = {}
+
+    for order, (start, end, entry) in enumerate(items):
+        parity = _parity(entry)
+        person = entry.get("group") or ""
+        location = entry.get("location") or ""
+
+        for kind, key in (("person", person), ("location", location)):
+            if kind == "location" and not key:
+                continue
+            group = active.get((kind, key))
+            if group is None:
+                group = active[(kind, key)] = _Active()
+            group.expire(start)
+
+            overlapping = group.overlapping(parity)
+            if overlapping:
+                report.count(kind, day_name, key, overlapping)
+                if not report.full:
+                    for other_end, _, other, other_parity in sorted(group.heap, key=lambda item: item[1]):
+                        if _compatible(parity, other_parity):
+                            report.add(kind, day_name, key, other, entry, start, min(end, other_end))
+            group.push(end, order, entry, parity)
+
+        previous = latest.get(person)
+        if previous is not None:
+            previous_end, previous_entry, previous_parity = previous
+            previous_location = previous_entry.get("location") or ""
+            if (0 <= start - previous_end <= transfer_minutes and location and previous_location
+                    and building_of(location) != building_of(previous_location)
+                    and _compatible(parity, previous_parity)):
+                report.count("transfer", day_name, person)
+                report.add("transfer", day_name, person, previous_entry, entry, previous_end, start)
+        if previous is None or end > previous[0]:
+            latest[person] = (end, entry, parity)
@@ -0,0 +1,213 @@
+"""
+Reprezentarea compacta a intrarilor din orar:
+- ScheduleEntry: o intrare validata, cu __slots__, sirurile internate (zilele, salile si
+  materiile se repeta in mii de randuri) si minutele de inceput/sfarsit deja calculate
+- EnrichedEntry: o intrare imbinata cu prognoza; pastreaza o referinta la intrarea din
+  orar in loc sa-i copieze campurile
+
+Ambele se comporta ca dictionarele vechi (Mapping), la fel ca HourlyRecord, deci codul
+care foloseste entry["day"] / entry.get(...) nu se schimba. Conversia spre formatul
+dictionar (pentru JSON / CSV) se face cu to_dict() / to_dicts().
+"""
+import sys
+from collections.abc import Mapping, MutableMapping
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.schedule_reader import parse_time_range
+
+DAY_MINUTES = 24 * 60
+
+_intern = sys.intern
+_MISSING = object()
+
+SCHEDULE_FIELDS = ("day", "time", "subject", "location")
+OPTIONAL_FIELDS = ("group", "weeks", "except")
+ENRICHED_FIELDS = ("date", "weather", "interval_weather")
+
+
+@lru_cache(maxsize=4096)
+def range_minutes(time_range: str) -> Tuple[int, int]:
+    """
+    [inceput, sfarsit) in minute de la miezul noptii. Un sfarsit la 00:00 este miezul
+    noptii de la finalul zilei (sfarsitul 24 * 60), ca in DataProcessor._target_for.
+    Un orar are putine intervale distincte; fiecare este parsat o singura data.
+    """
+    start, end = parse_time_range(time_range)
+    if end <= start:
+        end += DAY_MINUTES
+    return start, end
+
+
+class ScheduleEntry(Mapping):
+    """Intrare validata din orar (imutabila); cheile sunt cele ale dictionarelor vechi"""
+
+    __slots__ = ("day", "time", "subject", "location", "group", "weeks", "except_dates", "start", "end")
+
+    def __init__(self, day: str, time: str, subject: str, location: str = "", group: str = "",
+                 weeks: Optional[str] = None, except_dates: Iterable[str] = ()):
+        self.day = _intern(day)
+        self.time = _intern(time)
+        self.subject = _intern(subject)
+        self.location = _intern(location)
+        self.group = _intern(group)
+        self.weeks = weeks
+        self.except_dates = tuple(map(_intern, except_dates)) if except_dates else ()
+        self.start, self.end = range_minutes(self.time)
+
+    @classmethod
+    def from_dict(cls, entry: Dict) -> "ScheduleEntry":
+        """Din formatul dictionar (campuri deja validate)"""
+        return cls(entry["day"], entry["time"], entry["subject"], entry.get("location") or "",
+                   entry.get("group") or "", entry.get("weeks"), entry.get("except") or ())
+
+    def to_dict(self) -> Dict:
+        """Formatul dictionar folosit de export_to_json / export_to_csv"""
+        entry = {"day": self.day, "time": self.time, "subject": self.subject, "location": self.location}
+        if self.group:
+            entry["group"] = self.group
+        if self.weeks is not None:
+            entry["weeks"] = self.weeks
+        if self.except_dates:
+            entry["except"] = list(self.except_dates)
+        return entry
+
+    copy = to_dict
+
+    def get(self, key: str, default=None):
+        # mai rapid decat Mapping.get (fara KeyError)
+        if key in SCHEDULE_FIELDS:
+            return getattr(self, key)
+        if key == "group":
+            return self.group or default
+        if key == "weeks":
+            return default if self.weeks is None else self.weeks
+        if key == "except":
+            return list(self.except_dates) if self.except_dates else default
+        return default
+
+    def __getitem__(self, key: str):
+        if key in SCHEDULE_FIELDS:
+            return getattr(self, key)
+        if key == "group" and self.group:
+            return self.group
+        if key == "weeks" and self.weeks is not None:
+            return self.weeks
+        if key == "except" and self.except_dates:
+            return list(self.except_dates)
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from SCHEDULE_FIELDS
+        if self.group:
+            yield "group"
+        if self.weeks is not None:
+            yield "weeks"
+        if self.except_dates:
+            yield "except"
+
+    def __len__(self) -> int:
+        return 4 + bool(self.group) + (self.weeks is not None) + bool(self.except_dates)
+
+    def _key(self) -> tuple:
+        return (self.day, self.time, self.subject, self.location, self.group, self.weeks, self.except_dates)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is ScheduleEntry:
+            return self._key() == other._key()
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"ScheduleEntry({self.to_dict()!r})"
+
+
+class EnrichedEntry(MutableMapping):
+    """
+    Intrarea din orar plus campurile imbinarii ("date", "weather", "interval_weather").
+    Campurile intrarii sunt citite din `entry` (nu se copiaza); cheile atribuite ulterior
+    (altele decat cele ale imbinarii) ajung intr-un dictionar separat, creat doar la nevoie,
+    care are prioritate fata de intrarea din orar.
+    """
+
+    __slots__ = ("entry", "date", "weather", "interval_weather", "extra")
+
+    def __init__(self, entry: Mapping, date=_MISSING, weather=None, interval_weather=None):
+        self.entry = entry
+        self.date = _intern(date) if type(date) is str else date
+        self.weather = weather
+        self.interval_weather = interval_weather
+        self.extra: Optional[Dict] = None
+
+    def copy(self) -> "EnrichedEntry":
+        copied = EnrichedEntry(self.entry, self.date, self.weather, self.interval_weather)
+        if self.extra:
+            copied.extra = dict(self.extra)
+        return copied
+
+    def to_dict(self) -> Dict:
+        return dict(self)
+
+    def get(self, key: str, default=None):
+        if key == "weather":
+            return self.weather
+        if key == "interval_weather":
+            return self.interval_weather
+        if key == "date":
+            return default if self.date is _MISSING else self.date
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        return self.entry.get(key, default)
+
+    def __getitem__(self, key: str):
+        if key == "weather":
+            return self.weather
+        if key == "interval_weather":
+            return self.interval_weather
+        if key == "date":
+            if self.date is _MISSING:
+                raise KeyError(key)
+            return self.date
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        return self.entry[key]
+
+    def __setitem__(self, key: str, value):
+        if key in ENRICHED_FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key == "date" and self.date is not _MISSING:
+            self.date = _MISSING
+        elif key in ("weather", "interval_weather"):
+            setattr(self, key, None)
+        elif self.extra and key in self.extra:
+            del self.extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        yield from self.entry
+        if self.date is not _MISSING:
+            yield "date"
+        yield "weather"
+        yield "interval_weather"
+        if self.extra:
+            yield from (key for key in self.extra if key not in self.entry)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"EnrichedEntry({dict(self)!r})"
+
+
+def to_dicts(entries: Iterable[Mapping]) -> List[Dict]:
+    """Intrarile in formatul dictionar (de ex. pentru json.dump)"""
+    return [entry.to_dict() if hasattr(entry, "to_dict") else dict(entry) for entry in entries]
@@ -0,0 +1,219 @@
+"""
+Indexul orarului pe zile si intervale orare: pentru fiecare zi, intrarile sortate dupa
+inceput si un arbore de intervale implicit peste ele (ca in cgranges: arborele este
+chiar lista sortata, augmentata cu sfarsitul maxim al fiecarui subarbore).
+
+Interogarile (ce are loc la ora t, ce se suprapune cu o fereastra) costa O(log n + k).
+Adaugarea si stergerea unei intrari modifica doar lista zilei ei; augmentarea zilei
+este refacuta (O(n) pe zi) la prima interogare de dupa modificare.
+"""
+from bisect import bisect_left, insort
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from core.schedule_entry import ScheduleEntry, range_minutes
+
+# sub acest nivel subarborele este parcurs liniar (mai rapid decat recursia)
+_SCAN_LEVEL = 3
+
+Minutes = Union[int, str]
+
+
+def day_key(day_name: str) -> str:
+    return day_name.strip().lower()
+
+
+def entry_minutes(entry: Dict) -> Tuple[int, int]:
+    """
+    [inceput, sfarsit) in minute de la miezul noptii; un sfarsit la 00:00 este
+    miezul noptii de la finalul zilei, ca in DataProcessor._target_for.
+    """
+    if type(entry) is ScheduleEntry:
+        return entry.start, entry.end
+    return range_minutes(entry["time"])
+
+
+def to_minutes(value: Minutes) -> int:
+    """Minutele pentru "HH:MM" (sau un numar de minute deja calculat)"""
+    if isinstance(value, int):
+        return value
+    hours, _, minutes = value.strip().partition(":")
+    return int(hours) * 60 + int(minutes or 0)
+
+
+_bounds = itemgetter(0, 1)
+
+
+class DayIndex:
+    """Intrarile unei zile, (inceput, sfarsit, intrare), sortate dupa (inceput, sfarsit) si apoi ordinea adaugarii"""
+
+    def __init__(self):
+        self.items: List[Tuple[int, int, Dict]] = []
+        self._tree: Optional[Tuple[List[int], List[int], List[int], int]] = None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, start: int, end: int, entry: Dict):
+        insort(self.items, (start, end, entry), key=_bounds)
+        self._tree = None
+
+    def remove(self, start: int, end: int, entry: Dict) -> bool:
+        """Sterge intrarea (dupa identitate) dintre cele cu aceleasi minute"""
+        items = self.items
+        position = bisect_left(items, (start, end), key=_bounds)
+        while position < len(items) and _bounds(items[position]) == (start, end):
+            if items[position][2] is entry:
+                del items[position]
+                self._tree = None
+                return True
+            position += 1
+        return False
+
+    def entries(self) -> List[Dict]:
+        return [item[2] for item in self.items]
+
+    def overlapping(self, start: int, end: int) -> Iterator[Dict]:
+        """Intrarile cu [inceput, sfarsit) care intersecteaza [start, end), in ordinea inceputului"""
+        if not self.items or start >= end:
+            return
+        starts, ends, max_end, max_level = self._build()
+        items = self.items
+        count = len(items)
+
+        # parcurgere in ordine (stanga, nod, dreapta) cu stiva explicita: (nivel, nod, vizitat)
+        stack = [(max_level, (1 << max_level) - 1, False)]
+        while stack:
+            level, node, visited = stack.pop()
+            if level <= _SCAN_LEVEL:
+                first = node >> level << level
+                last = min(first + (1 << (level + 1)) - 1, count)
+                for i in range(first, last):
+                    if starts[i] >= end:
+                        break
+                    if start < ends[i]:
+                        yield items[i][2]
+            elif not visited:
+                stack.append((level, node, True))
+                left = node - (1 << (level - 1))
+                if left >= count or max_end[left] > start:
+                    stack.append((level - 1, left, False))
+            elif node < count and starts[node] < end:
+                if start < ends[node]:
+                    yield items[node][2]
+                stack.append((level - 1, node + (1 << (level - 1)), False))
+
+    def _build(self) -> Tuple[List[int], List[int], List[int], int]:
+        """Augmentarea: max_end[i] = sfarsitul maxim din subarborele cu radacina i"""
+        if self._tree is not None:
+            return self._tree
+
+        starts = [item[0] for item in self.items]
+        ends = [item[1] for item in self.items]
+        max_end = list(ends)
+        count = len(ends)
+
+        last_node = 0
+        last_max = ends[0] if count else 0
+        for i in range(0, count, 2):
+            last_node, last_max = i, ends[i]
+
+        level = 1
+        while 1 << level <= count:
+            half = 1 << (level - 1)
+            for node in range((half << 1) - 1, count, half << 2):
+                right = max_end[node + half] if node + half < count else last_max
+                max_end[node] = max(ends[node], max_end[node - half], right)
+            last_node = last_node - half if (last_node >> level) & 1 else last_node + half
+            if last_node < count and max_end[last_node] > last_max:
+                last_max = max_end[last_node]
+            level += 1
+
+        self._tree = (starts, ends, max_end, level - 1)
+        return self._tree
+
+
+class ScheduleIndex:
+    """
+    Indexul tuturor intrarilor: zi -> DayIndex, plus numaratoarea intervalelor orare.
+    Intrarile sunt identificate prin obiect, deci pot fi sterse fara pozitia lor.
+    """
+
+    def __init__(self):
+        self.days: Dict[str, DayIndex] = {}
+        self.time_counts: Counter = Counter()
+        self._time_slots: Optional[List[str]] = None
+        # creste la fiecare modificare; rezultatele derivate (ex. conflictele) sunt memorate per versiune
+        self.version = 0
+
+    def __len__(self) -> int:
+        return sum(len(day) for day in self.days.values())
+
+    def rebuild(self, entries: List[Dict]):
+        """Indexul unui orar intreg: fiecare zi este sortata o singura data"""
+        self.days = {}
+        self.time_counts = Counter(entry["time"] for entry in entries)
+        self._time_slots = None
+        self.version += 1
+
+        keys = {}
+        for entry in entries:
+            name = entry["day"]
+            key = keys.get(name)
+            if key is None:
+                key = keys[name] = day_key(name)
+            day = self.days.get(key)
+            if day is None:
+                day = self.days[key] = DayIndex()
+            day.items.append(entry_minutes(entry) + (entry,))
+        # sortare stabila: la egalitate ramane ordinea adaugarii
+        for day in self.days.values():
+            day.items.sort(key=_bounds)
+
+    def add(self, entry: Dict):
+        """Adauga o intrare validata (cu "day" si "time")"""
+        key = day_key(entry["day"])
+        day = self.days.get(key)
+        if day is None:
+            day = self.days[key] = DayIndex()
+        day.add(*entry_minutes(entry), entry)
+        self._count_time(entry["time"], 1)
+        self.version += 1
+
+    def remove(self, entry: Dict):
+        day = self.days.get(day_key(entry["day"]))
+        if day is not None and day.remove(*entry_minutes(entry), entry):
+            self._count_time(entry["time"], -1)
+            self.version += 1
+
+    def entries_for_day(self, day_name: str) -> List[Dict]:
+        """Intrarile zilei, in ordinea orei de inceput"""
+        day = self.days.get(day_key(day_name))
+        return day.entries() if day is not None else []
+
+    def entries_at(self, day_name: str, moment: Minutes) -> List[Dict]:
+        """Intrarile care au loc in ziua data la momentul dat ("HH:MM" sau minute)"""
+        minute = to_minutes(moment)
+        return self.entries_overlapping(day_name, minute, minute + 1)
+
+    def entries_overlapping(self, day_name: str, start: Minutes, end: Minutes) -> List[Dict]:
+        """Intrarile din ziua data care se suprapun cu fereastra [start, end)"""
+        day = self.days.get(day_key(day_name))
+        if day is None:
+            return []
+        return list(day.overlapping(to_minutes(start), to_minutes(end)))
+
+    def time_slots(self) -> List[str]:
+        """Intervalele orare unice, sortate (lista este refolosita pana la urmatoarea modificare)"""
+        if self._time_slots is None:
+            self._time_slots = sorted(self.time_counts)
+        return self._time_slots
+
+    def _count_time(self, time_range: str, delta: int):
+        count = self.time_counts[time_range] + delta
+        if count > 0:
+            self.time_counts[time_range] = count
+        else:
+            del self.time_counts[time_range]
+        self._time_slots = None
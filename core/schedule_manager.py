@@ -1,18 +1,72 @@
 import json
 import csv
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.occurrences import WEEK_RULE_NAMES, parse_exception_dates, parse_week_rule
+from core.schedule_conflicts import TRANSFER_MINUTES, find_conflicts
+from core.schedule_entry import OPTIONAL_FIELDS, ScheduleEntry, to_dicts
+from core.schedule_index import Minutes, ScheduleIndex
+from core.schedule_reader import Progress, ScheduleFormatError, iter_csv_rows, iter_json_entries
+
+REQUIRED_FIELDS = ("day", "time", "subject")
+CSV_FIELDS = ("day", "time", "subject", "location")
 
 class ScheduleManager:
     """Gestioneaza incarcarea si validarea orarului personalizat"""
     
     def __init__(self):
+        self._index = ScheduleIndex()
+        self._index_stale = False
+        self._conflicts = None
         self.schedule = []
         self.days_of_week = ["Luni", "Marți", "Miercuri", "Joi", "Vineri", "Sâmbătă", "Duminică"]
         
-    def load_from_json(self, file_path: str) -> Dict:
+    @property
+    def schedule(self) -> List[Dict]:
+        return self._schedule
+        
+    @schedule.setter
+    def schedule(self, entries: List[Dict]):
+        """Inlocuieste orarul (intrari validate); indexul se reconstruieste la prima interogare"""
+        self._schedule = entries
+        self._index_stale = True
+        
+    @property
+    def index(self) -> ScheduleIndex:
+        if self._index_stale:
+            self._index.rebuild(self._schedule)
+            self._index_stale = False
+        return self._index
+        
+    def add_entry(self, entry: Dict) -> ScheduleEntry:
+        """Valideaza si adauga o intrare; indexul este actualizat doar pentru ziua ei"""
+        validated = self._validate_entry(entry)
+        self._schedule.append(validated)
+        if not self._index_stale:
+            self._index.add(validated)
+        return validated
+        
+    def update_entry(self, position: int, entry: Dict) -> ScheduleEntry:
+        """Inlocuieste intrarea de pe pozitia data cu una validata"""
+        validated = self._validate_entry(entry)
+        previous, self._schedule[position] = self._schedule[position], validated
+        if not self._index_stale:
+            self._index.remove(previous)
+            self._index.add(validated)
+        return validated
+        
+    def remove_entry(self, position: int) -> ScheduleEntry:
+        """Sterge si intoarce intrarea de pe pozitia data"""
+        entry = self._schedule.pop(position)
+        if not self._index_stale:
+            self._index.remove(entry)
+        return entry
+        
+    def load_from_json(self, file_path: str, progress: Optional[Progress] = None) -> Dict:
         """
-        Incarca orarul din fisier JSON
+        Incarca orarul din fisier JSON, citit incremental (intrare cu intrare)
         
         Format asteptat:
         {
@@ -21,95 +75,116 @@ class ScheduleManager:
                     "day": "Luni",
                     "time": "08:00-10:00",
                     "subject": "Programare",
-                    "location": "C309"  # optional
+                    "location": "C309",  # optional
+                    "group": "332AB",  # optional: grupa / persoana careia ii apartine intrarea
+                    "weeks": "impar",  # optional: "par" / "impar"
+                    "except": ["2026-12-22"]  # optional: datele in care nu are loc
                 }
             ]
         }
+        
+        Intrarile invalide nu opresc incarcarea: sunt raportate in "errors" (linie si mesaj),
+        iar orarul se inlocuieste cu intrarile valide. Daca nicio intrare nu este valida,
+        orarul curent ramane neschimbat. `progress(randuri, octeti, total)` este apelat periodic.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            if "schedule" not in data:
-                raise ValueError("Fisierul JSON trebuie sa contina cheia 'schedule'")
-                
-            schedule_entries = data["schedule"]
-            
-            validated_schedule = []
-            for entry in schedule_entries:
-                validated_entry = self._validate_entry(entry)
-                validated_schedule.append(validated_entry)
-                
-            self.schedule = validated_schedule
-            return {"status": "success", "schedule": validated_schedule}
-            
-        except json.JSONDecodeError as e:
-            return {"status": "error", "message": f"Eroare la citirea JSON: {str(e)}"}
+            return self._load_rows(iter_json_entries(file_path, "schedule", progress))
+        except ScheduleFormatError as e:
+            return {"status": "error", "message": str(e)}
         except Exception as e:
             return {"status": "error", "message": f"Eroare: {str(e)}"}
             
-    def load_from_csv(self, file_path: str) -> Dict:
+    def load_from_csv(self, file_path: str, progress: Optional[Progress] = None) -> Dict:
         """
-        Incarca orarul din fisier CSV
+        Incarca orarul din fisier CSV, citit incremental (rand cu rand)
         
-        Format asteptat (cu header):
-        day,time,subject,location
-        Luni,08:00-10:00,Programare,C309
+        Format asteptat (cu header; coloanele group, weeks si except sunt optionale):
+        day,time,subject,location,group,weeks,except
+        Luni,08:00-10:00,Programare,C309,332AB,impar,2026-12-22;2027-01-05
+        
+        Erorile si progresul sunt raportate ca la load_from_json.
         """
         try:
-            schedule_entries = []
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                csv_reader = csv.DictReader(f)
-                
-                for row in csv_reader:
-                    entry = {
-                        "day": row.get("day", "").strip(),
-                        "time": row.get("time", "").strip(),
-                        "subject": row.get("subject", "").strip(),
-                        "location": row.get("location", "").strip() if "location" in row else ""
-                    }
-                    
-                    validated_entry = self._validate_entry(entry)
-                    schedule_entries.append(validated_entry)
-                    
-            self.schedule = schedule_entries
-            return {"status": "success", "schedule": schedule_entries}
-            
+            rows = ((line, self._csv_entry(row)) for line, row in iter_csv_rows(file_path, progress))
+            return self._load_rows(rows)
         except Exception as e:
             return {"status": "error", "message": f"Eroare la citirea CSV: {str(e)}"}
             
-    def _validate_entry(self, entry: Dict) -> Dict:
-        """Valideaza o intrare din orar"""
-        if "day" not in entry or not entry["day"]:
-            raise ValueError("Campul 'day' lipseste sau este gol")
-        if "time" not in entry or not entry["time"]:
-            raise ValueError("Campul 'time' lipseste sau este gol")
-        if "subject" not in entry or not entry["subject"]:
-            raise ValueError("Campul 'subject' lipseste sau este gol")
-            
-        time_str = entry["time"]
-        if "-" not in time_str:
-            raise ValueError(f"Format invalid pentru timp: {time_str}. Foloseste formatul HH:MM-HH:MM")
+    def _load_rows(self, rows: Iterable[Tuple[int, object]]) -> Dict:
+        """Valideaza intrarile pe rand, colectand erorile in loc sa se opreasca la prima"""
+        schedule_entries = []
+        errors = []
+        for line, entry in rows:
+            try:
+                schedule_entries.append(self._validate_entry(entry))
+            except ValueError as e:
+                errors.append({"line": line, "message": str(e)})
+                
+        if errors and not schedule_entries:
+            return {"status": "error", "message": f"Niciun rand valid ({len(errors)} erori)", "errors": errors}
             
-        start_time, end_time = time_str.split("-")
+        self.schedule = schedule_entries
+        return {"status": "success", "schedule": schedule_entries, "errors": errors}
         
-        try:
-            datetime.strptime(start_time.strip(), "%H:%M")
-            datetime.strptime(end_time.strip(), "%H:%M")
-        except ValueError:
-            raise ValueError(f"Format invalid pentru timp: {time_str}")
+    @staticmethod
+    def _csv_entry(row: Dict) -> Dict:
+        """Intrarea corespunzatoare unui rand CSV (celulele lipsa devin texte goale)"""
+        entry = {field: (row.get(field) or "").strip() for field in CSV_FIELDS}
+        for field in OPTIONAL_FIELDS:
+            value = (row.get(field) or "").strip()
+            if value:
+                entry[field] = value
+        return entry
+        
+    def _validate_entry(self, entry: Dict) -> ScheduleEntry:
+        """Valideaza o intrare din orar (dictionar sau ScheduleEntry)"""
+        if not isinstance(entry, Mapping):
+            raise ValueError("Fiecare intrare din orar trebuie sa fie un obiect")
+        for field in REQUIRED_FIELDS:
+            value = entry.get(field)
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError(f"Campul '{field}' lipseste sau este gol")
+                
+        location = entry.get("location") or ""
+        group = entry.get("group") or ""
+        if not isinstance(location, str) or not isinstance(group, str):
+            raise ValueError("Campurile 'location' si 'group' trebuie sa fie text")
             
-        return {
-            "day": entry["day"].strip(),
-            "time": entry["time"].strip(),
-            "subject": entry["subject"].strip(),
-            "location": entry.get("location", "").strip()
-        }
+        parity = parse_week_rule(entry.get("weeks"))
+        exceptions = parse_exception_dates(entry.get("except"))
+        
+        # ScheduleEntry valideaza intervalul orar (parsat o singura data pentru fiecare text distinct)
+        return ScheduleEntry(
+            entry["day"].strip(),
+            entry["time"].strip(),
+            entry["subject"].strip(),
+            location.strip(),
+            group.strip(),
+            WEEK_RULE_NAMES[parity] if parity is not None else None,
+            sorted(exceptions)
+        )
         
     def get_entries_for_day(self, day_name: str) -> List[Dict]:
-        """Returneaza toate intrarile pentru o anumita zi"""
-        return [entry for entry in self.schedule if entry["day"].lower() == day_name.lower()]
+        """Returneaza toate intrarile pentru o anumita zi, in ordinea orei de inceput"""
+        return self.index.entries_for_day(day_name)
+        
+    def get_entries_at(self, day_name: str, moment: Minutes) -> List[Dict]:
+        """Intrarile care au loc intr-o zi la un moment dat ("HH:MM" sau minute de la miezul noptii)"""
+        return self.index.entries_at(day_name, moment)
+        
+    def get_entries_overlapping(self, day_name: str, start: Minutes, end: Minutes) -> List[Dict]:
+        """Intrarile dintr-o zi care se suprapun cu fereastra [start, end)"""
+        return self.index.entries_overlapping(day_name, start, end)
+        
+    def find_conflicts(self, transfer_minutes: int = TRANSFER_MINUTES) -> Dict:
+        """
+        Suprapunerile din orar (aceeasi persoana / grupa, aceeasi sala) si schimbarile de cladire
+        fara pauza suficienta; rezultatul este memorat pana la urmatoarea modificare a orarului
+        """
+        key = (self.index.version, transfer_minutes)
+        if self._conflicts is None or self._conflicts[0] != key:
+            self._conflicts = (key, find_conflicts(self.index, transfer_minutes).to_dict())
+        return self._conflicts[1]
         
     def get_entries_for_tomorrow(self) -> List[Dict]:
         """Returneaza intrarile pentru ziua de maine"""
@@ -123,16 +198,13 @@ class ScheduleManager:
         
     def get_time_slots(self) -> List[str]:
         """Returneaza o lista cu toate intervalele orare unice din orar"""
-        time_slots = set()
-        for entry in self.schedule:
-            time_slots.add(entry["time"])
-        return sorted(list(time_slots))
+        return list(self.index.time_slots())
         
     def export_to_json(self, file_path: str) -> bool:
         """Exporta orarul curent in format JSON"""
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump({"schedule": self.schedule}, f, ensure_ascii=False, indent=2)
+                json.dump({"schedule": to_dicts(self.schedule)}, f, ensure_ascii=False, indent=2)
             return True
         except Exception as e:
             print(f"Eroare la export JSON: {e}")
@@ -146,12 +218,17 @@ class ScheduleManager:
                     return False
                     
                 fieldnames = ["day", "time", "subject", "location"]
+                fieldnames += [field for field in OPTIONAL_FIELDS
+                               if any(field in entry for entry in self.schedule)]
                 
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 
                 for entry in self.schedule:
-                    writer.writerow(entry)
+                    row = entry.to_dict()
+                    if row.get("except"):
+                        row["except"] = ";".join(row["except"])
+                    writer.writerow(row)
                     
             return True
         except Exception as e:
@@ -0,0 +1,208 @@
+"""
+Citirea incrementala a fisierelor de orar (CSV si JSON), rand cu rand, cu memorie
+limitata: fisierul se citeste in blocuri, iar fiecare intrare este intoarsa impreuna
+cu linia ei din fisier, ca erorile de validare sa poata fi raportate precis.
+"""
+import codecs
+import csv
+import json
+import os
+import re
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+CHUNK_SIZE = 64 * 1024
+PROGRESS_EVERY = 1000
+
+# HH:MM-HH:MM (ca strptime "%H:%M": ora si minutul pot avea o singura cifra)
+_TIME_RANGE = re.compile(r"\s*(\d{1,2}):(\d{1,2})\s*-\s*(\d{1,2}):(\d{1,2})\s*")
+_WHITESPACE = re.compile(r"\s*")
+_NUMBER_TAIL = re.compile(r"[\d.eE+-]*")
+
+# progress(randuri citite, octeti cititi, dimensiunea fisierului)
+Progress = Callable[[int, int, int], None]
+
+
+class ScheduleFormatError(ValueError):
+    """Fisierul nu mai poate fi citit (JSON invalid, structura gresita)"""
+
+    def __init__(self, message: str, line: Optional[int] = None):
+        super().__init__(message if line is None else f"Linia {line}: {message}")
+        self.line = line
+
+
+def parse_time_range(time_range: str) -> Tuple[int, int]:
+    """
+    Minutele de la miezul noptii pentru inceputul si sfarsitul intervalului "HH:MM-HH:MM".
+    Sfarsitul trebuie sa fie dupa inceput; "00:00" ca sfarsit inseamna miezul noptii de la
+    finalul zilei (ex. 22:00-00:00).
+    """
+    match = _TIME_RANGE.fullmatch(time_range)
+    if match is None:
+        raise ValueError(f"Format invalid pentru timp: {time_range}. Foloseste formatul HH:MM-HH:MM")
+    start_hour, start_minute, end_hour, end_minute = map(int, match.groups())
+    if start_hour > 23 or end_hour > 23 or start_minute > 59 or end_minute > 59:
+        raise ValueError(f"Format invalid pentru timp: {time_range}")
+    start, end = start_hour * 60 + start_minute, end_hour * 60 + end_minute
+    if end <= start and end != 0:
+        raise ValueError(f"Interval orar invalid: {time_range}. Sfarsitul trebuie sa fie dupa inceput")
+    return start, end
+
+
+def iter_csv_rows(file_path: str, progress: Optional[Progress] = None) -> Iterator[Tuple[int, Dict]]:
+    """(linia, randul ca dictionar) pentru fiecare rand de date al unui CSV cu header"""
+    total = os.path.getsize(file_path)
+    with open(file_path, "rb") as f:
+        counter = _ByteCounter(f)
+        reader = csv.DictReader(counter)
+        count = 0
+        for row in reader:
+            # linia pe care se termina randul (randurile goale sunt sarite de DictReader)
+            yield reader.line_num, row
+            count += 1
+            if progress is not None and count % PROGRESS_EVERY == 0:
+                progress(count, counter.position, total)
+        if progress is not None:
+            progress(count, total, total)
+
+
+def iter_json_entries(file_path: str, key: str = "schedule",
+                      progress: Optional[Progress] = None) -> Iterator[Tuple[int, object]]:
+    """
+    (linia, element) pentru fiecare element din lista `key` a obiectului JSON de pe primul nivel.
+    Elementele listei sunt decodate pe rand; restul cheilor sunt citite si ignorate.
+    """
+    total = os.path.getsize(file_path)
+    with open(file_path, "rb") as f:
+        stream = _JsonStream(f)
+        if stream.next_char() != "{":
+            raise ScheduleFormatError("Fisierul JSON trebuie sa contina un obiect", stream.line)
+
+        found = False
+        count = 0
+        if stream.peek() == "}":
+            stream.next_char()
+        else:
+            while True:
+                name = stream.decode()
+                if not isinstance(name, str) or stream.next_char() != ":":
+                    raise ScheduleFormatError("Cheie JSON invalida", stream.line)
+
+                if name == key and stream.peek() == "[":
+                    found = True
+                    stream.next_char()
+                    if stream.peek() == "]":
+                        stream.next_char()
+                    else:
+                        while True:
+                            stream.peek()
+                            yield stream.line, stream.decode()
+                            count += 1
+                            if progress is not None and count % PROGRESS_EVERY == 0:
+                                progress(count, stream.position, total)
+                            separator = stream.next_char()
+                            if separator == "]":
+                                break
+                            if separator != ",":
+                                raise ScheduleFormatError("Se astepta ',' sau ']' in lista", stream.line)
+                else:
+                    stream.decode()
+
+                separator = stream.next_char()
+                if separator == "}":
+                    break
+                if separator != ",":
+                    raise ScheduleFormatError("Se astepta ',' sau '}' in obiect", stream.line)
+
+        if not found:
+            raise ScheduleFormatError(f"Fisierul JSON trebuie sa contina cheia '{key}'")
+        if progress is not None:
+            progress(count, total, total)
+
+
+class _ByteCounter:
+    """Liniile unui fisier binar decodate UTF-8 (fara BOM), numarand octetii cititi"""
+
+    def __init__(self, f):
+        self.lines = iter(f)
+        self.position = 0
+        self.decode = codecs.getincrementaldecoder("utf-8-sig")().decode
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        line = next(self.lines)
+        self.position += len(line)
+        return self.decode(line)
+
+
+class _JsonStream:
+    """
+    Decodor JSON incremental peste un fisier binar: pastreaza in memorie doar blocul
+    curent si valoarea in curs de decodare.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.decoder = json.JSONDecoder()
+        self.utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+        self.buffer = ""
+        self.offset = 0
+        self.position = 0
+        self.eof = False
+        # liniile sunt numarate doar cand sunt cerute, pana la `_counted` in blocul curent
+        self._line = 1
+        self._counted = 0
+
+    @property
+    def line(self) -> int:
+        """Linia pozitiei curente"""
+        self._line += self.buffer.count("\n", self._counted, self.offset)
+        self._counted = self.offset
+        return self._line
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        self.position += len(chunk)
+        self.eof = not chunk
+        self.line  # numara liniile din partea aruncata a blocului
+        self.buffer = self.buffer[self.offset:] + self.utf8.decode(chunk, final=self.eof)
+        self.offset = self._counted = 0
+        return not self.eof
+
+    def _advance(self, end: int):
+        self.offset = end
+
+    def _skip_whitespace(self):
+        while True:
+            self._advance(_WHITESPACE.match(self.buffer, self.offset).end())
+            if self.offset < len(self.buffer) or not self._fill():
+                return
+
+    def peek(self) -> str:
+        self._skip_whitespace()
+        return self.buffer[self.offset:self.offset + 1]
+
+    def next_char(self) -> str:
+        char = self.peek()
+        self._advance(self.offset + len(char))
+        return char
+
+    def decode(self):
+        """Urmatoarea valoare JSON completa; citeste blocuri noi pana cand valoarea se termina"""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.offset)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ScheduleFormatError(f"Eroare la citirea JSON: {e.msg}",
+                                          self.line + self.buffer.count("\n", self.offset, e.pos))
+            # un numar taiat de capatul blocului (ex. "1." din "1.5") continua in blocul urmator
+            if not self.eof and _NUMBER_TAIL.fullmatch(self.buffer, end) and self._fill():
+                continue
+            self._advance(end)
+            return value
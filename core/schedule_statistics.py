@@ -0,0 +1,137 @@
+from typing import Dict, List
+
+import numpy as np
+
+from core.weather_frame import HourlyRecord
+
+RAIN_PROBABILITY_THRESHOLD = 30
+PRECIPITATION_PERCENTILES = (50, 90)
+GROUP_FIELDS = {"by_day": "day", "by_subject": "subject", "by_location": "location"}
+
+
+class StatisticsColumns:
+    """
+    Coloanele NumPy extrase dintr-o singura trecere prin intrarile imbinate:
+    temperatura (NaN fara valoare), probabilitatea si cantitatea de precipitatii,
+    daca intrarea are prognoza si cheile de grupare (zi, materie, sala)
+    """
+
+    def __init__(self, enriched_entries: List[Dict]):
+        count = len(enriched_entries)
+        self.temperature = np.full(count, np.nan)
+        self.probability = np.zeros(count)
+        self.precipitation = np.zeros(count)
+        self.has_weather = np.zeros(count, dtype=bool)
+        self.keys = {field: [entry.get(field) or "" for entry in enriched_entries]
+                     for field in GROUP_FIELDS.values()}
+        # orele din WeatherFrame se citesc direct din coloane, grupate pe frame
+        frames = {}
+
+        for i, weather in enumerate([entry.get("weather") for entry in enriched_entries]):
+            if type(weather) is HourlyRecord:
+                frame = weather.frame
+                group = frames.get(id(frame))
+                if group is None:
+                    group = frames[id(frame)] = (frame, [], [])
+                group[1].append(i)
+                group[2].append(weather.index)
+                continue
+            if not weather:
+                continue
+            temp = weather.get("temperature")
+            if temp is not None:
+                self.temperature[i] = temp
+            self.probability[i] = weather.get("precipitation_probability") or 0
+            self.precipitation[i] = weather.get("precipitation") or 0.0
+            self.has_weather[i] = True
+
+        for frame, rows, indices in frames.values():
+            # aceeasi rotunjire ca WeatherFrame.value
+            self.temperature[rows] = np.round(frame.temperature[indices].astype(np.float64), 2)
+            self.probability[rows] = np.nan_to_num(np.round(frame.precipitation_probability[indices]))
+            self.precipitation[rows] = np.nan_to_num(np.round(frame.precipitation[indices].astype(np.float64), 2))
+            self.has_weather[rows] = True
+
+        self.rainy = self.has_weather & (self.probability > RAIN_PROBABILITY_THRESHOLD)
+
+
+def calculate_statistics(enriched_entries: List[Dict], unit: str) -> Dict:
+    """
+    Statisticile globale (temperatura medie/minima/maxima, perioadele cu risc de ploaie,
+    totalul si percentilele precipitatiilor) plus aceleasi valori grupate pe zi, materie
+    si sala ("by_day", "by_subject", "by_location"), calculate vectorizat.
+    """
+    columns = StatisticsColumns(enriched_entries)
+    stats = _summaries(columns, np.zeros(len(enriched_entries), dtype=np.intp), 1)[0]
+    stats["unit"] = unit
+
+    for name, field in GROUP_FIELDS.items():
+        names, first, inverse = np.unique(np.asarray(columns.keys[field], dtype=str),
+                                          return_index=True, return_inverse=True)
+        summaries = _summaries(columns, inverse.reshape(-1), len(names))
+        # grupurile in ordinea primei aparitii in orar
+        stats[name] = {str(names[group]): summaries[group] for group in np.argsort(first).tolist()}
+    return stats
+
+
+def _summaries(columns: StatisticsColumns, groups: np.ndarray, count: int) -> List[Dict]:
+    """Statisticile fiecarui grup (0 .. count-1), fara bucle Python peste intrari"""
+    entries = np.bincount(groups, minlength=count)
+    with_weather = np.bincount(groups, weights=columns.has_weather, minlength=count)
+    rainy = np.bincount(groups, weights=columns.rainy, minlength=count)
+    total_precipitation = np.bincount(groups, weights=np.where(columns.has_weather, columns.precipitation, 0.0),
+                                      minlength=count)
+
+    valid = ~np.isnan(columns.temperature)
+    temp_groups, temperatures = groups[valid], columns.temperature[valid]
+    temp_count = np.bincount(temp_groups, minlength=count)
+    temp_sum = np.bincount(temp_groups, weights=temperatures, minlength=count)
+    temp_min = np.full(count, np.nan)
+    temp_max = np.full(count, np.nan)
+    if len(temperatures):
+        order = np.argsort(temp_groups, kind="stable")
+        present = np.flatnonzero(temp_count)
+        starts = np.concatenate(([0], np.cumsum(temp_count)[:-1]))[present]
+        temp_min[present] = np.minimum.reduceat(temperatures[order], starts)
+        temp_max[present] = np.maximum.reduceat(temperatures[order], starts)
+
+    percentiles = _group_percentiles(groups[columns.has_weather], columns.precipitation[columns.has_weather], count)
+
+    summaries = []
+    for group in range(count):
+        has_temp = temp_count[group] > 0
+        summary = {
+            "entries": int(entries[group]),
+            "with_weather": int(with_weather[group]),
+            "avg_temperature": float(temp_sum[group] / temp_count[group]) if has_temp else None,
+            "min_temperature": float(temp_min[group]) if has_temp else None,
+            "max_temperature": float(temp_max[group]) if has_temp else None,
+            "rainy_periods": int(rainy[group]),
+            "total_precipitation": float(total_precipitation[group])
+        }
+        for percentile, values in zip(PRECIPITATION_PERCENTILES, percentiles):
+            summary[f"precipitation_p{percentile}"] = float(values[group]) if with_weather[group] else None
+        summaries.append(summary)
+    return summaries
+
+
+def _group_percentiles(groups: np.ndarray, values: np.ndarray, count: int) -> List[np.ndarray]:
+    """Percentilele (interpolare liniara, ca np.percentile) ale valorilor fiecarui grup"""
+    sizes = np.bincount(groups, minlength=count)
+    if not len(values):
+        return [np.full(count, np.nan) for _ in PRECIPITATION_PERCENTILES]
+
+    ordered = values[np.lexsort((values, groups))]
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    last = np.maximum(sizes - 1, 0)
+
+    result = []
+    for percentile in PRECIPITATION_PERCENTILES:
+        position = last * (percentile / 100.0)
+        below = np.floor(position).astype(np.intp)
+        above = np.minimum(below + 1, last)
+        fraction = position - below
+        low = ordered[np.minimum(starts + below, len(ordered) - 1)]
+        high = ordered[np.minimum(starts + above, len(ordered) - 1)]
+        result.append(np.where(sizes > 0, low + (high - low) * fraction, np.nan))
+    return result
@@ -0,0 +1,252 @@
+"""
+Server HTTP local care imita API-urile Open-Meteo folosite de aplicatie
+(/v1/search si /v1/forecast), cu date sintetice deterministe.
+
+Se foloseste impreuna cu StandInTransport pentru teste de durata si benchmark-uri
+fara retea: prognoze de orice dimensiune, latenta configurabila si erori injectate.
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlsplit
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+
+from core.geocoding_cache import normalize_city_name
+
+DEFAULT_TIMEZONE = "Europe/Bucharest"
+
+KNOWN_CITIES = {
+    "bucuresti": ("București", 44.4268, 26.1025),
+    "iasi": ("Iași", 47.1585, 27.6014),
+    "cluj-napoca": ("Cluj-Napoca", 46.7712, 23.6236),
+    "timisoara": ("Timișoara", 45.7489, 21.2087),
+    "constanta": ("Constanța", 44.1598, 28.6348),
+    "bacau": ("Bacău", 46.5670, 26.9146)
+}
+
+
+def synthetic_forecast(latitude: float, longitude: float, start: datetime, hours: int,
+                       daily: bool = True, seed: int = 0) -> Dict:
+    """
+    O prognoza sintetica in formatul raspunsului Open-Meteo, incepand cu `start` (ora locala).
+    Valorile depind doar de coordonate, ora si `seed`, deci aceeasi cerere da acelasi raspuns.
+    """
+    index = np.arange(hours)
+    absolute_hour = index + int(start.timestamp() // 3600)
+    phase = (latitude * 7.0 + longitude * 3.0 + seed) % 24
+    wave = np.sin(2 * np.pi * (absolute_hour + phase) / 24.0)
+    slow = np.sin(2 * np.pi * (absolute_hour + phase) / 113.0)
+
+    temperature = np.round(14.0 - (latitude - 45.0) * 0.8 + 7.0 * wave + 4.0 * slow, 1)
+    probability = np.clip(np.round(50 + 45 * slow * np.cos(2 * np.pi * absolute_hour / 37.0)), 0, 100).astype(int)
+    precipitation = np.where(probability > 60, np.round((probability - 60) / 20.0, 1), 0.0)
+    weather_code = np.select(
+        [probability > 85, probability > 60, probability > 35, wave > 0.3],
+        [95, 61, 3, 0],
+        default=2
+    )
+    wind_speed = np.round(12.0 + 8.0 * np.abs(np.cos(2 * np.pi * (absolute_hour + phase) / 19.0)), 1)
+
+    times = [(start + timedelta(hours=int(i))).strftime("%Y-%m-%dT%H:%M") for i in index]
+    forecast = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "hourly": {
+            "time": times,
+            "temperature_2m": temperature.tolist(),
+            "precipitation_probability": probability.tolist(),
+            "precipitation": precipitation.tolist(),
+            "weathercode": weather_code.tolist(),
+            "windspeed_10m": wind_speed.tolist()
+        }
+    }
+
+    if daily:
+        days = hours // 24
+
+        def by_day(column):
+            return column[:days * 24].reshape(days, 24)
+
+        forecast["daily"] = {
+            "time": [t[:10] for t in times[:days * 24:24]],
+            "weathercode": by_day(weather_code).max(axis=1).tolist(),
+            "temperature_2m_max": by_day(temperature).max(axis=1).tolist(),
+            "temperature_2m_min": by_day(temperature).min(axis=1).tolist(),
+            "precipitation_sum": np.round(by_day(precipitation).sum(axis=1), 1).tolist()
+        }
+
+    return forecast
+
+
+class StandInServer:
+    """
+    Inlocuitor local pentru Open-Meteo, rulat intr-un fir separat.
+    - forecast_days: daca este setat, inlocuieste orizontul cerut (permite prognoze
+      mai lungi de 16 zile, pentru teste de volum)
+    - latency / jitter: intarzierea fiecarui raspuns, in secunde
+    - error_rate: probabilitatea ca un raspuns sa fie o eroare HTTP 503
+    - fail_next(n): urmatoarele n cereri esueaza
+    - unknown_cities: nume pentru care geocoding-ul nu gaseste nimic
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 forecast_days: Optional[int] = None, unknown_cities: Iterable[str] = (),
+                 seed: int = 0, port: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.forecast_days = forecast_days
+        self.unknown_cities = {normalize_city_name(name) for name in unknown_cities}
+        self.seed = seed
+        self.port = port
+
+        self.requests: Dict[str, int] = {"search": 0, "forecast": 0, "errors": 0}
+        self._random = random.Random(seed)
+        self._fail_next = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> str:
+        """Porneste serverul (daca nu ruleaza deja) si intoarce URL-ul de baza"""
+        if self._server is None:
+            handler = type("StandInHandler", (_StandInHandler,), {"stand_in": self})
+            self._server = ThreadingHTTPServer(("127.0.0.1", self.port), handler)
+            self._server.daemon_threads = True
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.base_url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def fail_next(self, count: int = 1):
+        with self._lock:
+            self._fail_next += count
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            if self._fail_next > 0:
+                self._fail_next -= 1
+                return True
+            return self.error_rate > 0 and self._random.random() < self.error_rate
+
+    def _delay(self) -> float:
+        with self._lock:
+            return self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def search(self, query: Dict[str, List[str]]) -> Dict:
+        name = query.get("name", [""])[0]
+        key = normalize_city_name(name)
+        if not key or key in self.unknown_cities:
+            return {}
+
+        if key in KNOWN_CITIES:
+            resolved, latitude, longitude = KNOWN_CITIES[key]
+        else:
+            digest = hashlib.sha1(key.encode("utf-8")).digest()
+            resolved = name.strip()
+            latitude = round(43.7 + digest[0] / 255 * 4.5, 4)
+            longitude = round(20.3 + digest[1] / 255 * 9.4, 4)
+
+        return {"results": [{
+            "name": resolved,
+            "latitude": latitude,
+            "longitude": longitude,
+            "timezone": DEFAULT_TIMEZONE
+        }]}
+
+    def forecast(self, query: Dict[str, List[str]]):
+        latitudes = query.get("latitude", ["0"])[0].split(",")
+        longitudes = query.get("longitude", ["0"])[0].split(",")
+        timezones = query.get("timezone", [DEFAULT_TIMEZONE])[0].split(",")
+        days = self.forecast_days or int(query.get("forecast_days", ["7"])[0])
+
+        results = []
+        for i, (latitude, longitude) in enumerate(zip(latitudes, longitudes)):
+            timezone = timezones[min(i, len(timezones) - 1)]
+            offset = _utc_offset(timezone)
+            now = datetime.now(tz=dt_timezone.utc).replace(tzinfo=None) + timedelta(seconds=offset)
+
+            if "start_hour" in query:
+                start = datetime.fromisoformat(query["start_hour"][0])
+                end = datetime.fromisoformat(query.get("end_hour", query["start_hour"])[0])
+                hours = int((end - start).total_seconds() // 3600) + 1
+                daily = False
+            else:
+                start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+                hours = 24 * days
+                daily = True
+
+            forecast = synthetic_forecast(float(latitude), float(longitude), start, hours, daily, self.seed)
+            forecast["timezone"] = timezone
+            forecast["utc_offset_seconds"] = offset
+            results.append(forecast)
+
+        return results if len(results) > 1 else results[0]
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    stand_in: StandInServer = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        stand_in = self.stand_in
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        endpoint = parts.path.rstrip("/").rsplit("/", 1)[-1]
+
+        delay = stand_in._delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        if endpoint not in ("search", "forecast"):
+            self._send(404, {"error": True, "reason": f"Endpoint necunoscut: {parts.path}"})
+            return
+
+        with stand_in._lock:
+            stand_in.requests[endpoint] += 1
+
+        if stand_in._should_fail():
+            with stand_in._lock:
+                stand_in.requests["errors"] += 1
+            self._send(503, {"error": True, "reason": "Eroare injectata"})
+            return
+
+        try:
+            body = stand_in.search(query) if endpoint == "search" else stand_in.forecast(query)
+        except (ValueError, KeyError) as e:
+            self._send(400, {"error": True, "reason": str(e)})
+            return
+
+        self._send(200, body)
+
+    def _send(self, status: int, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _utc_offset(timezone: str) -> int:
+    try:
+        offset = datetime.now(ZoneInfo(timezone)).utcoffset()
+    except (ZoneInfoNotFoundError, ValueError):
+        return 0
+    return int(offset.total_seconds()) if offset is not None else 0
@@ -0,0 +1,199 @@
+"""
+Transporturi HTTP folosite de RequestRegistry / WeatherService.
+
+Un transport trimite o cerere GET si apeleaza callback(data, error) din bucla de
+evenimente Qt (niciodata direct din get()):
+- QtTransport: QNetworkAccessManager, reteaua reala (implicit)
+- ReplayTransport: raspunsuri inregistrate pe disc (mode="record" / "replay")
+- StandInTransport: trimite cererile catre un StandInServer local
+"""
+import hashlib
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+from PyQt6.QtCore import QTimer, QUrl
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+ReplyCallback = Callable[[Optional[bytes], Optional[str]], None]
+
+USER_AGENT = "WeatherScheduler/1.0"
+
+
+class TransportRequest:
+    """Cererea intoarsa de Transport.get(); dupa abort() callback-ul nu mai este apelat"""
+
+    def __init__(self):
+        self.aborted = False
+
+    def abort(self):
+        self.aborted = True
+
+
+class Transport(ABC):
+    """Interfata comuna a transporturilor"""
+
+    @abstractmethod
+    def get(self, url_string: str, callback: ReplyCallback) -> TransportRequest:
+        """Trimite cererea GET; callback(data, error) este apelat ulterior, din bucla de evenimente"""
+
+
+class _QtRequest(TransportRequest):
+    def __init__(self, reply: QNetworkReply):
+        super().__init__()
+        self.reply = reply
+
+    def abort(self):
+        super().abort()
+        self.reply.abort()
+
+
+class QtTransport(Transport):
+    """Cereri reale prin QNetworkAccessManager"""
+
+    def __init__(self, network_manager: Optional[QNetworkAccessManager] = None):
+        self.network_manager = network_manager or QNetworkAccessManager()
+
+    def get(self, url_string: str, callback: ReplyCallback) -> TransportRequest:
+        request = QNetworkRequest(QUrl(url_string))
+        request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, USER_AGENT)
+
+        reply = self.network_manager.get(request)
+        handle = _QtRequest(reply)
+        reply.finished.connect(lambda: self._on_finished(handle, callback))
+        return handle
+
+    @staticmethod
+    def _on_finished(handle: _QtRequest, callback: ReplyCallback):
+        reply = handle.reply
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+            data, error = bytes(reply.readAll()), None
+        else:
+            data, error = None, reply.errorString()
+        reply.deleteLater()
+
+        if not handle.aborted:
+            callback(data, error)
+
+
+class ReplayTransport(Transport):
+    """
+    Raspunsuri geocoding/forecast salvate pe disc, cate un fisier JSON pentru fiecare URL.
+    - mode="record": cererile merg prin `inner` (implicit QtTransport), iar raspunsurile
+      reusite sunt salvate in `directory`
+    - mode="replay": raspunsurile sunt citite din `directory`, dupa `latency` secunde;
+      un URL neinregistrat intoarce o eroare
+
+    URL-urile trebuie sa coincida exact; cererile incrementale (start_hour/end_hour)
+    depind de ora curenta, deci pentru rulari reproductibile se dezactiveaza
+    WeatherService.incremental_refresh.
+    """
+
+    def __init__(self, directory: str = "resources/recordings", mode: str = "replay",
+                 inner: Optional[Transport] = None, latency: float = 0.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Mod necunoscut: {mode}")
+        self.directory = directory
+        self.mode = mode
+        self.inner = inner
+        self.latency = latency
+
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+
+        if mode == "record":
+            os.makedirs(directory, exist_ok=True)
+            if self.inner is None:
+                self.inner = QtTransport()
+
+    def path_for(self, url_string: str) -> str:
+        digest = hashlib.sha1(url_string.encode("utf-8")).hexdigest()[:20]
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, url_string: str, callback: ReplyCallback) -> TransportRequest:
+        if self.mode == "record":
+            return self.inner.get(url_string, lambda data, error: self._record(url_string, data, error, callback))
+
+        handle = TransportRequest()
+        data, error = self._load(url_string)
+
+        def deliver():
+            if not handle.aborted:
+                callback(data, error)
+
+        QTimer.singleShot(int(self.latency * 1000), deliver)
+        return handle
+
+    def _record(self, url_string: str, data: Optional[bytes], error: Optional[str], callback: ReplyCallback):
+        if error is None:
+            tmp_path = f"{self.path_for(url_string)}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({
+                        "url": url_string,
+                        "recorded_at": time.time(),
+                        "body": data.decode("utf-8")
+                    }, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path_for(url_string))
+                self.recorded += 1
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"Nu s-a putut inregistra raspunsul: {e}")
+        callback(data, error)
+
+    def _load(self, url_string: str):
+        try:
+            with open(self.path_for(url_string), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            entry = None
+
+        if entry is None or entry.get("url") != url_string:
+            self.missing += 1
+            return None, f"Nu exista o inregistrare pentru {url_string}"
+
+        self.replayed += 1
+        return entry["body"].encode("utf-8"), None
+
+
+class StandInTransport(Transport):
+    """
+    Trimite cererile catre un server local (StandInServer), pastrand calea si parametrii:
+    https://api.open-meteo.com/v1/forecast?... -> http://127.0.0.1:<port>/v1/forecast?...
+    """
+
+    def __init__(self, base_url: str, inner: Optional[Transport] = None, server=None):
+        self.base_url = base_url.rstrip("/")
+        self.inner = inner or QtTransport()
+        self.server = server
+
+    def rewrite(self, url_string: str) -> str:
+        parts = urlsplit(url_string)
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{self.base_url}{parts.path}{query}"
+
+    def get(self, url_string: str, callback: ReplyCallback) -> TransportRequest:
+        return self.inner.get(self.rewrite(url_string), callback)
+
+
+def transport_from_spec(spec: Optional[str]) -> Transport:
+    """
+    Construieste un transport dintr-o descriere text (ex. variabila WEATHERSCHEDULER_TRANSPORT):
+    "qt", "record:<director>", "replay:<director>", "standin" sau "standin:<latenta in s>"
+    """
+    kind, _, argument = (spec or "qt").partition(":")
+
+    if kind == "qt":
+        return QtTransport()
+    if kind in ("record", "replay"):
+        return ReplayTransport(argument or "resources/recordings", mode=kind)
+    if kind == "standin":
+        from core.standin_server import StandInServer
+
+        server = StandInServer(latency=float(argument or 0))
+        return StandInTransport(server.start(), server=server)
+
+    raise ValueError(f"Transport necunoscut: {spec}")
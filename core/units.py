@@ -0,0 +1,98 @@
+"""
+Conversii de unitati pentru prognoze.
+
+Prognozele se descarca si se pastreaza in cache in unitatile canonice ale
+Open-Meteo (°C, km/h); conversia pentru afisare se face vectorizat, pe coloane,
+astfel incat schimbarea unitatii nu necesita o noua cerere.
+"""
+from typing import Dict
+
+from core.weather_frame import WeatherFrame, as_frame
+
+CANONICAL_TEMPERATURE_UNIT = "celsius"
+CANONICAL_WIND_UNIT = "km/h"
+
+# unitate -> (simbol, factor, decalaj), valoare = celsius * factor + decalaj
+TEMPERATURE_UNITS = {
+    "celsius": ("°C", 1.0, 0.0),
+    "fahrenheit": ("°F", 1.8, 32.0)
+}
+
+# unitate -> cate unitati intr-un km/h
+WIND_UNITS = {
+    "km/h": 1.0,
+    "m/s": 1 / 3.6,
+    "mph": 1 / 1.609344,
+    "kn": 1 / 1.852
+}
+
+
+def temperature_symbol(unit: str) -> str:
+    return TEMPERATURE_UNITS[unit][0]
+
+
+def convert_temperature(values, from_unit: str, to_unit: str):
+    """Converteste o temperatura sau un vector NumPy de temperaturi"""
+    if from_unit == to_unit:
+        return values
+    _, from_scale, from_offset = TEMPERATURE_UNITS[from_unit]
+    _, to_scale, to_offset = TEMPERATURE_UNITS[to_unit]
+    return (values - from_offset) * (to_scale / from_scale) + to_offset
+
+
+def convert_wind_speed(values, from_unit: str, to_unit: str):
+    """Converteste o viteza a vantului sau un vector NumPy de viteze"""
+    if from_unit == to_unit:
+        return values
+    return values * (WIND_UNITS[to_unit] / WIND_UNITS[from_unit])
+
+
+def convert_forecast(data: Dict, temperature_unit: str, wind_unit: str) -> Dict:
+    """
+    Copie a unei prognoze canonice in unitatile cerute.
+    Coloanele care nu depind de unitate sunt impartasite cu prognoza originala.
+    """
+    converted = _convert_units(data, CANONICAL_TEMPERATURE_UNIT, temperature_unit, CANONICAL_WIND_UNIT, wind_unit)
+    converted["units"] = {"temperature": temperature_unit, "wind_speed": wind_unit}
+    return converted
+
+
+def to_canonical(data: Dict) -> Dict:
+    """
+    Inversul lui convert_forecast: o prognoza marcata cu "units" (ex. vechiul cache JSON,
+    salvat in unitatile de afisare) adusa la °C / km/h, fara marcaj.
+    """
+    units = data["units"]
+    converted = _convert_units(data, units["temperature"], CANONICAL_TEMPERATURE_UNIT,
+                               units["wind_speed"], CANONICAL_WIND_UNIT)
+    del converted["units"]
+    return converted
+
+
+def _convert_units(data: Dict, from_temperature: str, to_temperature: str,
+                   from_wind: str, to_wind: str) -> Dict:
+    frame = as_frame(data.get("hourly"))
+    hourly = WeatherFrame(
+        frame.time,
+        convert_temperature(frame.temperature, from_temperature, to_temperature),
+        frame.precipitation_probability,
+        frame.precipitation,
+        frame.weather_code,
+        convert_wind_speed(frame.wind_speed, from_wind, to_wind)
+    )
+
+    def temperature(value):
+        if value is None:
+            return None
+        return round(float(convert_temperature(value, from_temperature, to_temperature)), 2)
+
+    daily = data.get("daily", [])
+    if from_temperature != to_temperature:
+        daily = [
+            dict(day,
+                 temperature_max=temperature(day.get("temperature_max")),
+                 temperature_min=temperature(day.get("temperature_min")))
+            for day in daily
+        ]
+
+    return dict(data, hourly=hourly, daily=daily)
@@ -0,0 +1,366 @@
+import calendar
+import hashlib
+import time
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+WEATHER_CODES = {
+    0: "Senin",
+    1: "Predominant senin",
+    2: "Partial inorat",
+    3: "Inorat",
+    45: "Ceata",
+    48: "Ceata cu chiciura",
+    51: "Burnita usoara",
+    53: "Burnita moderata",
+    55: "Burnita densa",
+    61: "Ploaie usoara",
+    63: "Ploaie moderata",
+    65: "Ploaie torentiala",
+    71: "Ninsoare usoara",
+    73: "Ninsoare moderata",
+    75: "Ninsoare puternica",
+    77: "Fulgi de zapada",
+    80: "Averse usoare",
+    81: "Averse moderate",
+    82: "Averse puternice",
+    85: "Averse de zapada usoare",
+    86: "Averse de zapada puternice",
+    95: "Furtuna",
+    96: "Furtuna cu grindina usoara",
+    99: "Furtuna cu grindina puternica"
+}
+
+HOURLY_FIELDS = (
+    "datetime",
+    "temperature",
+    "precipitation_probability",
+    "precipitation",
+    "weather_code",
+    "weather_description",
+    "wind_speed"
+)
+
+FLOAT_COLUMNS = ("temperature", "precipitation_probability", "precipitation", "wind_speed")
+
+COLUMNS = ("time", "temperature", "precipitation_probability", "precipitation", "weather_code", "wind_speed")
+
+
+def describe_weather_code(code: int) -> str:
+    """Converteste codul WMO in descriere text"""
+    if code is None:
+        return "Necunoscut"
+    return WEATHER_CODES.get(int(code), "Necunoscut")
+
+
+def iso_to_epoch(value: str) -> int:
+    """
+    Converteste un moment ISO (ora locala, fara fus orar, ca in raspunsul Open-Meteo)
+    in secunde. Ora locala este tratata ca UTC, astfel incat diferentele dintre
+    momente raman cele din calendarul local.
+    """
+    return calendar.timegm(datetime.fromisoformat(value).timetuple())
+
+
+def epoch_to_iso(value: int) -> str:
+    """Inversul lui iso_to_epoch, in formatul folosit de Open-Meteo (YYYY-MM-DDTHH:MM)"""
+    return time.strftime("%Y-%m-%dT%H:%M", time.gmtime(int(value)))
+
+
+def datetime_to_epoch(value: datetime) -> int:
+    """Secundele corespunzatoare orei locale (wall clock) a unui datetime"""
+    return calendar.timegm(value.timetuple())
+
+
+class HourlyRecord(Mapping):
+    """
+    Vedere read-only asupra unei ore dintr-un WeatherFrame.
+    Se comporta ca dictionarele vechi din lista "hourly", fara a copia datele.
+    """
+
+    __slots__ = ("_frame", "_index")
+
+    def __init__(self, frame: "WeatherFrame", index: int):
+        self._frame = frame
+        self._index = index
+
+    def __getitem__(self, key: str):
+        return self._frame.value(key, self._index)
+
+    @property
+    def frame(self) -> "WeatherFrame":
+        return self._frame
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    def __iter__(self):
+        return iter(HOURLY_FIELDS)
+
+    def __len__(self) -> int:
+        return len(HOURLY_FIELDS)
+
+    def copy(self) -> Dict:
+        return dict(self)
+
+    def __repr__(self) -> str:
+        return f"HourlyRecord({dict(self)!r})"
+
+
+class WeatherFrame(Sequence):
+    """
+    Prognoza orara stocata pe coloane NumPy:
+    - time: secunde (int64) pentru ora locala
+    - temperature, precipitation_probability, precipitation, wind_speed: float32
+    - weather_code: uint8
+
+    Indexarea cu un intreg intoarce un HourlyRecord (compatibil cu vechile dictionare),
+    iar indexarea cu slice/masca intoarce un nou WeatherFrame care impartaseste datele.
+    """
+
+    __slots__ = COLUMNS + ("__weakref__",)
+
+    def __init__(self, time_column, temperature, precipitation_probability,
+                 precipitation, weather_code, wind_speed):
+        self.time = np.asarray(time_column, dtype=np.int64)
+        self.temperature = np.asarray(temperature, dtype=np.float32)
+        self.precipitation_probability = np.asarray(precipitation_probability, dtype=np.float32)
+        self.precipitation = np.asarray(precipitation, dtype=np.float32)
+        self.weather_code = np.asarray(weather_code, dtype=np.uint8)
+        self.wind_speed = np.asarray(wind_speed, dtype=np.float32)
+
+    @classmethod
+    def empty(cls) -> "WeatherFrame":
+        return cls([], [], [], [], [], [])
+
+    @classmethod
+    def from_open_meteo(cls, hourly_data: Dict) -> "WeatherFrame":
+        """Construieste frame-ul direct din coloanele trimise de Open-Meteo"""
+        times = hourly_data.get("time", [])
+        count = len(times)
+
+        return cls(
+            [iso_to_epoch(t) for t in times],
+            _column(hourly_data.get("temperature_2m"), count, np.nan),
+            _column(hourly_data.get("precipitation_probability"), count, 0),
+            _column(hourly_data.get("precipitation"), count, 0),
+            _column(hourly_data.get("weathercode"), count, 0),
+            _column(hourly_data.get("windspeed_10m"), count, 0)
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "WeatherFrame":
+        """Construieste frame-ul din vechiul format (lista de dictionare pe ore)"""
+        records = list(records)
+
+        def values(key, default):
+            return [default if r.get(key) is None else r.get(key) for r in records]
+
+        return cls(
+            [iso_to_epoch(r["datetime"]) for r in records],
+            values("temperature", np.nan),
+            values("precipitation_probability", 0),
+            values("precipitation", 0),
+            values("weather_code", 0),
+            values("wind_speed", 0)
+        )
+
+    @classmethod
+    def concat(cls, frames: Iterable["WeatherFrame"]) -> "WeatherFrame":
+        """Lipeste mai multe frame-uri (in ordinea data)"""
+        frames = list(frames)
+        if not frames:
+            return cls.empty()
+        return cls(*(np.concatenate([getattr(f, name) for f in frames]) for name in COLUMNS))
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            length = len(self.time)
+            if index < 0:
+                index += length
+            if not 0 <= index < length:
+                raise IndexError("WeatherFrame index out of range")
+            return HourlyRecord(self, int(index))
+
+        return WeatherFrame(
+            self.time[index],
+            self.temperature[index],
+            self.precipitation_probability[index],
+            self.precipitation[index],
+            self.weather_code[index],
+            self.wind_speed[index]
+        )
+
+    def __iter__(self):
+        for i in range(len(self.time)):
+            yield HourlyRecord(self, i)
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "WeatherFrame(0 ore)"
+        return f"WeatherFrame({len(self)} ore, {epoch_to_iso(self.time[0])} - {epoch_to_iso(self.time[-1])})"
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupata de coloane, in octeti"""
+        return sum(getattr(self, name).nbytes for name in COLUMNS)
+
+    def fingerprint(self) -> str:
+        """Amprenta continutului (toate coloanele); doua frame-uri cu aceleasi valori au aceeasi amprenta"""
+        digest = hashlib.blake2b(digest_size=16)
+        for name in COLUMNS:
+            digest.update(np.ascontiguousarray(getattr(self, name)).tobytes())
+        return digest.hexdigest()
+
+    def value(self, key: str, index: int):
+        """Valoarea unui camp pentru ora `index`, convertita in tipuri Python"""
+        if key == "datetime":
+            return epoch_to_iso(self.time[index])
+        if key == "weather_code":
+            return int(self.weather_code[index])
+        if key == "weather_description":
+            return describe_weather_code(self.weather_code[index])
+        if key in FLOAT_COLUMNS:
+            value = float(getattr(self, key)[index])
+            if value != value:
+                return None
+            if key == "precipitation_probability":
+                return int(round(value))
+            return round(value, 2)
+        raise KeyError(key)
+
+    def between(self, start: int, end: int) -> "WeatherFrame":
+        """Orele cu start <= time < end (secunde), fara copierea datelor"""
+        lo = int(np.searchsorted(self.time, start, side="left"))
+        hi = int(np.searchsorted(self.time, end, side="left"))
+        return self[lo:hi]
+
+    def filter(self, mask) -> "WeatherFrame":
+        """Orele pentru care masca booleana este adevarata"""
+        return self[np.asarray(mask, dtype=bool)]
+
+    def nearest_index(self, timestamp: int) -> Optional[int]:
+        """Indexul orei celei mai apropiate de momentul dat (secunde)"""
+        if not len(self.time):
+            return None
+
+        pos = int(np.searchsorted(self.time, timestamp, side="left"))
+        if pos == 0:
+            return 0
+        if pos == len(self.time):
+            return pos - 1
+        if timestamp - self.time[pos - 1] <= self.time[pos] - timestamp:
+            return pos - 1
+        return pos
+
+    def nearest_indices(self, timestamps, max_distance: Optional[int] = None) -> np.ndarray:
+        """
+        Varianta vectorizata a lui nearest_index, pentru mai multe momente deodata.
+        La egalitate castiga ora anterioara; -1 cand frame-ul este gol sau ora gasita
+        este la `max_distance` secunde sau mai departe.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        length = len(self.time)
+        if not length:
+            return np.full(len(timestamps), -1, dtype=np.intp)
+
+        pos = np.searchsorted(self.time, timestamps, side="left")
+        left = np.clip(pos - 1, 0, length - 1)
+        right = np.clip(pos, 0, length - 1)
+        indices = np.where(timestamps - self.time[left] <= self.time[right] - timestamps, left, right)
+
+        if max_distance is not None:
+            indices[np.abs(self.time[indices] - timestamps) >= max_distance] = -1
+        return indices
+
+    def interpolate_at(self, timestamps) -> "WeatherFrame":
+        """
+        Un frame cu cate o inregistrare pentru fiecare moment dat: valorile numerice sunt
+        interpolate liniar intre orele vecine, codul meteo este cel al orei celei mai apropiate
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        hours = self.time.astype(np.float64)
+
+        def interpolated(column):
+            return np.interp(timestamps, hours, column)
+
+        return WeatherFrame(
+            timestamps,
+            interpolated(self.temperature),
+            interpolated(self.precipitation_probability),
+            interpolated(self.precipitation),
+            self.weather_code[self.nearest_indices(timestamps)],
+            interpolated(self.wind_speed)
+        )
+
+    def splice(self, window: "WeatherFrame") -> "WeatherFrame":
+        """
+        Inlocuieste orele acoperite de `window` cu cele din `window`,
+        pastrand orele de dinainte si de dupa intervalul lui
+        """
+        if not len(window):
+            return self
+        lo = int(np.searchsorted(self.time, window.time[0], side="left"))
+        hi = int(np.searchsorted(self.time, window.time[-1], side="right"))
+        return WeatherFrame.concat([self[:lo], window, self[hi:]])
+
+    def daily_summary(self) -> List[Dict]:
+        """
+        Agregatele zilnice calculate din orele frame-ului, in formatul listei "daily"
+        (cod meteo = cel mai sever cod orar, ca la Open-Meteo)
+        """
+        if not len(self.time):
+            return []
+
+        days = self.time // 86400
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        temp_max = np.fmax.reduceat(self.temperature, starts)
+        temp_min = np.fmin.reduceat(self.temperature, starts)
+        precip_sum = np.add.reduceat(self.precipitation, starts)
+        codes = np.maximum.reduceat(self.weather_code, starts)
+
+        summary = []
+        for i, start in enumerate(starts):
+            code = int(codes[i])
+            summary.append({
+                "date": epoch_to_iso(days[start] * 86400)[:10],
+                "temperature_max": None if np.isnan(temp_max[i]) else round(float(temp_max[i]), 1),
+                "temperature_min": None if np.isnan(temp_min[i]) else round(float(temp_min[i]), 1),
+                "precipitation_sum": round(float(precip_sum[i]), 2),
+                "weather_code": code,
+                "weather_description": describe_weather_code(code)
+            })
+        return summary
+
+    def hours_since_start(self) -> np.ndarray:
+        """Axa X pentru grafice: ore scurse de la prima inregistrare"""
+        if not len(self.time):
+            return np.empty(0, dtype=np.float64)
+        return (self.time - self.time[0]) / 3600.0
+
+    def to_records(self) -> List[Dict]:
+        """Exporta in vechiul format (lista de dictionare), de ex. pentru JSON"""
+        return [dict(record) for record in self]
+
+
+def as_frame(hourly) -> WeatherFrame:
+    """Accepta fie un WeatherFrame, fie vechea lista de dictionare"""
+    if isinstance(hourly, WeatherFrame):
+        return hourly
+    if not hourly:
+        return WeatherFrame.empty()
+    return WeatherFrame.from_records(hourly)
+
+
+def _column(values, count: int, default) -> np.ndarray:
+    """Completeaza coloanele scurte sau valorile null cu valoarea implicita"""
+    values = list(values or [])[:count]
+    values.extend([default] * (count - len(values)))
+    return np.array([default if v is None else v for v in values], dtype=np.float64)
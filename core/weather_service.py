@@ -1,19 +1,49 @@
-from PyQt6.QtCore import QObject, pyqtSignal, QUrl, QTimer
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PyQt6.QtCore import QCoreApplication, QObject, QTimer, pyqtSignal
 import json
+import os
+import random
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.forecast_cache import ForecastCache
+from core.geocoding_cache import GeocodingCache
+from core.interval_aggregates import IntervalAggregates
+from core.processing_pipeline import ProcessingPipeline
+from core.request_registry import RequestRegistry
+from core.transport import Transport, transport_from_spec
+from core.units import (CANONICAL_TEMPERATURE_UNIT, CANONICAL_WIND_UNIT, TEMPERATURE_UNITS, WIND_UNITS,
+                        convert_forecast, convert_temperature)
+from core.weather_frame import WeatherFrame, as_frame, describe_weather_code, datetime_to_epoch, epoch_to_iso
+
+HOURLY_VARIABLES = "temperature_2m,precipitation_probability,precipitation,weathercode,windspeed_10m"
+DAILY_VARIABLES = "weathercode,temperature_2m_max,temperature_2m_min,precipitation_sum"
 
 class WeatherService(QObject):
     """
     Serviciu pentru comunicarea cu API-ul meteo Open-Meteo (gratuit, fara API key)
-    Foloseste QNetworkAccessManager pentru cereri HTTP asincrone
+    Cererile HTTP asincrone trec prin RequestRegistry, peste un Transport: implicit
+    QNetworkAccessManager, sau cel descris de variabila WEATHERSCHEDULER_TRANSPORT
+    (vezi core.transport.transport_from_spec)
     """
     
     weather_data_ready = pyqtSignal(dict)
     weather_error = pyqtSignal(str)
+    batch_weather_ready = pyqtSignal(dict)
+    weather_retry = pyqtSignal(int, float, str)
     
-    def __init__(self):
+    GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
+    FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+    BATCH_SIZE = 50
+    CURRENT_GROUP = "current"
+    INCREMENTAL_HOURS = 48
+    MAX_RETRIES = 5
+    RETRY_BASE_DELAY = 2.0
+    RETRY_MAX_DELAY = 300.0
+    
+    def __init__(self, transport: Optional[Transport] = None):
         """
         Initializeaza serviciul meteo
         """
@@ -22,165 +52,523 @@ class WeatherService(QObject):
         self.latitude = 44.4268  
         self.longitude = 26.1025  
         self.city_name = "Bucuresti"    
+        self.timezone = "Europe/Bucharest"
+        self.geocoding_cache = GeocodingCache()
         
-        self.network_manager = QNetworkAccessManager()
-        self.network_manager.finished.connect(self.handle_response)
+        self.requests = RequestRegistry(
+            transport or transport_from_spec(os.environ.get("WEATHERSCHEDULER_TRANSPORT"))
+        )
+        self.pipeline = ProcessingPipeline(parent=self)
         
         self.cached_weather = None
+        self.canonical_weather = None
         self.cache_timestamp = None
         self.cache_duration = 1800
+        self.cache = ForecastCache(ttl=self.cache_duration)
+        self.cache_key = None
+        
+        self.temperature_unit = CANONICAL_TEMPERATURE_UNIT
+        self.wind_unit = CANONICAL_WIND_UNIT
         
-        self.temperature_unit = "celsius"
+        self.incremental_refresh = True
+        self.last_refresh_stats = None
         
-        self.pending_days_request = 0 
+        self.stale_while_revalidate = True
+        self.max_stale_age = 24 * 3600
+        self.retry_attempt = 0
+        self.retry_days = 7
+        self.retry_timer = QTimer(self)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.timeout.connect(lambda: self._request_weather(self.retry_days))
+        
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
         
     def set_location(self, city_name: str):
-        """Seteaza locatia pentru care se cer datele meteo"""
+        """
+        Seteaza locatia pentru care se cer datele meteo.
+        Prognozele deja descarcate raman in cache pentru revenirea la locatia veche,
+        iar cererile in curs pentru locatia veche sunt anulate.
+        """
+        if city_name == self.city_name:
+            return
+        self.cancel_current_requests()
         self.city_name = city_name
         self.cached_weather = None  
+        self.canonical_weather = None
+        self.cache_key = None
         
     def set_temperature_unit(self, unit: str):
-        """Seteaza unitatea de masura pentru temperatura (celsius/fahrenheit)"""
-        if unit.lower() in ["celsius", "fahrenheit"]:
-            self.temperature_unit = unit.lower()
-            self.cached_weather = None
+        """
+        Seteaza unitatea de masura pentru temperatura (celsius/fahrenheit).
+        Prognoza curenta este convertita local, fara o noua cerere.
+        """
+        unit = unit.lower()
+        if unit in TEMPERATURE_UNITS and unit != self.temperature_unit:
+            self.temperature_unit = unit
+            self._update_display()
+            
+    def set_wind_unit(self, unit: str):
+        """Seteaza unitatea de masura pentru viteza vantului (km/h, m/s, mph, kn)"""
+        if unit in WIND_UNITS and unit != self.wind_unit:
+            self.wind_unit = unit
+            self._update_display()
+            
+    def to_display_units(self, data: Dict) -> Dict:
+        """Prognoza canonica (°C, km/h) convertita in unitatile de afisare"""
+        return convert_forecast(data, self.temperature_unit, self.wind_unit)
+        
+    def _update_display(self):
+        """Reconstruieste cached_weather din prognoza canonica, marcata cu momentul descarcarii"""
+        if self.canonical_weather is None:
+            return
+        display = self.to_display_units(self.canonical_weather)
+        display["fetched_at"] = self.cache_timestamp.timestamp()
+        display["stale"] = time.time() - display["fetched_at"] >= self.cache_duration
+        self.cached_weather = display
+            
+    def cancel_current_requests(self):
+        """Anuleaza cererile, prelucrarile si reincercarile in curs pentru locatia curenta"""
+        self.requests.abort_group(self.CURRENT_GROUP)
+        self.pipeline.cancel_group(self.CURRENT_GROUP)
+        self.retry_timer.stop()
+        self.retry_attempt = 0
+            
+    def set_cache_duration(self, minutes: int):
+        """Seteaza durata de valabilitate a cache-ului (setarea cache_duration_minutes)"""
+        self.cache_duration = minutes * 60
+        self.cache.set_ttl(self.cache_duration)
+        
+    def set_stale_policy(self, enabled: bool, max_age_hours: float):
+        """
+        Stale-while-revalidate: prognozele expirate, dar mai noi de `max_age_hours`,
+        sunt afisate imediat cat timp se descarca prognoza noua.
+        """
+        self.stale_while_revalidate = enabled
+        self.max_stale_age = max(self.cache_duration, max_age_hours * 3600)
+        
+    def current_age(self) -> Optional[float]:
+        """Varsta (secunde) prognozei afisate, sau None"""
+        if self.canonical_weather is None or self.cache_timestamp is None:
+            return None
+        return time.time() - self.cache_timestamp.timestamp()
+        
+    def retry_delay(self, attempt: int) -> float:
+        """Intarzierea inaintea reincercarii: backoff exponential cu jitter (50-100%)"""
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+        return delay * random.uniform(0.5, 1.0)
+            
+    def make_cache_key(self, lat: float, lon: float, days: int) -> str:
+        """Cheia din cache pentru o cerere de prognoza"""
+        return ForecastCache.make_key(
+            lat, lon, CANONICAL_TEMPERATURE_UNIT, min(days, 16), f"{HOURLY_VARIABLES};{DAILY_VARIABLES}"
+        )
             
     def fetch_weather_data(self, days: int = 7):
         """
         Porneste procesul de preluare a vremii:
-        1. Obtine coordonatele pentru self.city_name
+        1. Obtine coordonatele pentru self.city_name (din cache sau prin geocoding)
         2. Apeleaza _fetch_weather_for_coords cu coordonatele gasite
+        Erorile de retea sunt reincercate automat (vezi _on_fetch_failed).
         """
-        self.pending_days_request = days
+        self.retry_timer.stop()
+        self.retry_attempt = 0
+        self._request_weather(days)
         
-        geo_url = f"https://geocoding-api.open-meteo.com/v1/search?name={self.city_name}&count=1&language=ro&format=json"
-        
-        request = QNetworkRequest(QUrl(geo_url))
-        request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, "WeatherScheduler/1.0")
+    def _request_weather(self, days: int):
+        self.retry_days = days
+        location = self.geocoding_cache.get(self.city_name)
+        if location is not None:
+            self.latitude = location["latitude"]
+            self.longitude = location["longitude"]
+            self.timezone = location.get("timezone") or self.timezone
+            self._fetch_weather_for_coords(self.latitude, self.longitude, days)
+            return
         
-        print(f"Caut coordonatele pentru {self.city_name}...")
-        self.network_manager.get(request)
-
-    def _fetch_weather_for_coords(self, lat, lon, days):
-        """Functie ajutatoare care preia vremea DUPA ce avem coordonatele."""
-        if self.is_cache_valid():
-            print("Folosim datele din cache")
-            self.weather_data_ready.emit(self.cached_weather)
+        city_name = self.city_name
+        url_string = self._geocoding_url(city_name)
+        if self.requests.is_pending(url_string, self.CURRENT_GROUP):
             return
             
-        base_url = "https://api.open-meteo.com/v1/forecast"
+        print(f"Caut coordonatele pentru {city_name}...")
+        self.requests.get(
+            url_string,
+            lambda data, error: self._on_geocoding_reply(city_name, days, data, error),
+            group=self.CURRENT_GROUP, supersede=True
+        )
+        
+    def _geocoding_url(self, city_name: str) -> str:
+        return f"{self.GEOCODING_URL}?name={city_name}&count=1&language=ro&format=json"
         
+    def _forecast_url(self, lat, lon, days: int, timezone: str, window: Optional[Tuple] = None) -> str:
+        """
+        URL-ul cererii de prognoza; lat/lon/timezone pot fi liste separate prin virgula.
+        Cu `window` se cer doar orele dintre start_hour si end_hour (fara date zilnice).
+        """
         params = {
             "latitude": lat,
             "longitude": lon,
-            "hourly": "temperature_2m,precipitation_probability,precipitation,weathercode,windspeed_10m",
-            "daily": "weathercode,temperature_2m_max,temperature_2m_min,precipitation_sum",
-            "timezone": "Europe/Bucharest",
+            "hourly": HOURLY_VARIABLES,
+            "daily": DAILY_VARIABLES,
+            "timezone": timezone,
             "forecast_days": min(days, 16)
         }
         
-        if self.temperature_unit == "fahrenheit":
-            params["temperature_unit"] = "fahrenheit"
+        if window is not None:
+            _, _, start, end = window
+            del params["daily"]
+            del params["forecast_days"]
+            params["start_hour"] = epoch_to_iso(start)
+            params["end_hour"] = epoch_to_iso(end)
             
-        url_parts = [f"{base_url}?"]
+        url_parts = [f"{self.FORECAST_URL}?"]
         for key, value in params.items():
             url_parts.append(f"{key}={value}&")
-        url_string = "".join(url_parts).rstrip("&")
+        return "".join(url_parts).rstrip("&")
         
-        request = QNetworkRequest(QUrl(url_string))
-        request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, 
-                         "WeatherScheduler/1.0")
+    def _fetch_weather_for_coords(self, lat, lon, days):
+        """Functie ajutatoare care preia vremea DUPA ce avem coordonatele."""
+        cache_key = self.make_cache_key(lat, lon, days)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            print(f"Folosim datele din cache ({self.cache.hits} hit / {self.cache.misses} miss)")
+            self._set_current(cache_key, cached)
+            self.weather_data_ready.emit(self.cached_weather)
+            return
+            
+        self._serve_stale(cache_key)
+        base = self.cache.peek(cache_key) if self.incremental_refresh else None
+        window = self._incremental_window(base, days) if base is not None else None
         
-        print(f"Solicit date meteo pentru {days} zile la {lat}, {lon}...")
-        self.network_manager.get(request)
+        url_string = self._forecast_url(lat, lon, days, self.timezone, window)
+        if self.requests.is_pending(url_string, self.CURRENT_GROUP):
+            print("Cererea pentru aceste date este deja in curs")
+            return
+            
+        if window is not None:
+            print(f"Actualizez incremental orele {epoch_to_iso(window[2])} - {epoch_to_iso(window[3])}...")
+        else:
+            print(f"Solicit date meteo pentru {days} zile la {lat}, {lon}...")
+        self.requests.get(
+            url_string,
+            lambda data, error: self._on_forecast_reply(cache_key, data, error, base, window),
+            group=self.CURRENT_GROUP, supersede=True
+        )
         
-    def handle_response(self, reply: QNetworkReply):
-        """Proceseaza raspunsul de la API (fie geocoding, fie weather)"""
+    def _serve_stale(self, cache_key: str):
+        """Afiseaza prognoza expirata din cache cat timp se descarca una noua"""
+        stale = self.cache.peek(cache_key)
+        if not self.stale_while_revalidate or stale is None or stale is self.canonical_weather:
+            return
+        if self.cache.age(cache_key) >= self.max_stale_age:
+            return
+            
+        print(f"Afisez prognoza din cache (veche de {self.cache.age(cache_key) / 60:.0f} min) pana la actualizare")
+        self._set_current(cache_key, stale)
+        self.weather_data_ready.emit(self.cached_weather)
         
-        url_string = reply.url().toString()
-
-        if "geocoding-api.open-meteo.com" in url_string:
-            if reply.error() == QNetworkReply.NetworkError.NoError:
-                data = reply.readAll()
-                try:
-                    geo_json = json.loads(bytes(data))
-                    if not geo_json.get("results"):
-                        self.weather_error.emit(f"Orasul '{self.city_name}' nu a fost gasit.")
-                        return
-                    
-                    result = geo_json["results"][0]
-                    self.latitude = result["latitude"]
-                    self.longitude = result["longitude"]
-                    print(f"Am gasit coordonatele: {self.latitude}, {self.longitude}")
-                    
-                    QTimer.singleShot(0, lambda: self._fetch_weather_for_coords(
-                        self.latitude, 
-                        self.longitude, 
-                        self.pending_days_request
-                    ))
-                    
-                except json.JSONDecodeError as e:
-                    self.weather_error.emit(f"Eroare la parsarea geocoding: {str(e)}")
+    def _on_fetch_failed(self, error_msg: str):
+        """
+        Eroare de retea pentru locatia curenta: cererea se reia dupa retry_delay(),
+        de cel mult MAX_RETRIES ori. Dupa ultima incercare, prognoza afisata este
+        pastrata doar daca nu depaseste max_stale_age.
+        """
+        print(error_msg)
+        if self.retry_attempt < self.MAX_RETRIES:
+            delay = self.retry_delay(self.retry_attempt)
+            self.retry_attempt += 1
+            print(f"Reincerc in {delay:.1f} s (incercarea {self.retry_attempt}/{self.MAX_RETRIES})")
+            self.retry_timer.start(int(delay * 1000))
+            self.weather_retry.emit(self.retry_attempt, delay, error_msg)
+            return
+            
+        self.retry_attempt = 0
+        age = self.current_age()
+        if age is not None and age >= self.max_stale_age:
+            self.cached_weather = None
+            self.canonical_weather = None
+            self.cache_key = None
+        self.weather_error.emit(error_msg)
+        
+    def _on_geocoding_reply(self, city_name: str, days: int, data: Optional[bytes], error: Optional[str]):
+        """Raspunsul geocoding pentru locatia curenta"""
+        if error is not None:
+            self._on_fetch_failed(f"Eroare la geocoding: {error}")
+            return
+            
+        try:
+            geo_json = json.loads(data)
+        except json.JSONDecodeError as e:
+            self.weather_error.emit(f"Eroare la parsarea geocoding: {str(e)}")
+            return
+            
+        if not geo_json.get("results"):
+            self.weather_error.emit(f"Orasul '{city_name}' nu a fost gasit.")
+            return
+            
+        result = geo_json["results"][0]
+        self.geocoding_cache.put(
+            city_name, result["latitude"], result["longitude"],
+            result.get("timezone"), result.get("name")
+        )
+        if city_name != self.city_name:
+            return
+            
+        self.latitude = result["latitude"]
+        self.longitude = result["longitude"]
+        self.timezone = result.get("timezone") or self.timezone
+        print(f"Am gasit coordonatele: {self.latitude}, {self.longitude}")
+        
+        self._fetch_weather_for_coords(self.latitude, self.longitude, days)
+        
+    def _on_forecast_reply(self, cache_key: str, data: Optional[bytes], error: Optional[str],
+                           base: Optional[Dict] = None, window: Optional[Tuple] = None):
+        """Raspunsul cererii de prognoza (completa sau incrementala) pentru locatia curenta"""
+        if error is not None:
+            self._on_fetch_failed(f"Eroare la solicitarea datelor meteo: {error}")
+            return
+            
+        def process(weather_json: Dict) -> Tuple[int, Dict]:
+            hours = len(weather_json.get("hourly", {}).get("time", []))
+            if window is not None:
+                return hours, self._splice_forecast(base, weather_json, window)
+            return hours, self.process_weather_data(weather_json)
+            
+        self.pipeline.cancel_group(self.CURRENT_GROUP)
+        self.pipeline.submit(
+            [("parse", json.loads), ("process", process)], data,
+            on_done=lambda result, timings: self._on_forecast_processed(
+                cache_key, "incremental" if window is not None else "full", len(data), result, timings
+            ),
+            on_error=self._on_processing_error,
+            group=self.CURRENT_GROUP
+        )
+        
+    def _on_forecast_processed(self, cache_key: str, mode: str, size: int,
+                               result: Optional[Tuple[int, Dict]], timings: Dict):
+        """Rezultatul prelucrarii din pool, livrat in firul principal"""
+        if result is None:
+            return
+            
+        hours, processed_data = result
+        self.last_refresh_stats = dict(timings, mode=mode, bytes=size, hours=hours)
+        print("Prognoza actualizata ({mode}): {bytes} octeti, {hours} ore, "
+              "parse {parse_ms:.1f} ms, procesare {process_ms:.1f} ms".format(**self.last_refresh_stats))
+        
+        self.retry_attempt = 0
+        self.cache.put(cache_key, processed_data)
+        self._set_current(cache_key, processed_data)
+        self.weather_data_ready.emit(self.cached_weather)
+        self._save_in_background()
+        
+    def _on_processing_error(self, message: str):
+        error_msg = f"Eroare la prelucrarea datelor meteo: {message}"
+        print(error_msg)
+        self.weather_error.emit(error_msg)
+        
+    def _save_in_background(self):
+        """Salveaza cache-ul pe disc dintr-un fir al pool-ului"""
+        self.pipeline.submit(
+            [("persist", self.cache.save)], self.cache.snapshot(),
+            on_done=lambda ok, timings: print(f"Cache salvat in {timings.get('persist_ms', 0):.1f} ms")
+        )
+        
+    def _local_now(self, data: Dict) -> int:
+        """Ora curenta (secunde, ora locala) in fusul orar al prognozei"""
+        offset = data.get("location", {}).get("utc_offset_seconds")
+        if offset is None:
+            return datetime_to_epoch(datetime.now())
+        return int(time.time()) + int(offset)
+        
+    def _incremental_window(self, base: Dict, days: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Intervalul de ore care trebuie descarcat din nou pentru prognoza din cache:
+        (inceputul zilei, sfarsitul orizontului, start, end).
+        Se reiau urmatoarele INCREMENTAL_HOURS ore, plus coada orizontului daca lipseste.
+        Intoarce None cand prognoza din cache nu poate fi completata (descarcare completa).
+        """
+        frame = as_frame(base.get("hourly"))
+        if not len(frame):
+            return None
+            
+        now = self._local_now(base)
+        day_start = now - now % 86400
+        horizon_end = day_start + min(days, 16) * 86400
+        start = now - now % 3600
+        
+        if frame.time[0] > day_start or frame.time[-1] < start:
+            return None
+            
+        end = min(horizon_end - 3600, start + self.INCREMENTAL_HOURS * 3600)
+        if frame.time[-1] < horizon_end - 3600:
+            end = horizon_end - 3600
+            
+        return day_start, horizon_end, start, end
+        
+    def _splice_forecast(self, base: Dict, raw_data: Dict, window: Tuple[int, int, int, int]) -> Dict:
+        """Integreaza orele descarcate incremental in prognoza din cache"""
+        day_start, horizon_end, _, _ = window
+        fetched = WeatherFrame.from_open_meteo(raw_data.get("hourly", {}))
+        hourly = as_frame(base["hourly"]).splice(fetched).between(day_start, horizon_end)
+        
+        daily = {d["date"]: d for d in base.get("daily", [])}
+        if len(fetched):
+            touched_from = fetched.time[0] - fetched.time[0] % 86400
+            touched_to = fetched.time[-1] - fetched.time[-1] % 86400 + 86400
+            for summary in hourly.between(touched_from, touched_to).daily_summary():
+                daily[summary["date"]] = summary
+                
+        first_date, last_date = epoch_to_iso(day_start)[:10], epoch_to_iso(horizon_end - 1)[:10]
+        location = dict(base.get("location", {}))
+        if raw_data.get("utc_offset_seconds") is not None:
+            location["utc_offset_seconds"] = raw_data["utc_offset_seconds"]
+            
+        return {
+            "hourly": hourly,
+            "daily": [daily[date] for date in sorted(daily) if first_date <= date <= last_date],
+            "location": location
+        }
+        
+    def fetch_many(self, locations: List[str], days: int = 7):
+        """
+        Preia prognoza pentru mai multe locatii deodata.
+        Coordonatele vin din cache-ul de geocoding (sau din cereri de geocoding in paralel),
+        apoi se trimite cate o singura cerere de prognoza pentru fiecare grup de
+        BATCH_SIZE locatii. La final se emite batch_weather_ready cu {locatie: date}.
+        """
+        names = list(dict.fromkeys(name.strip() for name in locations if name and name.strip()))
+        batch = {"days": days, "coords": {}, "results": {}, "errors": {}, "pending": 0}
+        
+        for name in names:
+            location = self.geocoding_cache.get(name)
+            if location is not None:
+                batch["coords"][name] = location
             else:
-                self.weather_error.emit(f"Eroare la geocoding: {reply.errorString()}")
-
-        elif "api.open-meteo.com/v1/forecast" in url_string:
-            if reply.error() == QNetworkReply.NetworkError.NoError:
-                data = reply.readAll()
-                try:
-                    weather_json = json.loads(bytes(data))
-                    processed_data = self.process_weather_data(weather_json)
-                    self.cached_weather = processed_data
-                    self.cache_timestamp = datetime.now()
-                    self.save_weather_to_file(processed_data)
-                    self.weather_data_ready.emit(processed_data)
-                    
-                except json.JSONDecodeError as e:
-                    error_msg = f"Eroare la parsarea raspunsului JSON: {str(e)}"
-                    print(error_msg)
-                    self.weather_error.emit(error_msg)
+                batch["pending"] += 1
+                self.requests.get(
+                    self._geocoding_url(name),
+                    lambda data, error, n=name: self._handle_batch_geocoding(batch, n, data, error)
+                )
+                
+        if batch["pending"] == 0:
+            self._fetch_batch_forecasts(batch)
+            
+    def _handle_batch_geocoding(self, batch: Dict, name: str, data: Optional[bytes], error: Optional[str]):
+        """Rezultatul geocoding pentru o locatie dintr-un lot"""
+        batch["pending"] -= 1
+        
+        if error is None:
+            try:
+                results = json.loads(data).get("results")
+                if results:
+                    result = results[0]
+                    self.geocoding_cache.put(
+                        name, result["latitude"], result["longitude"],
+                        result.get("timezone"), result.get("name")
+                    )
+                    batch["coords"][name] = self.geocoding_cache.get(name)
+                else:
+                    batch["errors"][name] = f"Orasul '{name}' nu a fost gasit."
+            except (json.JSONDecodeError, KeyError) as e:
+                batch["errors"][name] = f"Eroare la parsarea geocoding: {str(e)}"
+        else:
+            batch["errors"][name] = f"Eroare la geocoding: {error}"
+            
+        if batch["pending"] == 0:
+            self._fetch_batch_forecasts(batch)
+            
+    def _fetch_batch_forecasts(self, batch: Dict):
+        """Trimite cererile de prognoza grupate pentru locatiile care nu sunt in cache"""
+        days = batch["days"]
+        missing = []
+        
+        for name, location in batch["coords"].items():
+            cache_key = self.make_cache_key(location["latitude"], location["longitude"], days)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                batch["results"][name] = cached
             else:
-                error_msg = f"Eroare la solicitarea datelor meteo: {reply.errorString()}"
-                print(error_msg)
-                self.weather_error.emit(error_msg)
+                missing.append((name, location, cache_key))
+                
+        chunks = [missing[i:i + self.BATCH_SIZE] for i in range(0, len(missing), self.BATCH_SIZE)]
+        batch["pending"] = len(chunks)
+        
+        for chunk in chunks:
+            url_string = self._forecast_url(
+                ",".join(str(location["latitude"]) for _, location, _ in chunk),
+                ",".join(str(location["longitude"]) for _, location, _ in chunk),
+                days,
+                ",".join(location.get("timezone") or self.timezone for _, location, _ in chunk)
+            )
+            print(f"Solicit date meteo pentru {len(chunk)} locatii intr-o singura cerere...")
+            self.requests.get(
+                url_string,
+                lambda data, error, c=chunk: self._handle_batch_forecast(batch, c, data, error)
+            )
+            
+        if not chunks:
+            self._finish_batch(batch)
+            
+    def _handle_batch_forecast(self, batch: Dict, chunk: List, data: Optional[bytes], error: Optional[str]):
+        """Imparte raspunsul unei cereri grupate intr-o prognoza pentru fiecare locatie (in pool)"""
+        if error is not None:
+            self._on_batch_chunk_error(batch, chunk, f"Eroare la solicitarea datelor meteo: {error}")
+            return
+            
+        def process(weather_json) -> List[Dict]:
+            if isinstance(weather_json, dict):
+                weather_json = [weather_json]
+            return [self.process_weather_data(raw_data) for raw_data in weather_json]
+            
+        self.pipeline.submit(
+            [("parse", json.loads), ("process", process)], data,
+            on_done=lambda results, timings: self._on_batch_chunk_processed(batch, chunk, results),
+            on_error=lambda message: self._on_batch_chunk_error(
+                batch, chunk, f"Eroare la prelucrarea raspunsului: {message}"
+            )
+        )
         
-        reply.deleteLater()
+    def _on_batch_chunk_processed(self, batch: Dict, chunk: List, results: Optional[List[Dict]]):
+        batch["pending"] -= 1
+        for (name, _, cache_key), processed_data in zip(chunk, results or []):
+            self.cache.put(cache_key, processed_data)
+            batch["results"][name] = processed_data
+            
+        if batch["pending"] == 0:
+            self._finish_batch(batch)
+            
+    def _on_batch_chunk_error(self, batch: Dict, chunk: List, message: str):
+        batch["pending"] -= 1
+        for name, _, _ in chunk:
+            batch["errors"][name] = message
+            
+        if batch["pending"] == 0:
+            self._finish_batch(batch)
+            
+    def _finish_batch(self, batch: Dict):
+        if batch["results"]:
+            self._save_in_background()
+        if batch["errors"]:
+            self.weather_error.emit("\n".join(f"{name}: {error}" for name, error in batch["errors"].items()))
+        self.batch_weather_ready.emit({
+            name: self.to_display_units(data) for name, data in batch["results"].items()
+        })
         
     def process_weather_data(self, raw_data: Dict) -> Dict:
         """
         Proceseaza datele brute de la API intr-un format util pentru aplicatie
         """
         processed = {
-            "hourly": [],
+            "hourly": WeatherFrame.from_open_meteo(raw_data.get("hourly", {})),
             "daily": [],
             "location": {
                 "latitude": raw_data.get("latitude"),
-                "longitude": raw_data.get("longitude")
+                "longitude": raw_data.get("longitude"),
+                "utc_offset_seconds": raw_data.get("utc_offset_seconds")
             }
         }
         
-        hourly_data = raw_data.get("hourly", {})
-        times = hourly_data.get("time", [])
-        temperatures = hourly_data.get("temperature_2m", [])
-        precip_prob = hourly_data.get("precipitation_probability", [])
-        precip = hourly_data.get("precipitation", [])
-        weather_codes = hourly_data.get("weathercode", [])
-        wind_speeds = hourly_data.get("windspeed_10m", [])
-        
-        for i in range(len(times)):
-            hourly_entry = {
-                "datetime": times[i],
-                "temperature": temperatures[i] if i < len(temperatures) else None,
-                "precipitation_probability": precip_prob[i] if i < len(precip_prob) else 0,
-                "precipitation": precip[i] if i < len(precip) else 0,
-                "weather_code": weather_codes[i] if i < len(weather_codes) else 0,
-                "weather_description": self.get_weather_description(
-                    weather_codes[i] if i < len(weather_codes) else 0
-                ),
-                "wind_speed": wind_speeds[i] if i < len(wind_speeds) else 0
-            }
-            processed["hourly"].append(hourly_entry)
-            
         daily_data = raw_data.get("daily", {})
         daily_times = daily_data.get("time", [])
         temp_max = daily_data.get("temperature_2m_max", [])
@@ -207,123 +595,166 @@ class WeatherService(QObject):
         """
         Converteste codul WMO in descriere text
         """
-        weather_codes = {
-            0: "Senin",
-            1: "Predominant senin",
-            2: "Partial inorat",
-            3: "Inorat",
-            45: "Ceata",
-            48: "Ceata cu chiciura",
-            51: "Burnita usoara",
-            53: "Burnita moderata",
-            55: "Burnita densa",
-            61: "Ploaie usoara",
-            63: "Ploaie moderata",
-            65: "Ploaie torentiala",
-            71: "Ninsoare usoara",
-            73: "Ninsoare moderata",
-            75: "Ninsoare puternica",
-            77: "Fulgi de zapada",
-            80: "Averse usoare",
-            81: "Averse moderate",
-            82: "Averse puternice",
-            85: "Averse de zapada usoare",
-            86: "Averse de zapada puternice",
-            95: "Furtuna",
-            96: "Furtuna cu grindina usoara",
-            99: "Furtuna cu grindina puternica"
-        }
-        
-        return weather_codes.get(code, "Necunoscut")
+        return describe_weather_code(code)
         
     def check_rain_risk_for_tomorrow(self, schedule_entries: List[Dict]) -> List[Dict]:
         """
-        Verifica daca exista risc de ploaie pentru intervalele din ziua urmatoare
+        Verifica daca exista risc de ploaie pentru intervalele din ziua urmatoare,
+        pe toata durata fiecarui interval (nu doar la ora de inceput)
         """
         risky_entries = []
         
         if not self.cached_weather:
             return risky_entries
             
+        frame = as_frame(self.cached_weather["hourly"])
+        if not len(frame):
+            return risky_entries
+            
         tomorrow = (datetime.now() + timedelta(days=1)).date()
+        midnight = datetime_to_epoch(datetime.combine(tomorrow, datetime.min.time()))
+        intervals = {}
+        candidates, starts, ends = [], [], []
         
         for entry in schedule_entries:
             time_range = entry.get("time", "")
-            if "-" not in time_range:
+            if time_range not in intervals:
+                intervals[time_range] = self._tomorrow_interval(midnight, time_range)
+            interval = intervals[time_range]
+            if interval is None:
                 continue
                 
-            start_time_str = time_range.split("-")[0].strip()
+            candidates.append(entry)
+            starts.append(interval[0])
+            ends.append(interval[1])
             
-            try:
-                entry_datetime = datetime.strptime(
-                    f"{tomorrow} {start_time_str}", 
-                    "%Y-%m-%d %H:%M"
-                )
-            except ValueError:
-                continue
-                
-            for hourly in self.cached_weather["hourly"]:
-                hourly_dt = datetime.fromisoformat(hourly["datetime"])
-                time_diff = abs((hourly_dt - entry_datetime).total_seconds())
-                
-                if time_diff <= 1800: 
-                    precip_prob = hourly.get("precipitation_probability", 0)
-                    precip_amount = hourly.get("precipitation", 0)
-                    
-                    if precip_prob > 30 or precip_amount > 0:
-                        risky_entry = entry.copy()
-                        risky_entry["weather_data"] = hourly
-                        risky_entries.append(risky_entry)
-                        break
+        if not candidates:
+            return risky_entries
+            
+        aggregates = IntervalAggregates.for_frame(frame)
+        values = aggregates.aggregate(starts, ends)
+        risky = np.flatnonzero((values["samples"] > 0) & (
+            (values["precipitation_probability_max"] > 30) | (values["precipitation_sum"] > 0)))
+        if not len(risky):
+            return risky_entries
+        
+        records = aggregates.records(np.asarray(starts)[risky], np.asarray(ends)[risky],
+                                     {key: column[risky] for key, column in values.items()})
+        for i, record in zip(risky.tolist(), records):
+            risky_entry = candidates[i].copy()
+            risky_entry["weather_data"] = frame[int(values["precipitation_peak"][i])]
+            risky_entry["interval_weather"] = record
+            risky_entries.append(risky_entry)
                         
         return risky_entries
         
-    def convert_temperature(self, temp: float, from_unit: str, to_unit: str) -> float:
-        """Converteste temperatura intre Celsius si Fahrenheit"""
-        if from_unit == to_unit:
-            return temp
+    @staticmethod
+    def _tomorrow_interval(midnight: int, time_range: str) -> Optional[Tuple[int, int]]:
+        """Intervalul [inceput, sfarsit) de maine in secunde, sau None daca nu poate fi citit"""
+        if "-" not in time_range:
+            return None
             
-        if from_unit.lower() == "celsius" and to_unit.lower() == "fahrenheit":
-            return (temp * 9/5) + 32
-        elif from_unit.lower() == "fahrenheit" and to_unit.lower() == "celsius":
-            return (temp - 32) * 5/9
-        else:
+        start_time_str, end_time_str = time_range.split("-", 1)
+        start_seconds = _clock_seconds(start_time_str)
+        if start_seconds is None:
+            return None
+            
+        entry_ts = midnight + start_seconds
+        end_seconds = _clock_seconds(end_time_str)
+        if end_seconds is None:
+            # fara sfarsit valid se verifica doar ora din jurul inceputului
+            return entry_ts - 1800, entry_ts + 1801
+            
+        end_ts = midnight + end_seconds
+        if end_ts <= entry_ts:
+            end_ts += 24 * 3600
+        return entry_ts, end_ts
+        
+    def convert_temperature(self, temp, from_unit: str, to_unit: str):
+        """Converteste temperatura (valoare sau vector NumPy) intre Celsius si Fahrenheit"""
+        from_unit, to_unit = from_unit.lower(), to_unit.lower()
+        if from_unit not in TEMPERATURE_UNITS or to_unit not in TEMPERATURE_UNITS:
             return temp
+        return convert_temperature(temp, from_unit, to_unit)
+            
+    def _set_current(self, cache_key: str, data: Dict):
+        """
+        Marcheaza intrarea din cache afisata in prezent;
+        cached_weather este copia ei in unitatile de afisare
+        """
+        self.cache_key = cache_key
+        self.canonical_weather = data
+        self.cache_timestamp = datetime.fromtimestamp(self.cache.timestamp(cache_key))
+        self._update_display()
             
     def is_cache_valid(self) -> bool:
-        """Verifica daca cache-ul este inca valid"""
-        if not self.cached_weather or not self.cache_timestamp:
+        """Verifica daca prognoza curenta este inca valida in cache"""
+        if not self.cached_weather or not self.cache_key:
             return False
             
-        elapsed = (datetime.now() - self.cache_timestamp).total_seconds()
-        return elapsed < self.cache_duration
+        age = self.cache.age(self.cache_key)
+        return age is not None and age < self.cache_duration
         
-    def save_weather_to_file(self, data: Dict):
-        """Salveaza datele meteo in fisier JSON pentru persistenta"""
-        try:
-            with open("resources/weather_cache.json", "w", encoding="utf-8") as f:
-                json.dump({
-                    "timestamp": datetime.now().isoformat(),
-                    "data": data
-                }, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"Nu s-au putut salva datele meteo: {e}")
-            
-    def load_weather_from_file(self) -> Optional[Dict]:
-        """Incarca datele meteo din fisier daca exista"""
-        try:
-            with open("resources/weather_cache.json", "r", encoding="utf-8") as f:
-                cached = json.load(f)
-                
-            timestamp = datetime.fromisoformat(cached["timestamp"])
-            elapsed = (datetime.now() - timestamp).total_seconds()
+    def shutdown(self):
+        """
+        Opreste serviciul inainte de distrugere: anuleaza cererile, reincercarile si
+        prelucrarile pentru locatia curenta, apoi asteapta joburile din pool (inclusiv
+        salvarile cache-ului), ca sa nu se termine dupa ce obiectele Qt au disparut
+        """
+        self.requests.abort_all()
+        self.retry_timer.stop()
+        self.pipeline.cancel_group(self.CURRENT_GROUP)
+        self.pipeline.wait_for_done()
+        
+    def save_weather_to_file(self) -> bool:
+        """
+        Salveaza cache-ul de prognoze in fisier pentru persistenta
+        (sincron, dupa terminarea prelucrarilor/salvarilor din fundal)
+        """
+        self.pipeline.wait_for_done()
+        return self.cache.save()
             
-            if elapsed < self.cache_duration:
-                self.cached_weather = cached["data"]
-                self.cache_timestamp = timestamp
-                return cached["data"]
-                
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
-            pass
+    def load_weather_from_file(self, days: int = 7) -> Optional[Dict]:
+        """
+        Incarca cache-ul de prognoze de pe disc si intoarce prognoza pe `days` zile
+        pentru locatia curenta, daca este inca valida. Cu stale_while_revalidate, este
+        intoarsa si o prognoza expirata mai noua de max_stale_age (marcata cu "stale": True).
+        Fara coordonatele locatiei in cache-ul de geocoding nu se intoarce nimic: prognoza
+        altei localitati nu trebuie afisata ca fiind a celei curente.
+        """
+        self.cache.load(legacy_key=lambda data: self.make_cache_key(
+            data.get("location", {}).get("latitude", self.latitude),
+            data.get("location", {}).get("longitude", self.longitude),
+            len(data.get("daily", [])) or 7
+        ))
+        
+        location = self.geocoding_cache.get(self.city_name)
+        if location is None:
+            return None
             
-        return None
\ No newline at end of file
+        cache_key = self.make_cache_key(location["latitude"], location["longitude"], days)
+        data = self.cache.peek(cache_key)
+        if data is None:
+            return None
+            
+        self.latitude = location["latitude"]
+        self.longitude = location["longitude"]
+        self.timezone = location.get("timezone") or self.timezone
+        age = self.cache.age(cache_key)
+        max_age = self.max_stale_age if self.stale_while_revalidate else self.cache_duration
+        if age is not None and age < max_age:
+            self._set_current(cache_key, data)
+            return self.cached_weather
+            
+        return None
+
+
+def _clock_seconds(text: str) -> Optional[int]:
+    """Secundele de la miezul noptii pentru "HH:MM", sau None daca ora este invalida"""
+    hours, _, minutes = text.strip().partition(":")
+    if not (hours.isdigit() and minutes.isdigit() and len(hours) <= 2 and len(minutes) <= 2):
+        return None
+    hours, minutes = int(hours), int(minutes)
+    if hours > 23 or minutes > 59:
+        return None
+    return hours * 3600 + minutes * 60
@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+import unittest
+
+from core.forecast_cache import ForecastCache
+
+HOURLY = [
+    {"datetime": "2025-12-29T00:00", "temperature": 33.8, "precipitation_probability": 0,
+     "precipitation": 0.0, "weather_code": 0, "weather_description": "Senin", "wind_speed": 11.5},
+    {"datetime": "2025-12-29T01:00", "temperature": 50.0, "precipitation_probability": 20,
+     "precipitation": 0.1, "weather_code": 3, "weather_description": "Innorat", "wind_speed": 9.0}
+]
+DAILY = [{"date": "2025-12-29", "temperature_max": 50.0, "temperature_min": 32.0,
+          "precipitation_sum": 0.1, "weather_code": 3, "weather_description": "Innorat"}]
+
+
+class LegacyMigrationTest(unittest.TestCase):
+    """Migrarea vechiului cache JSON (salvat in unitatea de afisare) in cache-ul canonic (°C, km/h)"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.legacy_path = self.path("weather_cache.json")
+        self.settings_path = self.path("settings.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def write(self, path, payload):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+
+    def write_legacy_v1(self):
+        self.write(self.legacy_path, {
+            "timestamp": "2025-12-29T16:31:44",
+            "data": {"hourly": HOURLY, "daily": DAILY, "location": {"latitude": 44.43, "longitude": 26.1}}
+        })
+
+    def load(self):
+        cache = ForecastCache(self.path("weather_cache.bin"), ttl=10 ** 12,
+                              legacy_file_path=self.legacy_path, legacy_settings_path=self.settings_path)
+        cache.load(legacy_key=lambda data: ForecastCache.make_key(44.43, 26.1, "celsius", 7, "v"))
+        return cache
+
+    def test_fahrenheit_file_is_converted_to_celsius(self):
+        self.write(self.settings_path, {"temperature_unit": "fahrenheit", "wind_unit": "m/s"})
+        self.write_legacy_v1()
+
+        cache = self.load()
+        data = cache.peek(ForecastCache.make_key(44.43, 26.1, "celsius", 7, "v"))
+
+        self.assertIsNotNone(data)
+        self.assertNotIn("units", data)
+        self.assertAlmostEqual(float(data["hourly"].temperature[0]), 1.0, places=4)
+        self.assertAlmostEqual(float(data["hourly"].temperature[1]), 10.0, places=4)
+        # vantul era salvat mereu in km/h, indiferent de setari
+        self.assertAlmostEqual(float(data["hourly"].wind_speed[0]), 11.5, places=4)
+        self.assertEqual(data["daily"][0]["temperature_max"], 10.0)
+        self.assertEqual(data["daily"][0]["temperature_min"], 0.0)
+        self.assertTrue(os.path.exists(self.path("weather_cache.bin")))
+
+    def test_celsius_file_is_kept(self):
+        self.write(self.settings_path, {"temperature_unit": "celsius"})
+        self.write_legacy_v1()
+
+        data = self.load().peek(ForecastCache.make_key(44.43, 26.1, "celsius", 7, "v"))
+
+        self.assertAlmostEqual(float(data["hourly"].temperature[0]), 33.8, places=4)
+
+    def test_unknown_unit_drops_the_entry(self):
+        self.write_legacy_v1()
+
+        for settings in (None, {"wind_unit": "km/h"}, {"temperature_unit": "kelvin"}):
+            if settings is not None:
+                self.write(self.settings_path, settings)
+            self.assertEqual(len(self.load().entries), 0, settings)
+
+    def test_keyed_entries_use_the_unit_from_their_key(self):
+        key = ForecastCache.make_key(44.43, 26.1, "fahrenheit", 7, "v")
+        self.write(self.legacy_path, {"version": 2, "entries": [
+            {"key": key, "timestamp": 1767000000.0, "data": {"hourly": HOURLY, "daily": DAILY}}
+        ]})
+
+        cache = self.load()
+
+        self.assertIsNone(cache.peek(key))
+        data = cache.peek(ForecastCache.with_unit(key, "celsius"))
+        self.assertAlmostEqual(float(data["hourly"].temperature[0]), 1.0, places=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
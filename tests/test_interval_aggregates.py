@@ -0,0 +1,84 @@
+import unittest
+
+import numpy as np
+
+from core.interval_aggregates import IntervalAggregates
+from core.weather_frame import WeatherFrame
+
+START = 1_800_000_000
+
+
+def frame(count, step, seed=14):
+    rng = np.random.default_rng(seed)
+    temperature = np.round(rng.normal(10, 6, count), 1)
+    temperature[rng.random(count) < 0.05] = np.nan
+    return WeatherFrame(START + np.arange(count) * step, temperature, rng.integers(0, 101, count),
+                        np.round(rng.random(count) * 3, 1), rng.choice([0, 1, 3, 61, 63, 95], count),
+                        np.round(rng.gamma(3.0, 4.0, count), 1))
+
+
+class IntervalAggregatesTest(unittest.TestCase):
+    """Sumele prefix si tabelele rare comparate cu numpy pe aceleasi inregistrari"""
+
+    def check(self, weather, step, windows):
+        starts = np.array([start for start, _ in windows], dtype=np.int64)
+        ends = np.array([end for _, end in windows], dtype=np.int64)
+        values = IntervalAggregates(weather).aggregate(starts, ends)
+
+        for i, (start, end) in enumerate(windows):
+            # o inregistrare de la t acopera [t, t + pas)
+            rows = (weather.time < end) & (weather.time + step > start)
+            self.assertEqual(values["samples"][i], rows.sum(), (start, end))
+            if not rows.any():
+                continue
+            self.assertAlmostEqual(values["precipitation_sum"][i], weather.precipitation[rows].sum(dtype=np.float64),
+                                   places=4)
+            self.assertEqual(values["precipitation_probability_max"][i], weather.precipitation_probability[rows].max())
+            self.assertEqual(values["weather_code"][i], weather.weather_code[rows].max())
+            self.assertEqual(values["wind_speed_max"][i], weather.wind_speed[rows].max())
+            temperatures = weather.temperature[rows]
+            if np.isnan(temperatures).all():
+                self.assertTrue(np.isnan(values["temperature_min"][i]))
+            else:
+                self.assertEqual(values["temperature_min"][i], np.nanmin(temperatures))
+                self.assertEqual(values["temperature_max"][i], np.nanmax(temperatures))
+            peak = values["precipitation_peak"][i]
+            self.assertEqual(weather.precipitation_probability[peak], values["precipitation_probability_max"][i])
+
+    def test_one_hour_slots(self):
+        weather = frame(168, 3600)
+        self.check(weather, 3600, [(START + h * 3600, START + (h + 1) * 3600) for h in range(168)])
+        # o ora care incepe la jumatatea unei inregistrari acopera doua inregistrari
+        self.check(weather, 3600, [(START + 1800 + h * 3600, START + 5400 + h * 3600) for h in range(167)])
+
+    def test_random_slots(self):
+        weather = frame(384, 3600)
+        rng = np.random.default_rng(1)
+        starts = START + rng.integers(0, 384 * 60, 500) * 60
+        lengths = rng.choice([60, 90, 120, 180, 240, 600], 500) * 60
+        self.check(weather, 3600, list(zip(starts.tolist(), (starts + lengths).tolist())))
+
+    def test_slots_past_the_end_of_the_forecast(self):
+        weather = frame(48, 3600)
+        last = START + 47 * 3600
+        self.check(weather, 3600, [(last - 3600, last + 4 * 3600), (last + 1800, last + 7200),
+                                   (last + 3600, last + 7200), (START - 7200, START + 1800),
+                                   (START - 7200, START)])
+
+        values = IntervalAggregates(weather).aggregate([last + 3600, START - 7200], [last + 7200, START])
+        self.assertEqual(values["samples"].tolist(), [0, 0])
+
+    def test_quarter_hour_resolution(self):
+        weather = frame(16 * 24 * 4, 900)
+        rng = np.random.default_rng(2)
+        starts = START + rng.integers(0, 16 * 24 * 4, 500) * 900 + rng.choice([0, 300], 500)
+        lengths = rng.choice([900, 3600, 5400, 7200], 500)
+        self.check(weather, 900, list(zip(starts.tolist(), (starts + lengths).tolist())))
+
+    def test_single_record(self):
+        weather = frame(1, 3600)
+        self.check(weather, 3600, [(START, START + 3600), (START + 600, START + 1200), (START + 3600, START + 7200)])
+
+
+if __name__ == "__main__":
+    unittest.main()
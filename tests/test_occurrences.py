@@ -0,0 +1,45 @@
+import unittest
+
+from core.occurrences import WEEK, expand_schedule
+
+START = 1_800_000_000
+FIRSTS = {"Luni": ("2027-01-18", START, START + 7200), "Marti": ("2027-01-19", START + 86400, START + 93600)}
+
+
+def first_occurrence(day_name, time_range):
+    return FIRSTS.get(day_name)
+
+
+class ExpandScheduleTest(unittest.TestCase):
+    """Intrarile fara aparitii raman in rezultat (cu None), in ambele moduri"""
+
+    entries = [
+        {"day": "Luni", "time": "08:00-10:00", "subject": "a"},
+        {"day": "Zi gresita", "time": "08:00-10:00", "subject": "b"},
+        {"day": "Marti", "time": "08:00-10:00", "subject": "c", "except": "2027-01-19"},
+    ]
+
+    def test_horizon_keeps_entries_without_occurrences(self):
+        rows = list(expand_schedule(self.entries, first_occurrence, horizon_end=START + WEEK))
+
+        self.assertEqual([index for index, _ in rows], [0, 1, 2])
+        self.assertEqual(rows[0][1][0], "2027-01-18")
+        self.assertIsNone(rows[1][1])
+        self.assertIsNone(rows[2][1])
+
+    def test_horizon_expands_weekly(self):
+        rows = list(expand_schedule(self.entries, first_occurrence, horizon_end=START + 2 * WEEK + 86400 + 1))
+
+        self.assertEqual([index for index, occurrence in rows if occurrence is not None], [0, 0, 0, 2, 2])
+        self.assertEqual([index for index, occurrence in rows if occurrence is None], [1])
+
+    def test_next_occurrence_mode(self):
+        rows = list(expand_schedule(self.entries, first_occurrence))
+
+        self.assertEqual([index for index, _ in rows], [0, 1, 2])
+        self.assertIsNone(rows[1][1])
+        self.assertEqual(rows[2][1][0], "2027-01-26")
+
+
+if __name__ == "__main__":
+    unittest.main()
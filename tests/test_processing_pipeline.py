@@ -0,0 +1,54 @@
+import threading
+import unittest
+
+from PyQt6 import sip
+from PyQt6.QtCore import QCoreApplication
+
+from core.processing_pipeline import ProcessingJob, ProcessingPipeline
+
+
+class ProcessingPipelineTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_result_is_delivered_in_the_main_thread(self):
+        pipeline = ProcessingPipeline()
+        results = []
+        pipeline.submit([("double", lambda x: x * 2), ("inc", lambda x: x + 1)], 20,
+                        on_done=lambda value, timings: results.append((value, threading.current_thread(),
+                                                                       sorted(timings))))
+        pipeline.wait_for_done()
+        QCoreApplication.processEvents()
+
+        value, thread, timings = results[0]
+        self.assertEqual(value, 41)
+        self.assertIs(thread, threading.main_thread())
+        self.assertEqual(timings, ["double_ms", "inc_ms", "queue_ms", "total_ms"])
+        self.assertEqual(pipeline.jobs, [])
+
+    def test_job_outliving_its_signals_does_not_raise(self):
+        for stages in ([("persist", lambda x: x)], [("persist", lambda x: 1 / 0)]):
+            job = ProcessingJob(stages, 1)
+            sip.delete(job.signals)
+            job.run()
+
+    def test_cancelled_group_is_not_delivered(self):
+        pipeline = ProcessingPipeline(max_threads=1)
+        gate = threading.Event()
+        results = []
+        pipeline.submit([("wait", lambda x: gate.wait(5))], None, on_done=lambda *args: None)
+        pipeline.submit([("a", lambda x: x)], "current", on_done=lambda value, timings: results.append(value),
+                        group="current")
+        pipeline.submit([("a", lambda x: x)], "other", on_done=lambda value, timings: results.append(value))
+
+        pipeline.cancel_group("current")
+        gate.set()
+        pipeline.wait_for_done()
+        QCoreApplication.processEvents()
+
+        self.assertEqual(results, ["other"])
+
+
+if __name__ == "__main__":
+    unittest.main()
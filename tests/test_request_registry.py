@@ -0,0 +1,75 @@
+import unittest
+
+from core.request_registry import RequestRegistry
+from core.transport import Transport, TransportRequest
+
+
+class ManualTransport(Transport):
+    """Transport de test: raspunsurile sunt livrate explicit, cu deliver()"""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url_string, callback):
+        handle = TransportRequest()
+        self.requests.append((url_string, handle, callback))
+        return handle
+
+    def deliver(self, url_string, data=b"{}"):
+        for url, handle, callback in self.requests:
+            if url == url_string and not handle.aborted:
+                callback(data, None)
+
+
+class RequestRegistryGroupTest(unittest.TestCase):
+    """Cereri refolosite de mai multe grupuri, anulate doar pentru grupul inlocuit"""
+
+    def setUp(self):
+        self.transport = ManualTransport()
+        self.registry = RequestRegistry(self.transport)
+        self.replies = []
+
+    def callback(self, name):
+        return lambda data, error: self.replies.append(name)
+
+    def test_abort_group_keeps_callbacks_of_other_groups(self):
+        # lot fetch_many (fara grup), apoi cererea "current" pentru acelasi oras
+        self.registry.get("geo?name=Iasi", self.callback("batch"))
+        self.registry.get("geo?name=Iasi", self.callback("current"), group="current", supersede=True)
+        self.assertEqual(len(self.transport.requests), 1)
+
+        # locatia se schimba: cererea "current" este inlocuita
+        self.registry.get("geo?name=Cluj", self.callback("current Cluj"), group="current", supersede=True)
+
+        self.assertTrue(self.registry.is_pending("geo?name=Iasi"))
+        self.assertFalse(self.registry.is_pending("geo?name=Iasi", "current"))
+        self.assertFalse(self.transport.requests[0][1].aborted)
+        self.assertEqual(self.registry.aborted, 0)
+
+        self.transport.deliver("geo?name=Iasi")
+        self.transport.deliver("geo?name=Cluj")
+        self.assertEqual(self.replies, ["batch", "current Cluj"])
+
+    def test_group_joining_a_shared_request_is_aborted_alone(self):
+        self.registry.get("geo?name=Iasi", self.callback("current"), group="current")
+        self.registry.get("geo?name=Iasi", self.callback("batch"))
+
+        self.registry.abort_group("current")
+
+        self.transport.deliver("geo?name=Iasi")
+        self.assertEqual(self.replies, ["batch"])
+
+    def test_request_without_other_callbacks_is_aborted(self):
+        self.registry.get("geo?name=Iasi", self.callback("current"), group="current")
+
+        self.registry.abort_group("current")
+
+        self.assertTrue(self.transport.requests[0][1].aborted)
+        self.assertFalse(self.registry.is_pending("geo?name=Iasi"))
+        self.assertEqual(self.registry.aborted, 1)
+        self.transport.deliver("geo?name=Iasi")
+        self.assertEqual(self.replies, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
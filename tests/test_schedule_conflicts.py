@@ -0,0 +1,112 @@
+import random
+import unittest
+from itertools import combinations
+
+from core.schedule_conflicts import _compatible, _parity
+from core.schedule_index import day_key, entry_minutes
+from core.schedule_manager import ScheduleManager
+
+
+def entry(day, time, subject, location="C309", **extra):
+    return dict(day=day, time=time, subject=subject, location=location, **extra)
+
+
+class FindConflictsTest(unittest.TestCase):
+    """Conflictele gasite de parcurgerea fiecarei zile (sweep line cu heap)"""
+
+    def conflicts(self, *entries, transfer_minutes=10):
+        manager = ScheduleManager()
+        manager.schedule = [manager._validate_entry(e) for e in entries]
+        return manager.find_conflicts(transfer_minutes)
+
+    def pairs(self, report, kind):
+        return sorted(tuple(sorted((first["subject"], second["subject"])))
+                      for first, second in (c["entries"] for c in report["conflicts"] if c["type"] == kind))
+
+    def test_touching_intervals_do_not_conflict(self):
+        report = self.conflicts(entry("Luni", "08:00-10:00", "A"), entry("Luni", "10:00-12:00", "B"))
+
+        self.assertEqual(report["total"], 0)
+        self.assertEqual(report["conflicts"], [])
+
+    def test_overlap_is_reported_with_its_window(self):
+        report = self.conflicts(entry("Luni", "08:00-10:00", "A", "C1"), entry("Luni", "09:30-11:00", "B", "C2"))
+
+        self.assertEqual(report["counts"], {"person": 1, "location": 0, "transfer": 0})
+        conflict = report["conflicts"][0]
+        self.assertEqual((conflict["start"], conflict["end"]), ("09:30", "10:00"))
+
+    def test_nested_overlaps(self):
+        report = self.conflicts(entry("Luni", "08:00-14:00", "A", "C1"),
+                                entry("Luni", "09:00-10:00", "B", "C2"),
+                                entry("Luni", "11:00-12:00", "C", "C3"))
+
+        self.assertEqual(self.pairs(report, "person"), [("A", "B"), ("A", "C")])
+
+    def test_chained_overlaps(self):
+        # A-B si B-C se suprapun, A si C nu
+        report = self.conflicts(entry("Luni", "08:00-10:00", "A", "C1"),
+                                entry("Luni", "09:00-11:00", "B", "C2"),
+                                entry("Luni", "10:00-12:00", "C", "C3"))
+
+        self.assertEqual(self.pairs(report, "person"), [("A", "B"), ("B", "C")])
+
+    def test_same_slot_other_room_and_same_room(self):
+        groups = {"group": "G1"}, {"group": "G2"}
+        other_room = self.conflicts(entry("Luni", "08:00-10:00", "A", "C309", **groups[0]),
+                                    entry("Luni", "08:00-10:00", "B", "C310", **groups[1]))
+        same_room = self.conflicts(entry("Luni", "08:00-10:00", "A", "C309", **groups[0]),
+                                   entry("Luni", "08:00-10:00", "B", "C309", **groups[1]))
+
+        self.assertEqual(other_room["total"], 0)
+        self.assertEqual(same_room["counts"], {"person": 0, "location": 1, "transfer": 0})
+        self.assertEqual(same_room["by_location"], {"C309": 1})
+
+    def test_different_days_do_not_conflict(self):
+        report = self.conflicts(entry("Luni", "08:00-10:00", "A"), entry("Marți", "08:00-10:00", "B"))
+
+        self.assertEqual(report["total"], 0)
+
+    def test_alternating_weeks_do_not_conflict(self):
+        report = self.conflicts(entry("Luni", "08:00-10:00", "A", weeks="par"),
+                                entry("Luni", "08:00-10:00", "B", weeks="impar"),
+                                entry("Luni", "09:00-10:00", "C", "C1"))
+
+        self.assertEqual(self.pairs(report, "person"), [("A", "C"), ("B", "C")])
+        self.assertEqual(report["counts"]["location"], 0)
+
+    def test_short_transfer_between_buildings(self):
+        report = self.conflicts(entry("Luni", "08:00-10:00", "A", "C309"),
+                                entry("Luni", "10:05-12:00", "B", "AN012"),
+                                entry("Luni", "12:00-13:00", "C", "AN014"))
+
+        self.assertEqual(self.pairs(report, "transfer"), [("A", "B")])
+
+    def test_counts_match_a_pairwise_scan(self):
+        rng = random.Random(21)
+        entries = []
+        for _ in range(300):
+            start = rng.randrange(8 * 60, 20 * 60, 30)
+            end = start + rng.choice((30, 60, 120))
+            entries.append(entry(rng.choice(["Luni", "Marți", "luni"]),
+                                 f"{start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}",
+                                 "X", f"C{rng.randrange(8)}", group=f"G{rng.randrange(4)}",
+                                 weeks=rng.choice(["", "par", "impar"])))
+
+        report = self.conflicts(*entries, transfer_minutes=0)
+
+        expected = {"person": 0, "location": 0}
+        manager = ScheduleManager()
+        validated = [manager._validate_entry(e) for e in entries]
+        for first, second in combinations(validated, 2):
+            (s1, e1), (s2, e2) = entry_minutes(first), entry_minutes(second)
+            if (day_key(first["day"]) != day_key(second["day"]) or not (s1 < e2 and s2 < e1)
+                    or not _compatible(_parity(first), _parity(second))):
+                continue
+            expected["person"] += first["group"] == second["group"]
+            expected["location"] += first["location"] == second["location"]
+        self.assertEqual({kind: report["counts"][kind] for kind in expected}, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import random
+import unittest
+
+from core.schedule_index import DayIndex, entry_minutes
+from core.schedule_manager import ScheduleManager
+
+DAYS = ["Luni", "Marți", "Miercuri", "Joi", "Vineri"]
+
+
+def random_entry(rng):
+    start = rng.randrange(0, 24 * 60, 5)
+    length = rng.choice((5, 30, 60, 90, 120, 180, 600))
+    # intervalele care trec de miezul noptii se termina la 00:00
+    end = min(start + length, 24 * 60) % (24 * 60)
+    return {
+        "day": rng.choice(DAYS),
+        "time": f"{start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}",
+        "subject": f"Materia {rng.randrange(20)}",
+        "location": f"C{rng.randrange(10)}"
+    }
+
+
+def brute_overlapping(entries, day_name, start, end):
+    found = [entry for entry in entries if entry["day"] == day_name]
+    found = [entry for entry in found if start < end and entry_minutes(entry)[0] < end and start < entry_minutes(entry)[1]]
+    return sorted(map(id, found))
+
+
+class ScheduleIndexTest(unittest.TestCase):
+    """Interogarile indexului comparate cu o parcurgere completa a orarului"""
+
+    def setUp(self):
+        self.rng = random.Random(20)
+        self.manager = ScheduleManager()
+        self.manager.schedule = [self.manager._validate_entry(random_entry(self.rng)) for _ in range(400)]
+
+    def assert_matches_scan(self, queries=300):
+        schedule = self.manager.schedule
+        for _ in range(queries):
+            day_name = self.rng.choice(DAYS)
+            start = self.rng.randrange(-60, 26 * 60)
+            end = start + self.rng.choice((0, 1, 15, 60, 240, 2000))
+            found = self.manager.get_entries_overlapping(day_name, start, end)
+            self.assertEqual(sorted(map(id, found)), brute_overlapping(schedule, day_name, start, end),
+                             (day_name, start, end))
+            self.assertEqual([entry_minutes(entry)[0] for entry in found],
+                             sorted(entry_minutes(entry)[0] for entry in found))
+
+            at = self.manager.get_entries_at(day_name, start)
+            self.assertEqual(sorted(map(id, at)), brute_overlapping(schedule, day_name, start, start + 1))
+
+    def test_queries_match_a_full_scan(self):
+        self.assert_matches_scan()
+
+    def test_empty_and_zero_length_windows(self):
+        self.assertEqual(self.manager.get_entries_overlapping("Luni", "10:00", "10:00"), [])
+        self.assertEqual(self.manager.get_entries_overlapping("Luni", "12:00", "10:00"), [])
+        self.assertEqual(self.manager.get_entries_overlapping("Sâmbătă", "00:00", "23:59"), [])
+
+        self.manager.schedule = []
+        self.assertEqual(self.manager.get_entries_at("Luni", "10:00"), [])
+        self.assertEqual(self.manager.get_entries_overlapping("Luni", 0, 24 * 60), [])
+
+    def test_queries_after_edits(self):
+        self.assert_matches_scan(50)
+        for _ in range(200):
+            action = self.rng.random()
+            if action < 0.4:
+                self.manager.add_entry(random_entry(self.rng))
+            elif action < 0.7 and self.manager.schedule:
+                self.manager.update_entry(self.rng.randrange(len(self.manager.schedule)), random_entry(self.rng))
+            elif self.manager.schedule:
+                self.manager.remove_entry(self.rng.randrange(len(self.manager.schedule)))
+            if self.rng.random() < 0.1:
+                self.assert_matches_scan(20)
+        self.assert_matches_scan()
+
+    def test_queries_after_schedule_is_reassigned(self):
+        self.assert_matches_scan(50)
+
+        self.manager.schedule = [self.manager._validate_entry(random_entry(self.rng)) for _ in range(37)]
+        self.assert_matches_scan()
+
+        self.manager.add_entry(random_entry(self.rng))
+        self.assert_matches_scan()
+
+    def test_tree_sizes_around_powers_of_two(self):
+        # augmentarea are cazuri speciale pentru ultimul nod al unui arbore incomplet
+        for count in (1, 2, 3, 7, 8, 9, 15, 16, 17, 31, 33, 64, 100):
+            day = DayIndex()
+            items = []
+            for i in range(count):
+                start = self.rng.randrange(0, 1000)
+                end = start + self.rng.choice((1, 10, 500))
+                day.add(start, end, {"n": i})
+                items.append((start, end))
+            for start in range(-5, 1520, 7):
+                for length in (1, 30, 400):
+                    expected = sum(1 for s, e in items if s < start + length and start < e)
+                    self.assertEqual(len(list(day.overlapping(start, start + length))), expected,
+                                     (count, start, length))
+
+
+if __name__ == "__main__":
+    unittest.main()
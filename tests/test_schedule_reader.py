@@ -0,0 +1,128 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core import schedule_reader
+from core.schedule_manager import ScheduleManager
+from core.schedule_reader import ScheduleFormatError, iter_json_entries, parse_time_range
+
+ENTRIES = [
+    {"day": "Luni", "time": "08:00-10:00", "subject": "Programare în C", "location": "C309",
+     "except": ["2026-12-22"], "weeks": "impar"},
+    {"day": "Marți", "time": "10:00-12:00", "subject": "Baze de date", "location": "A203", "credits": 5.25},
+    {"day": "Miercuri", "time": "22:00-00:00", "subject": "Observatii", "location": ""},
+]
+
+
+class ScheduleReaderTest(unittest.TestCase):
+    """Citirea incrementala a orarului si colectarea erorilor pe randuri"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.manager = ScheduleManager()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content, encoding="utf-8"):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding=encoding, newline="") as f:
+            f.write(content)
+        return path
+
+    def test_json_split_across_chunks(self):
+        text = json.dumps({"version": 1, "meta": {"list": [1, 2.5, "x]"]}, "schedule": ENTRIES, "after": -1.5e3},
+                          ensure_ascii=False, indent=2)
+        path = self.write("orar.json", text)
+
+        for chunk_size in (1, 2, 3, 7, 64):
+            with mock.patch.object(schedule_reader, "CHUNK_SIZE", chunk_size):
+                rows = list(iter_json_entries(path))
+            self.assertEqual([entry for _, entry in rows], ENTRIES, chunk_size)
+            # linia unei intrari este cea pe care incepe obiectul ei
+            lines = text.splitlines()
+            for line, entry in rows:
+                self.assertEqual(lines[line - 1].strip(), "{", chunk_size)
+                self.assertIn(json.dumps(entry["day"], ensure_ascii=False), lines[line], chunk_size)
+
+    def test_json_with_bom(self):
+        path = self.write("orar.json", json.dumps({"schedule": ENTRIES}, ensure_ascii=False), "utf-8-sig")
+
+        with mock.patch.object(schedule_reader, "CHUNK_SIZE", 2):
+            result = self.manager.load_from_json(path)
+
+        self.assertEqual(result["status"], "success", result)
+        self.assertEqual([entry["subject"] for entry in result["schedule"]],
+                         ["Programare în C", "Baze de date", "Observatii"])
+
+    def test_truncated_json_reports_its_line(self):
+        path = self.write("orar.json", '{\n"schedule": [\n{"day": "Luni",\n"time": ')
+
+        with self.assertRaises(ScheduleFormatError) as raised:
+            list(iter_json_entries(path))
+        self.assertIsNotNone(raised.exception.line)
+
+        self.assertEqual(self.manager.load_from_json(path)["status"], "error")
+
+    def test_csv_with_bom_and_missing_column(self):
+        path = self.write("orar.csv", "day,time,location\nLuni,08:00-10:00,C309\n", "utf-8-sig")
+
+        result = self.manager.load_from_csv(path)
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["errors"], [{"line": 2, "message": "Campul 'subject' lipseste sau este gol"}])
+
+    def test_invalid_times_are_collected_with_their_rows(self):
+        path = self.write("orar.csv", "\n".join([
+            "\ufeffday,time,subject,location",
+            "Luni,08:00-10:00,A,C309",
+            "Luni,25:00-26:00,B,C309",
+            "Luni,10:00-09:00,C,C309",
+            "",
+            "Marți,9:5-11:00,D,C309",
+            "Marți,10-12,E,C309",
+            "Joi,22:00-00:00,F,C309",
+        ]) + "\n")
+
+        result = self.manager.load_from_csv(path)
+
+        self.assertEqual(result["status"], "success", result)
+        self.assertEqual([entry["subject"] for entry in result["schedule"]], ["A", "D", "F"])
+        self.assertEqual(self.manager.schedule, result["schedule"])
+        self.assertEqual([error["line"] for error in result["errors"]], [3, 4, 7])
+        self.assertIn("25:00-26:00", result["errors"][0]["message"])
+        self.assertIn("10:00-09:00", result["errors"][1]["message"])
+
+    def test_invalid_json_entries_are_collected(self):
+        entries = [ENTRIES[0], {"day": "Luni", "time": "10:00-09:00", "subject": "X"}, "text",
+                   {"day": "Luni", "time": "25:00-26:00", "subject": "Y"}]
+        path = self.write("orar.json", json.dumps({"schedule": entries}, indent=1))
+
+        result = self.manager.load_from_json(path)
+
+        self.assertEqual(len(result["schedule"]), 1)
+        self.assertEqual([error["message"].split(":")[0] for error in result["errors"]],
+                         ["Interval orar invalid", "Fiecare intrare din orar trebuie sa fie un obiect",
+                          "Format invalid pentru timp"])
+        self.assertEqual(sorted(error["line"] for error in result["errors"]),
+                         [error["line"] for error in result["errors"]])
+
+    def test_all_rows_invalid_keeps_the_schedule(self):
+        self.manager.load_from_csv(self.write("ok.csv", "day,time,subject\nLuni,08:00-10:00,A\n"))
+        result = self.manager.load_from_csv(self.write("bad.csv", "day,time,subject\nLuni,10:00-09:00,A\n"))
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual([entry["subject"] for entry in self.manager.schedule], ["A"])
+
+    def test_parse_time_range(self):
+        self.assertEqual(parse_time_range(" 8:05 - 9:30 "), (485, 570))
+        self.assertEqual(parse_time_range("22:00-00:00"), (1320, 0))
+        for value in ("25:00-26:00", "10:00-09:00", "10:00-10:00", "10:60-11:00", "10:00", "a-b"):
+            with self.assertRaises(ValueError, msg=value):
+                parse_time_range(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from core.data_processor import DataProcessor
+from widgets.schedule_table import ScheduleFilterProxyModel, ScheduleTableModel
+
+
+def entry(subject, temperature):
+    weather = None if temperature is None else {"temperature": temperature, "weather_code": 0,
+                                                "precipitation_probability": 10, "wind_speed": 5.0}
+    return {"day": "Luni", "time": "08:00-10:00", "subject": subject, "location": "C309",
+            "weather": weather, "interval_weather": None}
+
+
+class ScheduleTableSortTest(unittest.TestCase):
+    """Rândurile fără date meteo rămân la finalul sortării, în ambele sensuri"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.model = ScheduleTableModel(DataProcessor())
+        self.proxy = ScheduleFilterProxyModel()
+        self.proxy.setSourceModel(self.model)
+        self.model.set_entries([entry("a", 12.0), entry("b", None), entry("c", -3.5), entry("d", 20.0)])
+
+    def subjects(self):
+        return [self.proxy.index(row, 2).data() for row in range(self.proxy.rowCount())]
+
+    def test_ascending(self):
+        self.proxy.sort(3, Qt.SortOrder.AscendingOrder)
+        self.assertEqual(self.subjects(), ["c", "a", "d", "b"])
+
+    def test_descending(self):
+        self.proxy.sort(3, Qt.SortOrder.DescendingOrder)
+        self.assertEqual(self.subjects(), ["d", "a", "c", "b"])
+
+    def test_text_columns_still_reverse(self):
+        self.proxy.sort(2, Qt.SortOrder.DescendingOrder)
+        self.assertEqual(self.subjects(), ["d", "c", "b", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,19 @@
+import unittest
+
+from core.transport import ReplayTransport, Transport
+
+
+class TransportInterfaceTest(unittest.TestCase):
+    def test_backend_without_get_fails_when_created(self):
+        class Incomplete(Transport):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_backends_implement_get(self):
+        self.assertIsInstance(ReplayTransport(mode="replay"), Transport)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime
+
+from PyQt6.QtCore import QCoreApplication
+
+from core.forecast_cache import ForecastCache
+from core.geocoding_cache import GeocodingCache
+from core.standin_server import synthetic_forecast
+from core.transport import ReplayTransport
+from core.weather_service import WeatherService
+
+BUCHAREST = (44.4268, 26.1025)
+CLUJ = (46.7712, 23.6236)
+
+
+class LoadWeatherFromFileTest(unittest.TestCase):
+    """La pornire se afiseaza doar prognoza din cache a localitatii configurate"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        geocoding = GeocodingCache(self.path("geocoding_cache.json"))
+        geocoding.put("București", *BUCHAREST, "Europe/Bucharest")
+        geocoding.put("Cluj-Napoca", *CLUJ, "Europe/Bucharest")
+
+        service = self.service()
+        start = datetime.now().replace(minute=0, second=0, microsecond=0)
+        data = service.process_weather_data(synthetic_forecast(*BUCHAREST, start, 168))
+        service.cache.put(service.make_cache_key(*BUCHAREST, 7), data, time.time() - 600)
+        service.cache.save()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def service(self, city="București"):
+        service = WeatherService(ReplayTransport(self.path("recordings")))
+        service.geocoding_cache = GeocodingCache(self.path("geocoding_cache.json"))
+        service.cache = ForecastCache(self.path("weather_cache.bin"), legacy_file_path=None)
+        service.set_location(city)
+        return service
+
+    def test_forecast_of_the_configured_city(self):
+        service = self.service()
+
+        cached = service.load_weather_from_file(7)
+
+        self.assertIsNotNone(cached)
+        self.assertFalse(cached["stale"])
+        self.assertEqual((service.latitude, service.longitude), BUCHAREST)
+
+    def test_other_city_is_not_served(self):
+        self.assertIsNone(self.service("Cluj-Napoca").load_weather_from_file(7))
+
+    def test_unknown_city_is_not_served(self):
+        self.assertIsNone(self.service("Iasi").load_weather_from_file(7))
+
+    def test_other_forecast_length_is_not_served(self):
+        self.assertIsNone(self.service().load_weather_from_file(14))
+
+
+    def test_shutdown_waits_for_background_save(self):
+        os.remove(self.path("weather_cache.bin"))
+        service = self.service()
+        service.cache.put(service.make_cache_key(*CLUJ, 7), {"hourly": [], "daily": []})
+
+        service._save_in_background()
+        service.shutdown()
+
+        self.assertTrue(os.path.exists(self.path("weather_cache.bin")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,44 +1,96 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QPushButton, QTableWidget, QTableWidgetItem, 
-                             QLabel, QFileDialog, QMessageBox, QHeaderView, QInputDialog)
-from PyQt6.QtCore import Qt, pyqtSignal
+                             QPushButton, QTableView, QLineEdit, 
+                             QLabel, QFileDialog, QMessageBox, QHeaderView, QInputDialog, QProgressDialog)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QColor
 import json
+import time
 from pathlib import Path
 
-from core.schedule_manager import ScheduleManager
-from core.weather_service import WeatherService
-from core.data_processor import DataProcessor
-from widgets.weather_chart import WeatherChartWidget
-from widgets.notification_manager import NotificationManager
-from utils.export_manager import ExportManager
-from ui.settings_dialog import SettingsDialog
+from widgets.schedule_table import ScheduleTableModel, ScheduleFilterProxyModel
 
 class MainWindow(QMainWindow):
+    """
+    Fereastra principală. Constructorul creează doar controalele ușoare, ca fereastra
+    să apară imediat; serviciile (numpy, setările, cache-ul meteo, iconița din tray)
+    pornesc după primul cadru (start_services), graficele (pyqtgraph) sunt construite
+    la primele date de afișat, iar exportul și dialogul de setări sunt importate
+    la prima folosire.
+    """
     def __init__(self):
         super().__init__()
         self.schedule_data = None
         self.weather_data = None
         self.enriched_entries = []
+        self.forecast_days = 7
+        
+        self.services_started = False
+        self.weather_chart = None
+        self.charted_forecast = None
+        self._export_manager = None
+        
+        self.init_ui()
+        self.apply_theme()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.services_started:
+            # după ce primul cadru a fost desenat (copiii se desenează în aceeași trecere)
+            QTimer.singleShot(0, self.start_services)
+
+    def start_services(self):
+        """Serviciile, setările și cache-ul meteo, încărcate după ce fereastra a fost afișată."""
+        if self.services_started:
+            return
+        self.services_started = True
+        
+        from core.data_processor import DataProcessor
+        from core.enrichment_cache import EnrichmentCache
+        from core.schedule_manager import ScheduleManager
+        from core.weather_service import WeatherService
+        from widgets.notification_manager import NotificationManager
         
         self.schedule_manager = ScheduleManager()
         self.weather_service = WeatherService()
         self.data_processor = DataProcessor() 
+        self.enrichment = EnrichmentCache(self.data_processor)
         self.notification_manager = NotificationManager(self)
-        self.export_manager = ExportManager(self)
-        
-        self.init_ui()
-        self.apply_theme()
+        self.create_table()
         
         self.weather_service.weather_data_ready.connect(self.on_weather_data_received)
         self.weather_service.weather_error.connect(self.on_weather_error)
+        self.weather_service.weather_retry.connect(self.on_weather_retry)
         
         self.load_initial_settings()
         
-        cached = self.weather_service.load_weather_from_file()
+        for btn in self.control_buttons:
+            btn.setEnabled(True)
+        self.status_label.setText("Pregătit.")
+        
+        cached = self.weather_service.load_weather_from_file(self.forecast_days)
         if cached:
             self.weather_data = cached
             print("Date meteo încărcate din cache.")
+            if cached.get("stale"):
+                self.status_label.setText(f"Date meteo din cache ({self.format_age(cached)}), se actualizează...")
+                self.weather_service.fetch_weather_data(self.forecast_days)
+
+    @property
+    def export_manager(self):
+        """ExportManager (și QtPrintSupport) importat la primul export"""
+        if self._export_manager is None:
+            from utils.export_manager import ExportManager
+            self._export_manager = ExportManager(self)
+        return self._export_manager
+
+    def chart(self):
+        """Graficele (pyqtgraph) sunt construite la primele date de afișat, în locul etichetei"""
+        if self.weather_chart is None:
+            from widgets.weather_chart import WeatherChartWidget
+            self.weather_chart = WeatherChartWidget(self.data_processor, self)
+            self.centralWidget().layout().replaceWidget(self.chart_placeholder, self.weather_chart)
+            self.chart_placeholder.deleteLater()
+        return self.weather_chart
 
     def load_initial_settings(self):
         """Sincronizează unitatea de măsură salvată cu motorul de procesare."""
@@ -47,10 +99,12 @@ class MainWindow(QMainWindow):
             try:
                 with open(settings_path, 'r', encoding='utf-8') as f:
                     settings = json.load(f)
-                    unit = settings.get("temperature_unit", "celsius")
-                    self.weather_service.set_temperature_unit(unit)
-                    self.data_processor.set_temperature_unit(unit)
+                    self.apply_units(settings)
+                    self.apply_schedule_options(settings)
                     self.weather_service.set_location(settings.get("location_name", "București"))
+                    self.weather_service.set_cache_duration(settings.get("cache_duration_minutes", 30))
+                    self.weather_service.set_stale_policy(settings.get("stale_while_revalidate", True),
+                                                          settings.get("max_stale_hours", 24))
             except Exception as e:
                 print(f"Eroare la încărcarea setărilor inițiale: {e}")
 
@@ -71,107 +125,201 @@ class MainWindow(QMainWindow):
         self.export_btn = QPushButton("💾 Export")
         self.export_btn.clicked.connect(self.export_data)
         
-        for btn in [self.load_btn, self.refresh_btn, self.settings_btn, self.export_btn]:
+        self.control_buttons = [self.load_btn, self.refresh_btn, self.settings_btn, self.export_btn]
+        for btn in self.control_buttons:
+            btn.setEnabled(False)
             ctrl_layout.addWidget(btn)
         layout.addLayout(ctrl_layout)
         
-        self.status_label = QLabel("Pregătit.")
+        self.status_label = QLabel("Se pornește...")
         layout.addWidget(self.status_label)
         
-        self.table = QTableWidget()
-        self.create_table()
-        layout.addWidget(self.table, 3)
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("🔍 Filtrează după zi, materie sau sală...")
+        layout.addWidget(self.filter_edit)
         
-        self.weather_chart = WeatherChartWidget(self.data_processor, self)
+        self.table = QTableView()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table, 3)
         
-        layout.addWidget(self.weather_chart, 2)
+        self.chart_placeholder = QLabel("Graficele apar după încărcarea orarului și a prognozei.")
+        self.chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.chart_placeholder, 2)
 
     def create_table(self):
-        cols = ["Zi", "Interval", "Materie", "Temp.", "Condiții", "Ploaie", "Vânt"]
-        self.table.setColumnCount(len(cols))
-        self.table.setHorizontalHeaderLabels(cols)
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table_model = ScheduleTableModel(self.data_processor, self)
+        self.table_proxy = ScheduleFilterProxyModel(self)
+        self.table_proxy.setSourceModel(self.table_model)
+        self.filter_edit.textChanged.connect(self.table_proxy.set_filter_text)
+        
+        self.table.setModel(self.table_proxy)
+        # ordinea din orar până când utilizatorul alege o coloană
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.table.setSortingEnabled(True)
 
     def load_schedule(self):
+        from core.schedule_conflicts import describe_conflict
+        
         path, _ = QFileDialog.getOpenFileName(self, "Deschide orar", "", "JSON (*.json);;CSV (*.csv)")
         if not path: return
+        # dialogul apare doar dacă încărcarea durează; setValue procesează evenimentele
+        dialog = QProgressDialog("Se încarcă orarul...", None, 0, 1000, self)
+        dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        
+        def progress(rows, done, total):
+            dialog.setLabelText(f"Se încarcă orarul... ({rows} rânduri)")
+            dialog.setValue(int(1000 * done / total) if total else 1000)
+            
         try:
-            res = self.schedule_manager.load_from_json(path) if path.endswith('.json') else self.schedule_manager.load_from_csv(path)
+            load = self.schedule_manager.load_from_json if path.endswith('.json') else self.schedule_manager.load_from_csv
+            res = load(path, progress)
+            dialog.close()
             if res["status"] == "success":
                 self.schedule_data = {"schedule": res["schedule"]}
-                self.status_label.setText(f"Orar încărcat ({len(res['schedule'])} rânduri).")
+                conflicts = self.schedule_manager.find_conflicts()
+                summary = f" {conflicts['total']} conflicte în orar." if conflicts["total"] else ""
+                self.status_label.setText(f"Orar încărcat ({len(res['schedule'])} rânduri).{summary}")
                 
                 if self.weather_data: self.update_view()
+            else:
+                QMessageBox.critical(self, "Eroare", res["message"])
+                
+            if res.get("errors"):
+                errors = res["errors"]
+                self.show_problems("Rânduri invalide", f"{len(errors)} rânduri au fost ignorate:",
+                                   [f"Linia {error['line']}: {error['message']}" for error in errors])
+            if res["status"] == "success" and conflicts["total"]:
+                self.show_problems("Conflicte în orar", f"{conflicts['total']} conflicte găsite:",
+                                   [describe_conflict(conflict) for conflict in conflicts["conflicts"]],
+                                   conflicts["total"])
                 
         except Exception as e:
+            dialog.close()
             QMessageBox.critical(self, "Eroare", f"Eroare la încărcarea orarului: {str(e)}")
 
+    def show_problems(self, title, intro, lines, total=None, shown=20):
+        """Lista completă a problemelor în detalii; primele `shown` direct în mesaj"""
+        total = len(lines) if total is None else total
+        text = lines[:shown]
+        if total > len(text):
+            text.append(f"... și încă {total - len(text)}.")
+        box = QMessageBox(QMessageBox.Icon.Warning, title, f"{intro}\n\n" + "\n".join(text), parent=self)
+        box.setDetailedText("\n".join(lines))
+        box.exec()
+
     def refresh_weather(self):
         if not self.schedule_data and not self.weather_data:
              QMessageBox.warning(self, "Atenție", "Încarcă orarul sau datele meteo pentru a începe.")
              return
         self.status_label.setText("Actualizare meteo...")
         self.refresh_btn.setEnabled(False)
-        self.weather_service.fetch_weather_data(7)
+        self.weather_service.fetch_weather_data(self.forecast_days)
 
     def on_weather_data_received(self, data):
         self.weather_data = data
         self.update_view()
+        if data.get("stale"):
+            self.status_label.setText(f"Date meteo din cache ({self.format_age(data)}), se actualizează...")
+            return
         self.status_label.setText("Date meteo actualizate.")
         self.refresh_btn.setEnabled(True)
 
+    def on_weather_retry(self, attempt, delay, err):
+        shown = f" Se afișează datele din cache ({self.format_age(self.weather_data)})." if self.weather_data else ""
+        self.status_label.setText(f"Eroare: {err}. Reîncerc în {delay:.0f} s (încercarea {attempt}).{shown}")
+
     def on_weather_error(self, err):
+        self.refresh_btn.setEnabled(True)
+        if self.weather_data and self.weather_service.cached_weather is not None:
+            self.status_label.setText(f"Eroare: {err}. Se afișează datele din cache ({self.format_age(self.weather_data)}).")
+            return
+        if self.weather_data:
+            self.weather_data = None
+            self.table_model.clear()
+            self.enrichment.clear()
+            self.charted_forecast = None
+            if self.weather_chart is not None:
+                self.weather_chart.update_charts(None)
         QMessageBox.warning(self, "Eroare Meteo", err)
         self.status_label.setText(f"Eroare: {err}")
-        self.refresh_btn.setEnabled(True)
+
+    @staticmethod
+    def format_age(data):
+        """Vechimea unei prognoze (după câmpul fetched_at), ex. "acum 2 h 15 min"."""
+        fetched_at = data.get("fetched_at") if data else None
+        if fetched_at is None:
+            return "vechime necunoscută"
+        minutes = max(0, int(time.time() - fetched_at) // 60)
+        if minutes < 60:
+            return f"acum {minutes} min"
+        if minutes < 24 * 60:
+            return f"acum {minutes // 60} h {minutes % 60} min"
+        return f"acum {minutes // (24 * 60)} zile"
 
     def update_view(self):
         """Metoda unificată pentru actualizarea UI-ului"""
         if not self.schedule_data or not self.weather_data: return
         
-        self.enriched_entries = self.data_processor.merge_schedule_with_weather(self.schedule_data["schedule"], self.weather_data)
-        
-        self.table.setRowCount(len(self.enriched_entries))
-        for row, entry in enumerate(self.enriched_entries):
-            self.table.setItem(row, 0, QTableWidgetItem(entry.get('day', '')))
-            self.table.setItem(row, 1, QTableWidgetItem(entry.get('time', '')))
-            self.table.setItem(row, 2, QTableWidgetItem(entry.get('subject', '')))
-            w = entry.get('weather')
-            if w:
-                fmt = self.data_processor.format_weather_for_table(w)
-                self.table.setItem(row, 3, QTableWidgetItem(fmt["temperature"]))
-                self.table.setItem(row, 4, QTableWidgetItem(fmt["conditions"]))
-                self.table.setItem(row, 5, QTableWidgetItem(fmt["precipitation"]))
-                self.table.setItem(row, 6, QTableWidgetItem(fmt["wind"]))
-            else:
-                 for col in range(3, 7): self.table.setItem(row, col, QTableWidgetItem("-"))
+        # doar rândurile a căror prognoză s-a schimbat sunt redesenate (dirty None = toate)
+        self.enriched_entries, dirty = self.enrichment.enrich(self.schedule_data["schedule"], self.weather_data)
+        self.table_model.set_entries(self.enriched_entries, dirty)
         
-        self.weather_chart.update_charts(self.weather_data, self.enriched_entries)
+        if dirty is None or self.charted_forecast != self.enrichment.forecast_key:
+            self.charted_forecast = self.enrichment.forecast_key
+            self.chart().update_charts(self.weather_data, self.enriched_entries, self.enrichment.statistics())
 
     def apply_theme(self):
-        self.setStyleSheet("QMainWindow, QWidget { background-color: #2b2b2b; color: white; } QTableWidget { background-color: #333; }")
+        self.setStyleSheet("QMainWindow, QWidget { background-color: #2b2b2b; color: white; } QTableView { background-color: #333; }")
 
     def open_settings(self):
+        from ui.settings_dialog import SettingsDialog
+        
         dialog = SettingsDialog(self)
         dialog.settings_changed.connect(self.apply_new_settings)
         dialog.exec()
 
-    def apply_new_settings(self, settings):
+    def apply_units(self, settings):
+        """Unitățile de afișare; prognoza curentă este convertită local, fără o nouă cerere."""
         unit = settings.get("temperature_unit", "celsius")
+        wind_unit = settings.get("wind_unit", "km/h")
         self.weather_service.set_temperature_unit(unit)
+        self.weather_service.set_wind_unit(wind_unit)
         self.data_processor.set_temperature_unit(unit)
-        self.weather_service.set_location(settings.get("location_name", "București"))
-        self.weather_service.cached_weather = None
-        self.refresh_weather()
+        self.data_processor.set_wind_unit(wind_unit)
+
+    def apply_schedule_options(self, settings):
+        """Orizontul prognozei și aparițiile afișate (toate sau doar următoarea, săpt. pare/impare)."""
+        self.forecast_days = max(1, min(int(settings.get("forecast_days", 7)), 16))
+        self.data_processor.set_occurrence_options(settings.get("expand_occurrences", False),
+                                                   settings.get("semester_start"))
+
+    def apply_new_settings(self, settings):
+        self.apply_units(settings)
+        previous_days = self.forecast_days
+        self.apply_schedule_options(settings)
+        location = settings.get("location_name", "București")
+        location_changed = location != self.weather_service.city_name
+        self.weather_service.set_location(location)
+        self.weather_service.set_cache_duration(settings.get("cache_duration_minutes", 30))
+        self.weather_service.set_stale_policy(settings.get("stale_while_revalidate", True),
+                                              settings.get("max_stale_hours", 24))
+        
+        if location_changed or self.forecast_days != previous_days or not self.weather_service.cached_weather:
+            self.refresh_weather()
+        else:
+            self.weather_data = self.weather_service.cached_weather
+            self.update_view()
 
     def export_data(self):
         if not self.schedule_data: return
         fmt, ok = QInputDialog.getItem(self, "Export", "Format:", ["PDF", "CSV"], 0, False)
         if ok:
-            stats = self.data_processor.calculate_statistics(self.enriched_entries)
-            if fmt == "PDF": self.export_manager.export_to_pdf(self.enriched_entries, self.weather_data, stats)
+            stats = self.enrichment.statistics()
+            conflicts = self.schedule_manager.find_conflicts()
+            if fmt == "PDF": self.export_manager.export_to_pdf(self.enriched_entries, self.weather_data, stats, conflicts)
             else: self.export_manager.export_to_csv(self.enriched_entries)
 
     def closeEvent(self, event):
-        if self.weather_data: self.weather_service.save_weather_to_file(self.weather_data)
+        if self.services_started:
+            self.weather_service.save_weather_to_file()
         event.accept()
\ No newline at end of file
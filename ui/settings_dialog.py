@@ -1,7 +1,7 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QComboBox, QSpinBox, QGroupBox,
-                             QCheckBox, QLineEdit, QFormLayout, QMessageBox)
-from PyQt6.QtCore import Qt, pyqtSignal
+                             QCheckBox, QLineEdit, QFormLayout, QMessageBox, QDateEdit)
+from PyQt6.QtCore import Qt, pyqtSignal, QDate
 import json
 from pathlib import Path
 
@@ -42,7 +42,7 @@ class SettingsDialog(QDialog):
         units_layout.addRow("Temperatura:", self.temp_unit_combo)
         
         self.wind_unit_combo = QComboBox()
-        self.wind_unit_combo.addItems(["km/h", "m/s", "mph"])
+        self.wind_unit_combo.addItems(["km/h", "m/s", "mph", "kn"])
         units_layout.addRow("Viteza vant:", self.wind_unit_combo)
         
         layout.addWidget(units_group)
@@ -69,6 +69,17 @@ class SettingsDialog(QDialog):
         self.cache_duration_spin.setSuffix(" minute")
         update_layout.addRow("Durata cache:", self.cache_duration_spin)
         
+        self.stale_check = QCheckBox("Afiseaza datele vechi din cache pana la actualizare")
+        self.stale_check.setChecked(True)
+        update_layout.addRow("", self.stale_check)
+        
+        self.max_stale_spin = QSpinBox()
+        self.max_stale_spin.setMinimum(1)
+        self.max_stale_spin.setMaximum(168)
+        self.max_stale_spin.setValue(24)
+        self.max_stale_spin.setSuffix(" ore")
+        update_layout.addRow("Varsta maxima date vechi:", self.max_stale_spin)
+        
         layout.addWidget(update_group)
         
         notif_group = QGroupBox("🔔 Notificari")
@@ -118,11 +129,25 @@ class SettingsDialog(QDialog):
         
         self.forecast_days_spin = QSpinBox()
         self.forecast_days_spin.setMinimum(1)
-        self.forecast_days_spin.setMaximum(7)
+        self.forecast_days_spin.setMaximum(16)
         self.forecast_days_spin.setValue(7)
         self.forecast_days_spin.setSuffix(" zile")
         display_layout.addRow("Zile prognoza:", self.forecast_days_spin)
         
+        self.expand_check = QCheckBox("Afiseaza toate aparitiile din orizontul prognozei")
+        display_layout.addRow("", self.expand_check)
+        
+        self.semester_check = QCheckBox("Saptamani pare/impare numarate de la inceputul semestrului")
+        display_layout.addRow("", self.semester_check)
+        
+        self.semester_start_edit = QDateEdit()
+        self.semester_start_edit.setCalendarPopup(True)
+        self.semester_start_edit.setDisplayFormat("dd.MM.yyyy")
+        self.semester_start_edit.setDate(QDate.currentDate())
+        self.semester_check.toggled.connect(self.semester_start_edit.setEnabled)
+        self.semester_start_edit.setEnabled(False)
+        display_layout.addRow("Inceput semestru:", self.semester_start_edit)
+        
         self.compact_mode_check = QCheckBox("Mod compact (mai putine detalii)")
         display_layout.addRow("", self.compact_mode_check)
         
@@ -164,6 +189,8 @@ class SettingsDialog(QDialog):
         self.update_interval_spin.setValue(self.settings.get("update_interval_minutes", 60))
         self.auto_update_check.setChecked(self.settings.get("auto_update_enabled", True))
         self.cache_duration_spin.setValue(self.settings.get("cache_duration_minutes", 30))
+        self.stale_check.setChecked(self.settings.get("stale_while_revalidate", True))
+        self.max_stale_spin.setValue(self.settings.get("max_stale_hours", 24))
         
         self.notif_enabled_check.setChecked(self.settings.get("notifications_enabled", True))
         self.rain_alert_check.setChecked(self.settings.get("rain_alert_enabled", True))
@@ -173,6 +200,11 @@ class SettingsDialog(QDialog):
         self.location_input.setText(self.settings.get("location_name", "București"))
         
         self.forecast_days_spin.setValue(self.settings.get("forecast_days", 7))
+        self.expand_check.setChecked(self.settings.get("expand_occurrences", False))
+        semester_start = self.settings.get("semester_start")
+        self.semester_check.setChecked(bool(semester_start))
+        if semester_start:
+            self.semester_start_edit.setDate(QDate.fromString(semester_start, Qt.DateFormat.ISODate))
         self.compact_mode_check.setChecked(self.settings.get("compact_mode", False))
         
     def save_settings(self):
@@ -185,6 +217,8 @@ class SettingsDialog(QDialog):
                 "update_interval_minutes": self.update_interval_spin.value(),
                 "auto_update_enabled": self.auto_update_check.isChecked(),
                 "cache_duration_minutes": self.cache_duration_spin.value(),
+                "stale_while_revalidate": self.stale_check.isChecked(),
+                "max_stale_hours": self.max_stale_spin.value(),
                 
                 "notifications_enabled": self.notif_enabled_check.isChecked(),
                 "rain_alert_enabled": self.rain_alert_check.isChecked(),
@@ -194,6 +228,9 @@ class SettingsDialog(QDialog):
                 "location_name": self.location_input.text().strip(),
                 
                 "forecast_days": self.forecast_days_spin.value(),
+                "expand_occurrences": self.expand_check.isChecked(),
+                "semester_start": (self.semester_start_edit.date().toString(Qt.DateFormat.ISODate)
+                                   if self.semester_check.isChecked() else None),
                 "compact_mode": self.compact_mode_check.isChecked()
             }
             
@@ -258,11 +295,15 @@ class SettingsDialog(QDialog):
             "update_interval_minutes": 60,
             "auto_update_enabled": True,
             "cache_duration_minutes": 30,
+            "stale_while_revalidate": True,
+            "max_stale_hours": 24,
             "notifications_enabled": True,
             "rain_alert_enabled": True,
             "extreme_weather_alert": True,
             "rain_threshold": 30,
             "location_name": "București",
             "forecast_days": 7,
+            "expand_occurrences": False,
+            "semester_start": None,
             "compact_mode": False
         }
\ No newline at end of file
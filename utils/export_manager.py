@@ -3,10 +3,14 @@ from PyQt6.QtGui import QPainter, QFont, QColor, QPen, QFontMetrics
 from PyQt6.QtCore import Qt, QRect, QRectF, QMarginsF
 from PyQt6.QtWidgets import QFileDialog, QMessageBox, QWidget
 
-import csv
 from datetime import datetime
 from typing import List, Dict, Optional
 
+from core.enriched_export import write_csv
+from core.schedule_conflicts import describe_conflict
+
+PDF_CONFLICTS_SHOWN = 15
+
 
 class ExportManager:
     def __init__(self, parent_widget: Optional[QWidget] = None):
@@ -16,7 +20,8 @@ class ExportManager:
         self,
         schedule_data: List[Dict],
         weather_data: Optional[Dict] = None,
-        statistics: Optional[Dict] = None
+        statistics: Optional[Dict] = None,
+        conflicts: Optional[Dict] = None
     ) -> bool:
 
         file_path, _ = QFileDialog.getSaveFileName(
@@ -75,6 +80,45 @@ class ExportManager:
                     painter.drawText(60, y, line)
                     y += 18
 
+                by_day = statistics.get("by_day") or {}
+                if by_day:
+                    y += 6
+                    painter.drawText(60, y, "Pe zile:")
+                    y += 18
+                    for day, day_stats in by_day.items():
+                        avg = day_stats.get("avg_temperature")
+                        temp_text = f"{avg:.1f}{unit}" if avg is not None else "-"
+                        painter.drawText(
+                            80, y,
+                            f"{day}: {day_stats['entries']} activități, medie {temp_text}, "
+                            f"risc de ploaie la {day_stats['rainy_periods']}, "
+                            f"{day_stats['total_precipitation']:.1f} mm"
+                        )
+                        y += 18
+
+                y += 20
+
+            if conflicts and conflicts.get("total"):
+                painter.setFont(QFont("Arial", 11, QFont.Weight.Bold))
+                painter.drawText(40, y, f"Conflicte în orar: {conflicts['total']}")
+                y += 22
+
+                painter.setFont(QFont("Arial", 10))
+                counts = conflicts["counts"]
+                painter.drawText(
+                    60, y,
+                    f"Suprapuneri: {counts['person']}, săli ocupate dublu: {counts['location']}, "
+                    f"schimbări de clădire fără pauză: {counts['transfer']}"
+                )
+                y += 18
+
+                for conflict in conflicts["conflicts"][:PDF_CONFLICTS_SHOWN]:
+                    painter.drawText(80, y, describe_conflict(conflict))
+                    y += 18
+                if conflicts["total"] > PDF_CONFLICTS_SHOWN:
+                    painter.drawText(80, y, f"... și încă {conflicts['total'] - PDF_CONFLICTS_SHOWN}")
+                    y += 18
+
                 y += 20
 
             headers = ["Zi", "Interval", "Activitate", "Temperatura", "Condiții", "Ploaie"]
@@ -104,14 +148,15 @@ class ExportManager:
 
             for entry in schedule_data:
                 weather = entry.get("weather", {})
+                interval = entry.get("interval_weather") or {}
 
                 values = [
                     entry.get("day", "-"),
                     entry.get("time", "-"),
                     entry.get("subject", "-"),
                     weather.get("temperature", "-"),
-                    weather.get("weather_description", "-"),
-                    f"{weather.get('precipitation_probability', 0)}%"
+                    interval.get("weather_description", weather.get("weather_description", "-")),
+                    f"{interval.get('precipitation_probability_max', weather.get('precipitation_probability', 0))}%"
                 ]
 
                 activity_rect = metrics.boundingRect(
@@ -168,20 +213,7 @@ class ExportManager:
             return False
 
         try:
-            with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Zi", "Interval", "Activitate", "Temperatura", "Condiții", "Ploaie"])
-
-                for e in schedule_data:
-                    w = e.get("weather", {})
-                    writer.writerow([
-                        e.get("day", "-"),
-                        e.get("time", "-"),
-                        e.get("subject", "-"),
-                        w.get("temperature", "-"),
-                        w.get("weather_description", "-"),
-                        f"{w.get('precipitation_probability', 0)}%"
-                    ])
+            write_csv(file_path, schedule_data)
 
             QMessageBox.information(self.parent, "Export CSV", "CSV salvat corect.")
             return True
@@ -131,6 +131,9 @@ class NotificationManager(QObject):
                 f"{entry.get('subject', 'Activitate')} - {entry.get('time', '')}\n"
                 f"Probabilitate ploaie: {precip_prob}%\n"
             )
+            interval = entry.get("interval_weather") or {}
+            if interval.get("precipitation_sum", 0) > 0:
+                message += f"Precipitatii in interval: {interval['precipitation_sum']:.1f} mm\n"
         else:
             title = f"⚠️ Risc de ploaie la {len(new_risky_entries)} activitati"
             message = f"Exista risc de ploaie la {len(new_risky_entries)} activitati maine. Verifica detaliile in aplicatie!"
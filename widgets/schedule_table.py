@@ -0,0 +1,234 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
+
+COLUMNS = ["Zi", "Interval", "Materie", "Temp.", "Condiții", "Ploaie", "Vânt"]
+WEATHER_COLUMNS = range(3, 7)
+FORMAT_CACHE_SIZE = 2048
+
+# câmpurile după care se sortează coloanele meteo (Temp., Condiții, Ploaie, Vânt)
+INTERVAL_SORT_FIELDS = ("temperature_max", "weather_code", "precipitation_probability_max", "wind_speed_max")
+HOURLY_SORT_FIELDS = ("temperature", "weather_code", "precipitation_probability", "wind_speed")
+
+
+class ScheduleTableModel(QAbstractTableModel):
+    """
+    Modelul tabelului cu orarul îmbinat, construit direct peste lista de intrări.
+    Textul celulelor meteo se formatează doar la cerere (în data()), cu un cache mic
+    pe intrări; cheile de sortare se calculează o singură dată pe intrare.
+
+    Rândul r afișează intrarea `order[r]`; sortarea schimbă doar această permutare
+    (o singură sortare Python pe cheile precalculate, nu câte un apel pe comparație).
+    """
+
+    def __init__(self, data_processor, parent=None):
+        super().__init__(parent)
+        self.data_processor = data_processor
+        self.entries: List[Dict] = []
+        self.order: List[int] = []
+        self.position: List[int] = []
+        self.sort_column = -1
+        self.sort_order = Qt.SortOrder.AscendingOrder
+        self.sort_keys: List[List] = [[] for _ in COLUMNS]
+        self.search_keys: List[str] = []
+        self._formatted: "OrderedDict[int, Tuple[str, ...]]" = OrderedDict()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.entries)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        entry_index, column = self.order[index.row()], index.column()
+        entry = self.entries[entry_index]
+        if column == 0:
+            if self.data_processor.expand_occurrences and entry.get('date'):
+                return f"{entry.get('day', '')} {entry['date'][8:10]}.{entry['date'][5:7]}"
+            return entry.get('day', '')
+        if column == 1:
+            return entry.get('time', '')
+        if column == 2:
+            return entry.get('subject', '')
+        return self._weather_text(entry_index)[column - 3]
+
+    def entry_at(self, row: int) -> Dict:
+        return self.entries[self.order[row]]
+
+    def _weather_text(self, entry_index: int) -> Tuple[str, ...]:
+        """Textele celor patru coloane meteo ale unei intrări, formatate o singură dată"""
+        cached = self._formatted.get(entry_index)
+        if cached is not None:
+            self._formatted.move_to_end(entry_index)
+            return cached
+
+        entry = self.entries[entry_index]
+        w = entry.get('weather')
+        if w:
+            fmt = self.data_processor.format_weather_for_table(w, entry.get('interval_weather'))
+            cached = (fmt["temperature"], fmt["conditions"], fmt["precipitation"], fmt["wind"])
+        else:
+            cached = ("-",) * 4
+
+        self._formatted[entry_index] = cached
+        if len(self._formatted) > FORMAT_CACHE_SIZE:
+            self._formatted.popitem(last=False)
+        return cached
+
+    def set_entries(self, entries: List[Dict], dirty: Optional[List[int]] = None):
+        """
+        Înlocuiește intrările. Cu `dirty` (indecșii intrărilor modificate, aceeași listă
+        de intrări) se emite dataChanged doar pentru intervalele de rânduri afectate;
+        cu None modelul este resetat.
+        """
+        if dirty is None or len(entries) != len(self.entries):
+            self.beginResetModel()
+            self.entries = entries
+            self._formatted.clear()
+            self._build_keys()
+            self.order = self._sorted_order()
+            self.position = _inverse(self.order)
+            self.endResetModel()
+            return
+
+        self.entries = entries
+        if not dirty:
+            return
+
+        for entry_index in set(dirty):
+            self._formatted.pop(entry_index, None)
+            self._update_keys(entry_index)
+
+        rows = sorted(self.position[entry_index] for entry_index in set(dirty))
+        for first, last in _row_ranges(rows):
+            self.dataChanged.emit(self.index(first, WEATHER_COLUMNS[0]), self.index(last, WEATHER_COLUMNS[-1]),
+                                  [Qt.ItemDataRole.DisplayRole])
+
+        if self.sort_column in WEATHER_COLUMNS:
+            self.sort(self.sort_column, self.sort_order)
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        """Reordonează rândurile după cheile precalculate ale coloanei (-1 = ordinea din orar)"""
+        self.sort_column, self.sort_order = column, order
+        new_order = self._sorted_order()
+        if new_order == self.order:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        new_position = _inverse(new_order)
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [
+            self.index(new_position[self.order[index.row()]], index.column()) for index in old_indexes])
+        self.order, self.position = new_order, new_position
+        self.layoutChanged.emit()
+
+    def _sorted_order(self) -> List[int]:
+        indices = range(len(self.entries))
+        if not 0 <= self.sort_column < len(COLUMNS):
+            return list(indices)
+        keys = self.sort_keys[self.sort_column]
+        descending = self.sort_order == Qt.SortOrder.DescendingOrder
+        if self.sort_column in WEATHER_COLUMNS:
+            # cheile (lipsește, valoare): rândurile fără date meteo rămân la final în ambele sensuri
+            if descending:
+                return sorted(indices, key=lambda index: (keys[index][0], -keys[index][1]))
+            return sorted(indices, key=keys.__getitem__)
+        return sorted(indices, key=keys.__getitem__, reverse=descending)
+
+    def clear(self):
+        self.set_entries([])
+
+    def _build_keys(self):
+        count = len(self.entries)
+        self.sort_keys = [[None] * count for _ in COLUMNS]
+        self.search_keys = [""] * count
+        for entry_index in range(count):
+            self._update_keys(entry_index)
+
+    def _update_keys(self, entry_index: int):
+        """Cheile de sortare (numerice acolo unde are sens) și textul pentru filtrare"""
+        entry = self.entries[entry_index]
+        day = entry.get('day', '')
+        time_range = entry.get('time', '')
+        subject = entry.get('subject', '')
+
+        # agregatele intervalului când există (ca în celulele afișate), altfel ora cea mai apropiată
+        weather = entry.get('interval_weather')
+        fields = INTERVAL_SORT_FIELDS
+        if not weather:
+            weather = entry.get('weather') or {}
+            fields = HOURLY_SORT_FIELDS
+
+        day_key = (self.data_processor.day_map.get(day, len(self.data_processor.day_map)), day)
+        if self.data_processor.expand_occurrences:
+            # fiecare rând este o apariție datată: ordinea cronologică
+            day_key = (entry.get('date') or "",) + day_key
+
+        keys = [
+            day_key,
+            time_range,
+            subject.casefold()
+        ]
+        keys += [_number(weather.get(field)) for field in fields]
+        for column, key in enumerate(keys):
+            self.sort_keys[column][entry_index] = key
+
+        self.search_keys[entry_index] = " ".join(
+            str(value) for value in (day, entry.get('date', ''), time_range, subject, entry.get('location', ''))).casefold()
+
+
+class ScheduleFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filtrarea și sortarea tabelului. Filtrarea folosește textul precalculat al fiecărei
+    intrări; sortarea este delegată modelului sursă, care o face într-o singură trecere
+    pe cheile precalculate (proxy-ul păstrează ordinea sursei).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+
+    def set_filter_text(self, text: str):
+        """Păstrează rândurile care conțin textul (zi, interval, materie sau sală)"""
+        self._needle = text.strip().casefold()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent) -> bool:
+        if not self._needle:
+            return True
+        source = self.sourceModel()
+        return self._needle in source.search_keys[source.order[source_row]]
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+
+def _number(value) -> Tuple[bool, float]:
+    """Cheia unei valori meteo: (lipsește, valoare)"""
+    return (True, 0.0) if value is None else (False, float(value))
+
+
+def _row_ranges(rows: List[int]):
+    """Intervalele continue [first, last] dintr-o listă sortată de rânduri"""
+    first = previous = rows[0]
+    for row in rows[1:]:
+        if row != previous + 1:
+            yield first, previous
+            first = row
+        previous = row
+    yield first, previous
+
+
+def _inverse(order: List[int]) -> List[int]:
+    position = [0] * len(order)
+    for row, entry_index in enumerate(order):
+        position[entry_index] = row
+    return position
@@ -1,11 +1,34 @@
 import pyqtgraph as pg
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSizePolicy
 from PyQt6.QtGui import QPainter, QFont, QCursor
-from PyQt6.QtCore import Qt, QPoint, QTimer, QPointF
+from PyQt6.QtCore import Qt, QEvent, QPoint, QPointF
+from bisect import bisect_left
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
 import numpy as np
 
+from core.weather_frame import as_frame
+
+DAY_NAMES = ("Luni", "Marți", "Miercuri", "Joi", "Vineri", "Sâmbătă", "Duminică")
+
+# distanța maximă (în ore, pe axa X) până la punctul pentru care se afișează tooltip-ul
+HOVER_THRESHOLDS = {"temp": 3.5, "precip": 4.5}
+
+
+def nearest_index(xs: Sequence[float], x: float, threshold: float) -> Optional[int]:
+    """
+    Indexul punctului cel mai apropiat de x într-o listă sortată (căutare binară),
+    sau None dacă este mai departe de `threshold`. La egalitate câștigă punctul din stânga.
+    """
+    position = bisect_left(xs, x)
+    best = None
+    for candidate in (position - 1, position):
+        if 0 <= candidate < len(xs):
+            distance = abs(xs[candidate] - x)
+            if distance < threshold and (best is None or distance < best[0]):
+                best = (distance, candidate)
+    return None if best is None else best[1]
+
 class HoverLabel(QLabel):
     """Etichetă tooltip simplă și stabilă."""
     def __init__(self, parent=None):
@@ -33,9 +56,10 @@ class HoverLabel(QLabel):
         self.hide()
 
     def show_text(self, pos: QPoint, text: str):
-        """Afișează textul la poziția dată."""
-        self.setText(text)
-        self.adjustSize()
+        """Afișează textul la poziția dată (eticheta este reașezată doar când textul se schimbă)."""
+        if text != self.text():
+            self.setText(text)
+            self.adjustSize()
         
         # Poziționare
         offset_x = 25
@@ -52,10 +76,12 @@ class WeatherChartWidget(QWidget):
         super().__init__(parent)
         self.data_processor = data_processor
         self.temp_unit = "°C" 
+        self.wind_unit = "km/h"
         self.full_weather_data = None 
         
-        self.temp_data_points = []
-        self.precip_data_points = []
+        # coordonatele X (sortate) ale punctelor fiecărui grafic și tooltip-urile deja formatate
+        self.hover_points: Dict[str, List[float]] = {"temp": [], "precip": []}
+        self._tooltips: Dict[Tuple[str, int], str] = {}
         
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self.setMaximumHeight(450)
@@ -65,10 +91,11 @@ class WeatherChartWidget(QWidget):
         main_window = self.window()
         self.hover_label = HoverLabel(main_window)
         
-        self.mouse_timer = QTimer()
-        self.mouse_timer.setInterval(30)
-        self.mouse_timer.timeout.connect(self._check_mouse_position)
-        self.mouse_timer.start()
+        # tooltip-ul este actualizat doar la mișcarea mouse-ului (fără timer) și ascuns la ieșire
+        self.plots = {"temp": self.temp_plot, "precip": self.precip_plot}
+        for plot_type, plot in self.plots.items():
+            plot.scene().sigMouseMoved.connect(lambda pos, t=plot_type: self._on_mouse_moved(t, pos))
+            plot.installEventFilter(self)
         
     def init_ui(self):
         """Inițializează interfața widget-ului"""
@@ -134,36 +161,28 @@ class WeatherChartWidget(QWidget):
         self.stats_label.setWordWrap(True)
         layout.addWidget(self.stats_label)
         
-    def update_charts(self, weather_data: Optional[Dict], schedule_entries: Optional[List[Dict]] = None):
+    def update_charts(self, weather_data: Optional[Dict], schedule_entries: Optional[List[Dict]] = None,
+                      statistics: Optional[Dict] = None):
         if not weather_data or "hourly" not in weather_data:
             self.clear_charts()
             self.stats_label.setText("Nu există date meteo disponibile pentru grafice.")
             return
         
         self.full_weather_data = weather_data 
+        self._tooltips.clear()
             
-        hourly_data = weather_data["hourly"]
-        if not hourly_data:
+        hourly_data = as_frame(weather_data["hourly"])
+        if not len(hourly_data):
             self.clear_charts()
             return
             
-        timestamps = []
-        temperatures = []
-        precip_probabilities = []
-        precip_amounts = []
-        reference_time = None
-        
-        for entry in hourly_data:
-            try:
-                dt = datetime.fromisoformat(entry["datetime"])
-                if reference_time is None: reference_time = dt
-                timestamps.append((dt - reference_time).total_seconds() / 3600)
-                temperatures.append(entry.get("temperature", 0))
-                precip_probabilities.append(entry.get("precipitation_probability", 0))
-                precip_amounts.append(entry.get("precipitation", 0))
-            except Exception: continue
+        timestamps = hourly_data.hours_since_start()
+        temperatures = hourly_data.temperature
+        precip_probabilities = hourly_data.precipitation_probability
+        precip_amounts = hourly_data.precipitation
                 
         self.temp_unit = self.data_processor.temp_unit_symbol 
+        self.wind_unit = self.data_processor.wind_unit_symbol
         
         self._plot_temperature(timestamps, temperatures)
         self._plot_precipitation(timestamps, precip_probabilities, precip_amounts)
@@ -171,14 +190,15 @@ class WeatherChartWidget(QWidget):
         if schedule_entries and weather_data:
             self._mark_schedule_intervals(schedule_entries, weather_data)
             
-        self._update_statistics(temperatures, precip_probabilities, precip_amounts, self.data_processor, schedule_entries)
+        self._update_statistics(temperatures, precip_probabilities, precip_amounts, self.data_processor, schedule_entries,
+                                statistics)
         
-    def _plot_temperature(self, timestamps: List[float], temperatures: List[float]):
+    def _plot_temperature(self, timestamps: np.ndarray, temperatures: np.ndarray):
         """Desenează graficul temperaturii și salvează punctele pentru hover."""
         self.temp_plot.clear()
-        self.temp_data_points = []
+        self.hover_points["temp"] = []
         
-        if not timestamps or not temperatures: return
+        if not len(timestamps) or not len(temperatures): return
             
         self.temp_plot.setLabel('left', f'Temperatură ({self.temp_unit})', units='')
         
@@ -187,7 +207,8 @@ class WeatherChartWidget(QWidget):
             timestamps, 
             temperatures, 
             pen=pen_temp, 
-            name=f'Temperatură {self.temp_unit}'
+            name=f'Temperatură {self.temp_unit}',
+            connect='finite'
         )
         self.temp_plot.addItem(line)
         
@@ -200,21 +221,20 @@ class WeatherChartWidget(QWidget):
         )
         self.temp_plot.addItem(scatter)
         
-        for i, (x, y) in enumerate(zip(timestamps, temperatures)):
-            self.temp_data_points.append((x, y, i))
+        self.hover_points["temp"] = timestamps[:len(temperatures)].tolist()
         
-        if len(temperatures) > 1:
-            avg_temp = sum(temperatures) / len(temperatures)
+        if len(temperatures) > 1 and not np.isnan(temperatures).all():
+            avg_temp = float(np.nanmean(temperatures))
             self.temp_plot.addLine(y=avg_temp, pen=pg.mkPen('r', style=Qt.PenStyle.DashLine, width=1))
             
-    def _plot_precipitation(self, timestamps: List[float], probabilities: List[float], amounts: List[float]):
+    def _plot_precipitation(self, timestamps: np.ndarray, probabilities: np.ndarray, amounts: np.ndarray):
         """Desenează graficul precipitațiilor și salvează punctele pentru hover."""
         self.precip_plot.clear()
-        self.precip_data_points = []
+        self.hover_points["precip"] = []
         
-        if not timestamps: return
+        if not len(timestamps): return
         
-        if probabilities:
+        if len(probabilities):
             line = pg.PlotDataItem(
                 timestamps, 
                 probabilities, 
@@ -235,13 +255,13 @@ class WeatherChartWidget(QWidget):
             )
             self.precip_plot.addItem(scatter)
             
-            for i, (x, y) in enumerate(zip(timestamps, probabilities)):
-                self.precip_data_points.append((x, y, i))
+            self.hover_points["precip"] = timestamps[:len(probabilities)].tolist()
             
-        if amounts:
-            rain_times = [timestamps[i] for i, amount in enumerate(amounts) if amount > 0 and i < len(probabilities)]
-            rain_amounts = [probabilities[i] for i, amount in enumerate(amounts) if amount > 0 and i < len(probabilities)]
-            if rain_times:
+        if len(amounts) and len(probabilities):
+            rainy = amounts > 0
+            rain_times = timestamps[rainy]
+            rain_amounts = probabilities[rainy]
+            if len(rain_times):
                 scatter = pg.ScatterPlotItem(
                     rain_times, 
                     rain_amounts, 
@@ -253,149 +273,50 @@ class WeatherChartWidget(QWidget):
                 )
                 self.precip_plot.addItem(scatter)
     
-    def _check_mouse_position(self):
-        """Verifică constant poziția mouse-ului și afișează/ascunde tooltip-ul."""
-        global_pos = QCursor.pos()
-        found_point = False
-        
-        if self.temp_plot.underMouse() and self.temp_data_points:
-            try:
-                local_pos = self.temp_plot.mapFromGlobal(global_pos)
-                
-                view_box = self.temp_plot.plotItem.vb
-                mouse_point = view_box.mapSceneToView(
-                    view_box.mapFromView(view_box.mapToView(local_pos))
-                )
-                
-                closest = self._find_closest_point(
-                    mouse_point.x(), 
-                    mouse_point.y(), 
-                    self.temp_data_points,
-                    threshold=3.5 
-                )
-                
-                if closest is not None:
-                    self._show_tooltip_for_index(closest, "temp", global_pos)
-                    found_point = True
-            except Exception as e:
-                try:
-                    view_range = self.temp_plot.plotItem.vb.viewRange()
-                    x_range = view_range[0]
-                    plot_width = self.temp_plot.width()
-                    
-                    x_ratio = local_pos.x() / plot_width
-                    approx_x = x_range[0] + (x_range[1] - x_range[0]) * x_ratio
-                    
-                    closest = self._find_closest_point_x_only(
-                        approx_x,
-                        self.temp_data_points,
-                        threshold=4.0
-                    )
-                    
-                    if closest is not None:
-                        self._show_tooltip_for_index(closest, "temp", global_pos)
-                        found_point = True
-                except:
-                    pass
-        
-        elif self.precip_plot.underMouse() and self.precip_data_points:
-            try:
-                local_pos = self.precip_plot.mapFromGlobal(global_pos)
-                
-                view_box = self.precip_plot.plotItem.vb
-                mouse_point = view_box.mapSceneToView(
-                    view_box.mapFromView(view_box.mapToView(local_pos))
-                )
-                
-                closest = self._find_closest_point(
-                    mouse_point.x(), 
-                    mouse_point.y(), 
-                    self.precip_data_points,
-                    threshold=4.5
-                )
-                
-                if closest is not None:
-                    self._show_tooltip_for_index(closest, "precip", global_pos)
-                    found_point = True
-            except Exception as e:
-                try:
-                    view_range = self.precip_plot.plotItem.vb.viewRange()
-                    x_range = view_range[0]
-                    plot_width = self.precip_plot.width()
-                    
-                    x_ratio = local_pos.x() / plot_width
-                    approx_x = x_range[0] + (x_range[1] - x_range[0]) * x_ratio
-                    
-                    closest = self._find_closest_point_x_only(
-                        approx_x,
-                        self.precip_data_points,
-                        threshold=5.0
-                    )
-                    
-                    if closest is not None:
-                        self._show_tooltip_for_index(closest, "precip", global_pos)
-                        found_point = True
-                except:
-                    pass
-        
-        if not found_point:
+    def _on_mouse_moved(self, plot_type: str, scene_pos: QPointF):
+        """Mișcarea mouse-ului peste un grafic: tooltip-ul punctului cel mai apropiat pe axa X."""
+        xs = self.hover_points[plot_type]
+        index = None
+        if xs:
+            mouse_x = self.plots[plot_type].plotItem.vb.mapSceneToView(scene_pos).x()
+            index = nearest_index(xs, mouse_x, HOVER_THRESHOLDS[plot_type])
+        
+        if index is None:
             self.hover_label.hide()
+        else:
+            self._show_tooltip_for_index(index, plot_type, QCursor.pos())
     
-    def _find_closest_point(self, mouse_x, mouse_y, data_points, threshold):
-        """Găsește cel mai apropiat punct de mouse folosind doar distanța pe axa X."""
-        if not data_points:
-            return None
-        
-        min_distance = float('inf')
-        closest_index = None
-        
-        for x, y, index in data_points:
-            distance = abs(x - mouse_x)
-            
-            if distance < min_distance and distance < threshold:
-                min_distance = distance
-                closest_index = index
-        
-        return closest_index
-    
-    def _find_closest_point_x_only(self, mouse_x, data_points, threshold):
-        """Metodă backup - găsește cel mai apropiat punct folosind doar coordonata X."""
-        if not data_points:
-            return None
-        
-        min_distance = float('inf')
-        closest_index = None
-        
-        for x, y, index in data_points:
-            distance = abs(x - mouse_x)
-            
-            if distance < min_distance and distance < threshold:
-                min_distance = distance
-                closest_index = index
-        
-        return closest_index
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Leave and watched in self.plots.values():
+            self.hover_label.hide()
+        return super().eventFilter(watched, event)
     
     def _show_tooltip_for_index(self, index, plot_type, global_pos):
         """Afișează tooltip-ul pentru un index dat."""
+        text = self._tooltips.get((plot_type, index))
+        if text is None:
+            text = self._tooltip_text(index, plot_type)
+            if text is None:
+                return
+            self._tooltips[(plot_type, index)] = text
+        self.hover_label.show_text(global_pos, text)
+    
+    def _tooltip_text(self, index, plot_type) -> Optional[str]:
+        """Textul HTML al tooltip-ului, formatat o singură dată pe punct (până la următoarele date)."""
         if not self.full_weather_data or not self.full_weather_data.get("hourly"):
-            return
+            return None
         
         hourly_data = self.full_weather_data["hourly"]
         if index >= len(hourly_data):
-            return
+            return None
         
         data = hourly_data[index]
         
         dt_str = data.get("datetime", "")
         try:
             dt = datetime.fromisoformat(dt_str)
-            days_ro = {
-                'Monday': 'Luni', 'Tuesday': 'Marți', 'Wednesday': 'Miercuri',
-                'Thursday': 'Joi', 'Friday': 'Vineri', 'Saturday': 'Sâmbătă', 'Sunday': 'Duminică'
-            }
-            day_name = days_ro.get(dt.strftime("%A"), dt.strftime("%A"))
-            ora_formatata = f"{day_name}, {dt.strftime('%H:00')}"
-        except:
+            ora_formatata = f"{DAY_NAMES[dt.weekday()]}, {dt.strftime('%H:00')}"
+        except (TypeError, ValueError):
             ora_formatata = "N/A"
         
         if plot_type == "temp":
@@ -403,30 +324,27 @@ class WeatherChartWidget(QWidget):
             cond = data.get("weather_description", "-")
             wind = data.get("wind_speed", 0)
             
-            text = (
+            return (
                 f"<div style='text-align: center;'>"
                 f"<b style='font-size: 13px;'>{ora_formatata}</b><br><br>"
                 f"<span style='font-size: 14px; color: #ff6666;'>🌡️ <b>{temp:.1f}{self.temp_unit}</b></span><br>"
                 f"☁️ {cond}<br>"
-                f"💨 {wind:.1f} km/h"
-                f"</div>"
-            )
-        
-        elif plot_type == "precip":
-            prob = data.get("precipitation_probability", 0)
-            amt = data.get("precipitation", 0)
-            wind = data.get("wind_speed", 0)
-            
-            text = (
-                f"<div style='text-align: center;'>"
-                f"<b style='font-size: 13px;'>{ora_formatata}</b><br><br>"
-                f"<span style='font-size: 14px; color: #66aaff;'>💧 <b>{prob:.0f}%</b></span><br>"
-                f"🌧️ {amt:.1f} mm<br>"
-                f"💨 {wind:.1f} km/h"
+                f"💨 {wind:.1f} {self.wind_unit}"
                 f"</div>"
             )
         
-        self.hover_label.show_text(global_pos, text)
+        prob = data.get("precipitation_probability", 0)
+        amt = data.get("precipitation", 0)
+        wind = data.get("wind_speed", 0)
+        
+        return (
+            f"<div style='text-align: center;'>"
+            f"<b style='font-size: 13px;'>{ora_formatata}</b><br><br>"
+            f"<span style='font-size: 14px; color: #66aaff;'>💧 <b>{prob:.0f}%</b></span><br>"
+            f"🌧️ {amt:.1f} mm<br>"
+            f"💨 {wind:.1f} {self.wind_unit}"
+            f"</div>"
+        )
     
     def _mark_schedule_intervals(self, schedule_entries: List[Dict], weather_data: Dict):
         if not weather_data or not weather_data.get("hourly"):
@@ -454,12 +372,14 @@ class WeatherChartWidget(QWidget):
                     plot.addItem(region)
             except Exception: continue
                 
-    def _update_statistics(self, temperatures: List[float], probabilities: List[float], amounts: List[float], data_processor, schedule_entries: List[Dict]):
-        if not temperatures:
+    def _update_statistics(self, temperatures: np.ndarray, probabilities: np.ndarray, amounts: np.ndarray, data_processor, schedule_entries: List[Dict],
+                           statistics: Optional[Dict] = None):
+        if not len(temperatures):
             self.stats_label.setText("Nu există suficiente date pentru statistici.")
             return
             
-        stats = data_processor.calculate_statistics(schedule_entries)
+        # statisticile deja calculate (memorate per versiune a orarului îmbinat) nu se recalculează
+        stats = statistics if statistics is not None else data_processor.calculate_statistics(schedule_entries)
         
         unit = stats['unit']
         avg_temp = stats['avg_temperature']
@@ -471,7 +391,7 @@ class WeatherChartWidget(QWidget):
         Temperatură medie: {avg_temp:.1f}{unit} | 
         Min: {min_temp:.1f}{unit} | 
         Max: {max_temp:.1f}{unit} | 
-        Risc maxim ploaie: {max(probabilities):.0f}% | 
+        Risc maxim ploaie: {float(np.max(probabilities)):.0f}% | 
         Total precipitații: {stats['total_precipitation']:.1f}mm | 
         Perioade cu risc ploaie: {stats['rainy_periods']}
         """
@@ -481,16 +401,10 @@ class WeatherChartWidget(QWidget):
     def clear_charts(self):
         self.temp_plot.clear()
         self.precip_plot.clear()
-        self.temp_data_points = []
-        self.precip_data_points = []
+        self.hover_points = {"temp": [], "precip": []}
+        self._tooltips.clear()
         self.hover_label.hide()
         self.stats_label.setText("Graficele vor fi actualizate după încărcarea datelor meteo.")
         
     def export_chart_images(self, temp_path: str, precip_path: str) -> bool:
         return True
-    
-    def closeEvent(self, event):
-        """Oprește timer-ul când widget-ul se închide."""
-        if hasattr(self, 'mouse_timer'):
-            self.mouse_timer.stop()
-        super().closeEvent(event)
\ No newline at end of file